@@ -5,6 +5,7 @@ import pygame  # For graphics and input handling
 import time  # For animation delays
 import copy
 import sys
+import threading
 sys.path.insert(0, '.')
 import data
 import screens
@@ -12,6 +13,15 @@ import savegame
 import os
 from constants import *
 from utils import draw_rounded_element, resource_path, create_dice_bag, wrap_text, get_easing
+from hand_table import classify_hand
+from scoring import CharmPipeline, ScoreSnapshot, score_hand
+from advisor import HoldAdvisor
+from odds import ClearOdds
+from rng import GameRNG
+from dice import Die, DiceBag, roll_faces
+from sprites import DieSpriteCache, BagLayer, CharmTileCache, ZoomPyramid
+from text_cache import TextCache
+from layout import GameLayout, BlindsLayout, ShopLayout
 
 from states.splash import SplashState
 from states.prompt import PromptState
@@ -32,8 +42,16 @@ RARITY_WEIGHTS = {
 
 # Game class to manage state and visuals
 class ChromaRollGame:
-    def __init__(self):
-        pygame.init()  # Initialize Pygame
+    def __init__(self, headless=False, seed=None):
+        """headless=True skips the window, fonts, images and audio so the rules run on their own (see simulate.py).
+        A headless game has no screen or state machine, never animates, and always plays without the DEBUG perks.
+        seed fixes every gameplay random stream (see rng.py), so the same seed and choices replay the same run.
+        """
+        self.headless = headless
+        self.debug = DEBUG and not headless  # Headless runs always play by the real rules
+        self.rng = GameRNG(seed)  # Bag, rolls, shop, boss and enhancement streams
+        if not headless:
+            pygame.init()  # Initialize Pygame
         self.loaded_from_save = False
         self.turn_initialized = False
         self.hovered_die = None  # Index of die under mouse, or None
@@ -41,6 +59,8 @@ class ChromaRollGame:
         self.hovered_bag_die = None
         self.hand_die_rects = []
         self.bag_die_rects = []
+        self.hover_targets = []  # (rect, hovered) checked by the last draw - see screens.hovering
+        self.tooltip_rects = []  # Where the last draw put tooltips
 
         # Dedup CHARMS_POOL by name (safeguard against old dups or mutations)
         unique_pool = {}
@@ -50,14 +70,59 @@ class ChromaRollGame:
         data.CHARMS_POOL = list(unique_pool.values())
         #  print("DEBUG: Deduped CHARMS_POOL to", len(data.CHARMS_POOL), "unique charms")  # Optional: Confirm (remove after test)
         
-        self.state_machine = StateMachine(self, SplashState(self))
+        if headless:
+            self.state_machine = None
+            self.screen = None
+            self.width, self.height = INITIAL_WIDTH, INITIAL_HEIGHT
+            self.roll_sound = self.break_sound = self.coin_sound = None  # play_sfx is a no-op
+        else:
+            self.state_machine = StateMachine(self, SplashState(self))
+            self.load_media()
+
+        self.current_boss_effect = None  # Current active boss effect dict, or None
+        self.disabled_charms = []  # For effects like Charm Glitch/Eclipse: list of indices or names
+        self.charm_pipeline = None  # Compiled charm scorers; rebuilt when equipped/disabled charms change
+        self.preview_cache = {}  # preview_key() -> get_hand_type_and_score result
+        self.score_version = 0  # Bumped when charm state the preview key can't see changes (permanent bonuses)
+        self.hold_advisor = None  # HoldAdvisor for the dice in hand (see get_hold_advice)
+        self.hold_advisor_key = None
+        self.clear_odds = None  # odds.ClearOdds for the current bag and loadout
+        self.clear_odds_key = None
+        self.clear_odds_results = {}  # (need, bag counts, hands left) -> (low, high), filled by the odds worker
+        self.clear_odds_worker = None  # Thread running the clear-odds DP, if any
+        self.boss_reroll_count = 0  # Track rerolls used for effects like Break Surge
+        self.boss_rainbow_color = None  # For Rainbow Restriction: fixed color for the round
+        self.boss_shuffled_faces = {}  # Die ID to shuffled faces for Face Shuffle
+        self.upcoming_boss_effect = None  # Preview of the Boss effect for the current round
+        self.upcoming_boss_effect = self.rng.boss.choice(data.BOSS_EFFECTS)  # Initial preview for first round
+
+        self.debug_boss_dropdown_open = False  # Flag for dropdown panel
+        self.debug_boss_scroll_offset = 0  # For scrolling long list
+        self.debug_boss_selected = None  # Temp for selection
+
+        self.is_last_hand = False         # For Final Forge
+        self.is_final_discard = False     # For Acrobat Amulet
+        self.used_reroll_advantage = False  # For Fate's Favor
+        self.rune_cast_used = False       # For Gambler's Grimoire
+
+        self._init_defaults()  # Call after one-time setups
+
+    def load_media(self):
+        """Opens the window and loads fonts, images and audio (skipped for headless games)."""
         self.screen = pygame.display.set_mode((INITIAL_WIDTH, INITIAL_HEIGHT), pygame.RESIZABLE)  # Resizable window
         self.width, self.height = self.screen.get_size()
         pygame.display.set_caption("Chroma Roll")  # Set title
         # Use imported THEME (raw paths) + resource_path for loading
-        self.font = pygame.font.Font(resource_path(THEME['font_main_path']), THEME['font_main_size'])  # Font for text
-        self.small_font = pygame.font.Font(resource_path(THEME['font_small_path']), THEME['font_small_size'])  # Smaller font for hand/modifier info
-        self.tiny_font = pygame.font.Font(resource_path(THEME['font_tiny_path']), THEME['font_tiny_size'])  # Even smaller for top texts
+        # Fonts render through one shared text cache, so repeated labels are blitted, not re-rasterized
+        self.text_cache = TextCache()
+        self.font = self.text_cache.font(pygame.font.Font(resource_path(THEME['font_main_path']), THEME['font_main_size']))  # Font for text
+        self.small_font = self.text_cache.font(pygame.font.Font(resource_path(THEME['font_small_path']), THEME['font_small_size']))  # Smaller font for hand/modifier info
+        self.tiny_font = self.text_cache.font(pygame.font.Font(resource_path(THEME['font_tiny_path']), THEME['font_tiny_size']))  # Even smaller for top texts
+        self.die_sprites = DieSpriteCache()  # Pre-rendered dice for screens.draw_dice / draw_bag_visual
+        self.bag_layer = BagLayer()  # The whole bag panel, redrawn only when the bag changes
+        self.charm_tiles = CharmTileCache()  # Finished charm dice (and disabled variants) for every charm screen
+        self.layout = self.blinds_layout = self.shop_layout = None
+        self.update_layouts()
 
         # Show loading text during heavy loads
         self.screen.fill(THEME['background'])
@@ -72,6 +137,7 @@ class ChromaRollGame:
             print(f"Error loading splash: {e}")
             self.splash_image = pygame.Surface((838, 1248))  # Fallback blank
             self.splash_image.fill((0, 0, 0))  # Black if missing
+        self.splash_pyramid = ZoomPyramid(self.splash_image)  # Mip levels for the splash zoom (screens.draw_splash_screen)
 
         # Pre-load other assets (icons, sounds, etc.) here as before
         # e.g., your charm pre-load loop, mixer.init(), Sound loads
@@ -192,39 +258,20 @@ class ChromaRollGame:
 
         self.mute_button_rect = pygame.Rect(self.width - 50, 10, 40, 40)  # Top-right; adjust as needed
 
-        self.current_boss_effect = None  # Current active boss effect dict, or None
-        self.disabled_charms = []  # For effects like Charm Glitch/Eclipse: list of indices or names
-        self.boss_reroll_count = 0  # Track rerolls used for effects like Break Surge
-        self.boss_rainbow_color = None  # For Rainbow Restriction: fixed color for the round
-        self.boss_shuffled_faces = {}  # Die ID to shuffled faces for Face Shuffle
-        self.upcoming_boss_effect = None  # Preview of the Boss effect for the current round
-        self.upcoming_boss_effect = random.choice(data.BOSS_EFFECTS)  # Initial preview for first round
-
-        self.debug_boss_dropdown_open = False  # Flag for dropdown panel
-        self.debug_boss_scroll_offset = 0  # For scrolling long list
-        self.debug_boss_selected = None  # Temp for selection
-
-        self.is_last_hand = False         # For Final Forge
-        self.is_final_discard = False     # For Acrobat Amulet
-        self.used_reroll_advantage = False  # For Fate's Favor
-        self.rune_cast_used = False       # For Gambler's Grimoire
-
-        self._init_defaults()  # Call after one-time setups
-
     def _init_defaults(self):
-        self.bag = create_dice_bag()  # Create dice bag (mutable list for removal)
+        self.bag = DiceBag(create_dice_bag())  # Dice left to draw this round (id-indexed, O(1) removal)
         self.hand = []  # Current hand of dice
-        self.full_bag = [d.copy() for d in self.bag]  # Template of all owned dice
+        self.full_bag = DiceBag(self.bag)  # All owned dice; bag, hand and rolls hold these same Die objects
         self.rolls = []  # Current rolls: list of (die, value)
         self.held = [False] * NUM_DICE_IN_HAND  # Track held dice
         self.discard_selected = [False] * NUM_DICE_IN_HAND  # Track selected for discard
-        self.rerolls_left = -1 if DEBUG and DEBUG_UNLIMITED_REROLLS else MAX_REROLLS  # Rerolls per turn (-1 for unlimited in debug)
+        self.rerolls_left = -1 if self.debug and DEBUG_UNLIMITED_REROLLS else MAX_REROLLS  # Rerolls per turn (-1 for unlimited in debug)
         self.discards_left = MAX_DISCARDS  # Discards per round
         self.discard_used_this_round = False  # Track if discard was used in the current hand's discard phase
         self.hands_left = MAX_HANDS  # Hands (scores) per round
         self.coins = 0  # Chroma Coins for upgrades
         self.extra_coins = 0  # For tracking bonus coins from gold and silver dice
-        if DEBUG and DEBUG_INFINITE_COINS:
+        if self.debug and DEBUG_INFINITE_COINS:
             self.coins = 999999  # Infinite coins for debug (large value to simulate infinity without breaking int ops)
         self.round_score = 0  # Score for current blind/round
         self.current_stake = 1  # Current stake level
@@ -259,7 +306,7 @@ class ChromaRollGame:
         self.pack_choices = []  # Choices for pack selection
         self.confirm_sell_index = -1  # Index of charm to confirm sell
         self.shop_reroll_cost = 5  # Initial reroll cost for shop
-        self.available_packs = random.sample([0, 1, 2, 3, 4], 2)  # Random 2 from 5 packs
+        self.available_packs = self.rng.shop.sample([0, 1, 2, 3, 4], 2)  # Random 2 from 5 packs
         self.available_rune_packs = []
         self.multipliers_hover = False  # For showing multipliers panel
         self.current_pouch = None
@@ -280,7 +327,7 @@ class ChromaRollGame:
         self.tutorial_mode = False  # Flag if in tutorial
         self.tutorial_completed = False  # Track if finished (for future skips/unlocks)
         pouches = data.POUCHES
-        if DEBUG:
+        if self.debug:
             for pouch in pouches[4:]:  # Indices 4-7 for 5-8
                 pouch['unlocked'] = True
         self.selected_pouch = None  # Track chosen pouch for bonuses
@@ -289,11 +336,20 @@ class ChromaRollGame:
         self.unlocks = {}  # Future: Track unlocks, e.g., self.unlocks['Black Pouch'] = False; for now, use pouch['unlocked']
         self.current_boss_effect = None  # Current active boss effect dict, or None
         self.disabled_charms = []  # For effects like Charm Glitch/Eclipse: list of indices or names
+        self.charm_pipeline = None  # Compiled charm scorers; rebuilt when equipped/disabled charms change
+        self.preview_cache = {}  # preview_key() -> get_hand_type_and_score result
+        self.score_version = 0  # Bumped when charm state the preview key can't see changes (permanent bonuses)
+        self.hold_advisor = None  # HoldAdvisor for the dice in hand (see get_hold_advice)
+        self.hold_advisor_key = None
+        self.clear_odds = None  # odds.ClearOdds for the current bag and loadout
+        self.clear_odds_key = None
+        self.clear_odds_results = {}  # (need, bag counts, hands left) -> (low, high), filled by the odds worker
+        self.clear_odds_worker = None  # Thread running the clear-odds DP, if any
         self.boss_reroll_count = 0  # Track rerolls used for effects like Break Surge
         self.boss_rainbow_color = None  # For Rainbow Restriction: fixed color for the round
         self.boss_shuffled_faces = {}  # Die ID to shuffled faces for Face Shuffle
         self.upcoming_boss_effect = None  # Preview of the Boss effect for the current round
-        self.upcoming_boss_effect = random.choice(data.BOSS_EFFECTS)  # Initial preview for first round
+        self.upcoming_boss_effect = self.rng.boss.choice(data.BOSS_EFFECTS)  # Initial preview for first round
         self.debug_boss_dropdown_open = False  # Flag for dropdown panel
         self.debug_boss_scroll_offset = 0  # For scrolling long list
         self.debug_boss_selected = None  # Temp for selection
@@ -312,6 +368,44 @@ class ChromaRollGame:
     
 
 
+    def play_sfx(self, sound):
+        if not self.headless:
+            self.sfx_channel.play(sound)
+
+    def animate_roll(self, step, on_done):
+        """Runs the roll animation (step cycles random faces every ANIMATION_DELAY, ANIMATION_FRAMES times) on the
+        state machine's scheduler, then on_done makes the real roll. Input keeps flowing meanwhile - GameState
+        fast-forwards it on any click or key - and headless games roll at once.
+        """
+        if self.headless:
+            on_done()
+            return
+        self.state_machine.scheduler.finish('roll')  # Never two rolls at once
+        self.state_machine.scheduler.repeat(ANIMATION_DELAY, ANIMATION_FRAMES, step, on_done, tag='roll')
+
+    def start_break_effect(self, index):
+        """Shows the break overlay on hand slot index; a scheduler timer clears it after break_effect_duration."""
+        self.broken_dice.append(index)
+        self.break_effect_start = time.time()
+        if self.state_machine:
+            self.state_machine.scheduler.cancel('break')  # Restart the fade for the newest break
+            self.state_machine.scheduler.after(self.break_effect_duration, self.clear_break_effect, tag='break')
+
+    def clear_break_effect(self):
+        self.broken_dice = []
+        self.break_effect_start = 0
+
+    def show_temp_message(self, text):
+        """Shows a fading message; a scheduler timer clears it after temp_message_duration."""
+        self.temp_message = text
+        self.temp_message_start = time.time()
+        if self.state_machine:
+            self.state_machine.scheduler.cancel('temp_message')
+            self.state_machine.scheduler.after(self.temp_message_duration, self.clear_temp_message, tag='temp_message')
+
+    def clear_temp_message(self):
+        self.temp_message = None
+
     def toggle_mute(self):
         self.mute = not self.mute
         # Apply to SFX (scale your original volumes)
@@ -337,14 +431,12 @@ class ChromaRollGame:
             return  # Exit early, no draw
         
         if len(self.bag) < num_dice:
-            full_refill = [copy.deepcopy(d) for d in self.full_bag]
             if self.current_blind == 'Boss' and self.current_boss_effect and self.current_boss_effect['name'] == 'Bag Bottleneck':
-                random.shuffle(full_refill)
-                self.bag[:] = full_refill[:len(full_refill)//2]  # Half full
+                self.bag.refill(self.full_bag, self.rng.bag, len(self.full_bag) // 2)  # Half full
             else:
-                self.bag[:] = full_refill
+                self.bag.refill(self.full_bag)
         
-        if DEBUG and DEBUG_FORCE_BAG_COLORS:
+        if self.debug and DEBUG_FORCE_BAG_COLORS:
             # Default to empty if not defined (e.g., commented out)
             debug_colors = globals().get('DEBUG_COLORS', [])  # Safely get global if commented
             if debug_colors:  # Only force if non-empty list
@@ -353,12 +445,12 @@ class ChromaRollGame:
                 for color in debug_colors:
                     available = [d for d in self.bag if d['color'] == color]
                     if available:
-                        selected = random.choice(available)
+                        selected = self.rng.bag.choice(available)
                         hand.append(copy.deepcopy(selected))  # Deepcopy to avoid mutating original bag dice
                     else:
                         # New: If no dice of this color (e.g., Glass for testing), create temp one
                         temp_id = f"Temp{color}{len(hand) + 1}"
-                        temp_die = {'id': temp_id, 'color': color, 'faces': DICE_FACES[:], 'is_temp': True}  # Flag as temp (optional: skip in saves)
+                        temp_die = Die(temp_id, color, is_temp=True)  # Flag as temp (optional: skip in saves)
                         hand.append(temp_die)  # Add temp without modifying bag
                 #  print(f"DEBUG: Forced hand colors: {[d['color'] for d in hand]}")  # Log for insight (remove if noisy)
                 return hand[:num_dice]  # Ensure exactly num_dice (trim if extra)
@@ -368,11 +460,7 @@ class ChromaRollGame:
             pass  # No additional logic needed here; continue to normal draw below
         
         # Normal draw (or DEBUG fallback)
-        actual_num = min(num_dice, len(self.bag))
-        hand = random.sample(self.bag, actual_num)
-        for die in hand:
-            self.bag.remove(die)  # Remove drawn dice from bag
-        return hand
+        return self.bag.draw(self.rng.bag, num_dice)  # Drawn dice leave the bag
     
     def get_blind_target(self, blind_type=None):
         """Calculates the target score for the specified or current blind, scaled by stake and boss effects if applicable."""
@@ -419,21 +507,21 @@ class ChromaRollGame:
 
         # Generate preview if starting Small
         if self.current_blind == 'Small':
-            self.upcoming_boss_effect = random.choice(data.BOSS_EFFECTS)  # Pre-generate for preview
+            self.upcoming_boss_effect = self.rng.boss.choice(data.BOSS_EFFECTS)  # Pre-generate for preview
 
         if self.current_blind == 'Boss':
-            self.current_boss_effect = self.upcoming_boss_effect or random.choice(data.BOSS_EFFECTS)  # Use preview if set
+            self.current_boss_effect = self.upcoming_boss_effect or self.rng.boss.choice(data.BOSS_EFFECTS)  # Use preview if set
             if self.current_boss_effect['name'] == 'Charm Glitch' and self.equipped_charms:
-                self.disabled_charms = [random.randint(0, len(self.equipped_charms) - 1)]  # Disable one
+                self.disabled_charms = [self.rng.boss.randint(0, len(self.equipped_charms) - 1)]  # Disable one
             elif self.current_boss_effect['name'] == 'Charm Eclipse':
                 self.disabled_charms = list(range(len(self.equipped_charms)))  # Disable all
             elif self.current_boss_effect['name'] == 'Rainbow Restriction':
-                self.boss_rainbow_color = random.choice(BASE_COLORS)
+                self.boss_rainbow_color = self.rng.boss.choice(BASE_COLORS)
             elif self.current_boss_effect['name'] == 'Face Shuffle':
                 for die in self.full_bag:
                     faces = DICE_FACES[:]
-                    random.shuffle(faces)  # Simple shuffle; could add duplicates/missing for more chaos
-                    self.boss_shuffled_faces[die['id']] = faces
+                    self.rng.boss.shuffle(faces)  # Simple shuffle; could add duplicates/missing for more chaos
+                    self.boss_shuffled_faces[die['id']] = tuple(faces)
             elif self.current_boss_effect['name'] == 'Charm Tax':
                 tax = len(self.equipped_charms) // 2  # 0.5 per, rounded down
                 self.hands_left = max(0, self.hands_left - tax)
@@ -452,7 +540,7 @@ class ChromaRollGame:
         self.discards_left = MAX_DISCARDS
         self.extra_coins = 0
         self.turn_initialized = False  # Reset for new round/turn
-        self.bag[:] = [copy.deepcopy(d) for d in self.full_bag]  # Refill bag from owned template
+        self.bag.refill(self.full_bag)  # Refill bag with the owned dice
         if self.current_boss_effect and self.current_boss_effect['name'] == 'Charm Eclipse':
             self.disabled_charms = list(range(len(self.equipped_charms)))  # Ensure all current charms disabled
         
@@ -484,7 +572,7 @@ class ChromaRollGame:
         self.rolls = [(die, 1) for die in self.hand]  # Start with value 1 (single pip)
         self.held = [False] * NUM_DICE_IN_HAND
         self.discard_selected = [False] * NUM_DICE_IN_HAND
-        self.rerolls_left = MAX_REROLLS if not DEBUG else -1  # Reset to unlimited in debug
+        self.rerolls_left = MAX_REROLLS if not self.debug else -1  # Reset to unlimited in debug
         self.rerolls_left_initial = self.rerolls_left
         self.confirmed_hands_this_round = 0
         self.lucky_triggers = 0  # Reset to 0 each new turn/hand
@@ -494,10 +582,9 @@ class ChromaRollGame:
         self.has_rolled = False  # No initial roll yet
         self.update_hand_text()  # Update initial hand text
         # In new_turn():
-        if not game.turn_initialized:
+        if not self.turn_initialized:
             # ... (existing turn setup)
-            game.apply_boss_face_shuffle()
-            game.turn_initialized = True
+            self.turn_initialized = True
         # Add after setting self.rerolls_left, etc.
         if self.current_blind == 'Boss' and self.current_boss_effect:
             effect_name = self.current_boss_effect['name']
@@ -510,13 +597,13 @@ class ChromaRollGame:
 
     def roll_hand(self):
         """Rolls each die in the hand, returning list of (die, value)."""
-        return [(die, random.choice(die['faces'])) for die in self.hand]
+        return list(zip(self.hand, roll_faces([self.faces_of(die) for die in self.hand], self.rng.rolls)))  # One draw for the hand
 
     def reroll(self):
         """Rerolls non-held dice with animation if rerolls left, else scores and new turn."""
         if self.is_discard_phase:
             return  # Can't reroll during discard phase
-        if self.rerolls_left > 0 or DEBUG:  # Always allow reroll in debug
+        if self.rerolls_left > 0 or self.debug:  # Always allow reroll in debug
             if self.current_blind == 'Boss' and self.current_boss_effect:
                 effect_name = self.current_boss_effect['name']
                 if effect_name == 'Reroll Penalty' and self.coins > 0:
@@ -524,12 +611,12 @@ class ChromaRollGame:
                 elif effect_name == 'Reroll Rebound':
                     held_indices = [i for i in range(len(self.held)) if self.held[i]]
                     if held_indices:
-                        unhold_i = random.choice(held_indices)
+                        unhold_i = self.rng.boss.choice(held_indices)
                         self.held[unhold_i] = False
                 elif effect_name == 'Die Drain':
                     # Remove one random die and replace with a new draw if bag has dice
                     if len(self.rolls) > 1:  # Use self.rolls for check (active hand)
-                        drain_i = random.randint(0, len(self.rolls) - 1)
+                        drain_i = self.rng.boss.randint(0, len(self.rolls) - 1)
                         drained_die = self.rolls[drain_i][0]  # Get die to return to bag
                         del self.rolls[drain_i]
                         del self.held[drain_i]
@@ -537,9 +624,8 @@ class ChromaRollGame:
 
                         # Replace with new draw if bag not empty
                         if self.bag:
-                            new_die = random.choice(self.bag)
-                            self.bag.remove(new_die)
-                            new_value = random.choice(new_die['faces'])
+                            new_die, = self.bag.draw(self.rng.bag)
+                            new_value, = roll_faces([self.faces_of(new_die)], self.rng.rolls)
                             self.rolls.append((new_die, new_value))
                             self.held.append(False)  # New not held
                             self.discard_selected.append(False)  # Sync
@@ -548,56 +634,49 @@ class ChromaRollGame:
                         self.bag.append(drained_die)
                 elif effect_name == 'Hold Ban':
                     if any(self.held):  # Check if any held
-                        self.temp_message = "Hold Ban: Cannot hold for reroll - unhold all to proceed"
-                        self.temp_message_start = time.time()
+                        self.show_temp_message("Hold Ban: Cannot hold for reroll - unhold all to proceed")
                         return  # Skip reroll, no auto-unhold/reroll
                 elif effect_name == 'Hold Limit':
                     held_count = sum(self.held)
                     if held_count > 3:
-                        self.temp_message = "Hold Limit: Max 3 holds for reroll - unhold some to proceed"
-                        self.temp_message_start = time.time()
+                        self.show_temp_message("Hold Limit: Max 3 holds for reroll - unhold some to proceed")
                         return  # Skip reroll, no auto-unhold
                 elif effect_name == 'Hold Hazard':
                     for i in range(len(self.held)):
-                        if self.held[i] and random.random() < 0.20:
+                        if self.held[i] and self.rng.boss.random() < 0.20:
                             self.held[i] = False  # Force reroll
                 
             # Animate cycling for non-held dice
             # Play roll sound here (at start of reroll)
-            self.sfx_channel.play(self.roll_sound)
-            for frame in range(ANIMATION_FRAMES):
-                for i in range(len(self.rolls)):
-                    if not self.held[i]:
-                        die_temp = self.rolls[i][0]  # Temp var for the die
-                        faces = self.boss_shuffled_faces.get(die_temp['id'], die_temp['faces']) if self.current_blind == 'Boss' and self.current_boss_effect and self.current_boss_effect['name'] == 'Face Shuffle' else die_temp['faces']
-                        self.rolls[i] = (die_temp, random.choice(faces))
-                self.screen.fill(THEME['background'])  # Clear screen
-                screens.draw_game_screen(self)
-                pygame.display.flip()  # Update screen during animation
-                time.sleep(ANIMATION_DELAY)
-            
-            # Final actual roll (the last frame is the real one)
-            for i in range(len(self.rolls)):
-                if not self.held[i]:
-                    die = self.rolls[i][0]
-                    faces = self.boss_shuffled_faces.get(die['id'], die['faces']) if self.current_blind == 'Boss' and self.current_boss_effect and self.current_boss_effect['name'] == 'Face Shuffle' else die['faces']
-                    self.rolls[i] = (die, random.choice(faces))
-            
-            if not DEBUG:
+            self.play_sfx(self.roll_sound)
+            rerolled = [i for i in range(len(self.rolls)) if not self.held[i]]
+            if not self.debug:
                 self.rerolls_left -= 1
-            self.update_hand_text()  # Update after reroll
             self.boss_reroll_count += 1  # Track for Break Surge
+
+            def cycle_faces():
+                for i in rerolled:
+                    die_temp = self.rolls[i][0]  # Temp var for the die
+                    self.rolls[i] = (die_temp, random.choice(self.faces_of(die_temp)))
+
+            def final_roll():  # The last frame is the real one
+                face_lists = [self.faces_of(self.rolls[i][0]) for i in rerolled]
+                for i, value in zip(rerolled, roll_faces(face_lists, self.rng.rolls)):  # One draw for every unheld die
+                    self.rolls[i] = (self.rolls[i][0], value)
+                self.update_hand_text()  # Update after reroll
+
+            self.animate_roll(cycle_faces, final_roll)
         else:
             # Score and advance hand or end round
-            score = self.calculate_score()
+            score = self.commit_hand_score().final_score
             self.round_score += score
             # Accumulate extra coins from Gold/Silver
             for i, (die, _) in enumerate(self.rolls):
                 if die['color'] == 'Gold' and self.held[i]:
-                    self.sfx_channel.play(self.coin_sound)  # Play per coin gain
+                    self.play_sfx(self.coin_sound)  # Play per coin gain
                     self.extra_coins += 1
                 elif die['color'] == 'Silver' and not self.held[i]:
-                    self.sfx_channel.play(self.coin_sound)  # Play per coin gain
+                    self.play_sfx(self.coin_sound)  # Play per coin gain
                     self.extra_coins += 1
             # Add extra coin bonuses from charms
             for charm in self.equipped_charms:
@@ -628,15 +707,15 @@ class ChromaRollGame:
 
             # Handle Glass break chance (only for held Glass)
             for i, (die, _) in enumerate(self.rolls):
-                if die['color'] == 'Glass' and self.held[i] and random.random() < glass_break_chance:
+                if die['color'] == 'Glass' and self.held[i] and self.rng.enhancements.random() < glass_break_chance:
                     # Break: Remove from full_bag and bag
-                    self.break_sound = pygame.mixer.Sound(resource_path('assets/audio/break.wav'))
-                    self.break_sound.set_volume(0.7)  # Louder for impact
-                    self.full_bag = [d for d in self.full_bag if d['id'] != die['id']]
-                    self.bag = [d for d in self.bag if d['id'] != die['id']]
+                    if not self.headless:
+                        self.break_sound = pygame.mixer.Sound(resource_path('assets/audio/break.wav'))
+                        self.break_sound.set_volume(0.7)  # Louder for impact
+                    self.full_bag.remove_id(die['id'])
+                    self.bag.remove_id(die['id'])
                     self.coins -= glass_break_penalty
-                    self.broken_dice.append(i)  # Add index for animation
-                    self.break_effect_start = time.time()  # Start timer
+                    self.start_break_effect(i)  # Overlay on slot i, cleared by a scheduler timer
             
             # Retrigger if Mime (add here)
             if has_mime:
@@ -651,15 +730,15 @@ class ChromaRollGame:
 
                 # Retrigger Glass break for held
                 for i, (die, _) in enumerate(self.rolls):
-                    if die['color'] == 'Glass' and self.held[i] and random.random() < glass_break_chance:
+                    if die['color'] == 'Glass' and self.held[i] and self.rng.enhancements.random() < glass_break_chance:
                         # Break again
-                        self.break_sound = pygame.mixer.Sound(resource_path('assets/audio/break.wav'))
-                        self.break_sound.set_volume(0.7)  # Louder for impact
-                        self.full_bag = [d for d in self.full_bag if d['id'] != die['id']]
-                        self.bag = [d for d in self.bag if d['id'] != die['id']]
+                        if not self.headless:
+                            self.break_sound = pygame.mixer.Sound(resource_path('assets/audio/break.wav'))
+                            self.break_sound.set_volume(0.7)  # Louder for impact
+                        self.full_bag.remove_id(die['id'])
+                        self.bag.remove_id(die['id'])
                         self.coins -= glass_break_penalty
-                        self.broken_dice.append(i)  # Add index for animation
-                        self.break_effect_start = time.time()  # Start timer
+                        self.start_break_effect(i)  # Overlay on slot i, cleared by a scheduler timer
 
             self.hands_left -= 1
             if self.round_score >= self.get_blind_target():
@@ -676,7 +755,7 @@ class ChromaRollGame:
                     discards_dollars = '$' * self.discards_left  # Visual for *1
                     interest_dollars = ''  # No interest
                 else:
-                    remains_coins = self.hands_left + self.discards_left if not DEBUG else 0
+                    remains_coins = self.hands_left + self.discards_left if not self.debug else 0
                     interest = min(self.coins, dynamic_interest_max) // INTEREST_RATE
                     hands_dollars = '$' * self.hands_left
                     discards_dollars = '$' * self.discards_left
@@ -713,8 +792,7 @@ class ChromaRollGame:
                 if effect_name == 'Discard Cap':
                     selected_count = sum(self.discard_selected)
                     if selected_count > 2:
-                        self.temp_message = "Discard Cap: Max 2 dice per discard - deselect some to proceed"
-                        self.temp_message_start = time.time()
+                        self.show_temp_message("Discard Cap: Max 2 dice per discard - deselect some to proceed")
                         return  # Skip discard
             # Then normal
             # Draw new dice
@@ -749,46 +827,36 @@ class ChromaRollGame:
             self.is_discard_phase = True  # Enable after first roll? Wait, start_roll exits discard, so for delay, perhaps flag to skip initial but allow post-first.
         # Note: For Discard Delay, in new_turn set is_discard_phase=False, then here after first roll (has_rolled=True), set to True if not used yet? Needs tweak.
         # Play sound at animation start
-        self.sfx_channel.play(self.roll_sound)
-        # Animate rolling for all dice
-        for frame in range(ANIMATION_FRAMES):
-            self.rolls = [(die, random.choice(die['faces'])) for die in self.hand]
-            self.screen.fill(THEME['background'])  # Clear screen
-            screens.draw_game_screen(self)
-            pygame.display.flip()  # Update screen during animation
-            time.sleep(ANIMATION_DELAY)
-        # Final roll
-        self.apply_boss_face_shuffle()  # Ensure shuffle before rolling
-        self.rolls = self.roll_hand()
+        self.play_sfx(self.roll_sound)
         self.discard_selected = [False] * NUM_DICE_IN_HAND  # Clear selections
-        self.update_hand_text()
+
+        def cycle_faces():  # Animate rolling for all dice
+            self.rolls = [(die, random.choice(self.faces_of(die))) for die in self.hand]
+
+        def final_roll():
+            self.rolls = self.roll_hand()
+            self.update_hand_text()
+
+        self.animate_roll(cycle_faces, final_roll)
 
     def score_and_new_turn(self):
         """Manually scores and starts a new turn."""
-        hand_type, base_score, modifier_desc, final_score, charm_chips, charm_mono_add = self.get_hand_type_and_score(is_preview=False)
         if self.show_popup:
             return  # Block actions during popup
+        hand_type, base_score, modifier_desc, final_score, charm_chips, charm_mono_add = self.commit_hand_score()
         
         # Apply Hiker Hex per-die bonus if equipped and not disabled
         held_rolls = [(die, value) for i, (die, value) in enumerate(self.rolls) if self.held[i]]
         for idx, charm in enumerate(self.equipped_charms):
             if charm['type'] == 'die_bonus_perm' and idx not in self.disabled_charms:
-                print("Hiker Hex: Applying +4 to", len(held_rolls), "dice")
+                #  print("Hiker Hex: Applying +4 to", len(held_rolls), "dice")
                 for die, _ in held_rolls:
-                    die_id = die.get('id')
-                    if die_id is None:
-                        print("Warning: Die missing 'id'")  # If no 'id', add unique IDs to all dice in init
-                    for bag_die in self.full_bag:
-                        if bag_die.get('id') == die_id:
-                            current_bonus = bag_die.get('score_bonus', 0)
-                            bag_die['score_bonus'] = current_bonus + charm['value']
-                            print(f"Updated bag die {die_id}: now {bag_die['score_bonus']}")
-                            break  # No need to loop further
+                    die['score_bonus'] = die.get('score_bonus', 0) + charm['value']  # The owned die, so every view sees it
                 break
 
         # score = self.calculate_score() # Old: Calculate score again
         score = final_score  # Use pre-calculated final score
-        print("Computed score:", score, "(base:", base_score, "chips:", charm_chips, "modifier:", 1 + charm_mono_add)  # Add this debug to see components
+        #  print("Computed score:", score, "(base:", base_score, "chips:", charm_chips, "modifier:", 1 + charm_mono_add)  # Add this debug to see components
         self.round_score += score
 
         # Apply Square Sphere permanent bonus on charm if equipped, not disabled, and exactly 4 dice scored
@@ -796,13 +864,13 @@ class ChromaRollGame:
             if charm['name'] == 'Square Sphere' and idx not in self.disabled_charms:
                 if len(held_rolls) == 4:
                     charm['permanent_bonus'] = charm.get('permanent_bonus', 0) + charm['value']
-                    print("Square Sphere charm bonus applied (4 dice): now", charm['permanent_bonus'])  # Debug
+                    #  print("Square Sphere charm bonus applied (4 dice): now", charm['permanent_bonus'])  # Debug
                 break
 
         for idx, charm in enumerate(self.equipped_charms):
             if charm['type'] == 'score_conditional' and idx not in self.disabled_charms:
                 self.permanent_score_bonus = getattr(self, 'permanent_score_bonus', 0) + charm['value']
-                print("Square Sphere permanent bonus applied: now", self.permanent_score_bonus)  # Debug, remove later
+                #  print("Square Sphere permanent bonus applied: now", self.permanent_score_bonus)  # Debug, remove later
                 break
 
         # Apply Lucky Labyrinth permanent bonus on charm if equipped and triggers >0
@@ -811,11 +879,12 @@ class ChromaRollGame:
                 triggers = self.lucky_triggers
                 if triggers > 0:
                     charm['permanent_bonus'] = charm.get('permanent_bonus', 0.0) + (charm['value'] * triggers)
-                    print("Lucky Labyrinth permanent bonus applied:", charm['permanent_bonus'])  # Debug, remove later
+                    #  print("Lucky Labyrinth permanent bonus applied:", charm['permanent_bonus'])  # Debug, remove later
                 break
+        self.invalidate_score_preview()  # Charm bonuses above changed in place
 
         for _ in range(self.lucky_triggers):
-            self.sfx_channel.play(self.coin_sound)  # Play per coin
+            self.play_sfx(self.coin_sound)  # Play per coin
 
         # Track hand play counts and streak
         if hand_type != "Nothing":
@@ -830,10 +899,10 @@ class ChromaRollGame:
         # Accumulate extra coins from Gold/Silver
         for i, (die, _) in enumerate(self.rolls):
             if die['color'] == 'Gold' and self.held[i]:
-                self.sfx_channel.play(self.coin_sound)  # Play per coin gain
+                self.play_sfx(self.coin_sound)  # Play per coin gain
                 self.extra_coins += 1
             elif die['color'] == 'Silver' and not self.held[i]:
-                self.sfx_channel.play(self.coin_sound)  # Play per coin gain
+                self.play_sfx(self.coin_sound)  # Play per coin gain
                 self.extra_coins += 1
         # Add extra coin bonuses from charms
         for charm in self.equipped_charms:
@@ -853,13 +922,12 @@ class ChromaRollGame:
 
         # Handle Glass break chance (only for held Glass)
         for i, (die, _) in enumerate(self.rolls):
-            if die['color'] == 'Glass' and self.held[i] and random.random() < glass_break_chance:
-                self.sfx_channel.play(self.break_sound)
-                self.full_bag = [d for d in self.full_bag if d['id'] != die['id']]
-                self.bag = [d for d in self.bag if d['id'] != die['id']]
+            if die['color'] == 'Glass' and self.held[i] and self.rng.enhancements.random() < glass_break_chance:
+                self.play_sfx(self.break_sound)
+                self.full_bag.remove_id(die['id'])
+                self.bag.remove_id(die['id'])
                 self.coins -= glass_break_penalty
-                self.broken_dice.append(i)
-                self.break_effect_start = time.time()
+                self.start_break_effect(i)  # Overlay on slot i, cleared by a scheduler timer
 
         # Add Mime here
         has_mime = any(c['type'] == 'retrigger_held' for c in self.equipped_charms)
@@ -874,13 +942,12 @@ class ChromaRollGame:
             score *= (4 ** glass_count)
 
             for i, (die, _) in enumerate(self.rolls):
-                if die['color'] == 'Glass' and self.held[i] and random.random() < glass_break_chance:
-                    self.sfx_channel.play(self.break_sound)
-                    self.full_bag = [d for d in self.full_bag if d['id'] != die['id']]
-                    self.bag = [d for d in self.bag if d['id'] != die['id']]
+                if die['color'] == 'Glass' and self.held[i] and self.rng.enhancements.random() < glass_break_chance:
+                    self.play_sfx(self.break_sound)
+                    self.full_bag.remove_id(die['id'])
+                    self.bag.remove_id(die['id'])
                     self.coins -= glass_break_penalty
-                    self.broken_dice.append(i)
-                    self.break_effect_start = time.time()
+                    self.start_break_effect(i)  # Overlay on slot i, cleared by a scheduler timer
 
         if self.round_score >= self.get_blind_target():
             self.stake_milestones = getattr(self, 'stake_milestones', 0) + 1  # Increment on blind win
@@ -946,7 +1013,10 @@ class ChromaRollGame:
             self.new_turn()  # Next hand in round
         else:
             # Game over - transition to state
-            self.state_machine.change_state(GameOverState(self))
+            if self.headless:
+                self.game_state = 'game_over'
+            else:
+                self.state_machine.change_state(GameOverState(self))
 
     def toggle_hold(self, index):
         """Toggles hold state for a die."""
@@ -963,515 +1033,161 @@ class ChromaRollGame:
         self.held[index] = not self.held[index]
         self.update_hand_text()
 
+    def get_charm_pipeline(self):
+        """Returns the compiled charm pipeline, rebuilding it when the equipped/disabled charms change."""
+        if self.charm_pipeline is None or not self.charm_pipeline.matches(self.equipped_charms, self.disabled_charms):
+            self.charm_pipeline = CharmPipeline(self.equipped_charms, self.disabled_charms)
+        return self.charm_pipeline
+
+    def invalidate_score_preview(self):
+        """Call after mutating charm state in place (e.g. permanent_bonus) so cached previews aren't reused."""
+        self.score_version += 1
+        self.preview_cache.clear()
+
+    def reset_score_caches(self):
+        """Drops every cache built from the old run (charm pipeline, score previews, hold advisor, clear odds).
+        For reset_game and savegame.load_game, which swap in a new loadout and bag wholesale.
+        """
+        self.charm_pipeline = None
+        self.invalidate_score_preview()
+        self.hold_advisor = self.hold_advisor_key = None
+        self.clear_odds = self.clear_odds_key = None
+        self.clear_odds_results = {}
+
+    def preview_key(self):
+        """Everything a preview score depends on: held dice, loadout, boss and counters."""
+        held_dice = tuple((die['color'], value, tuple(die.get('enhancements', ())), die.get('score_bonus', 0))
+                          for (die, value), is_held in zip(self.rolls, self.held) if is_held)
+        boss_name = self.current_boss_effect['name'] if self.current_blind == 'Boss' and self.current_boss_effect else None
+        return (held_dice, self.get_charm_pipeline().signature, self.score_version, boss_name, self.boss_rainbow_color,
+                tuple(self.hand_multipliers.values()), self.coins, self.score_mult, self.max_charms, self.avoid_streak,
+                len(self.full_bag), getattr(self, 'stake_milestones', 0), getattr(self, 'discards_used_this_round', 0),
+                self.rerolls_left == getattr(self, 'rerolls_left_initial', None))
+
     def get_hand_type_and_score(self, is_preview=True):
         """Determines the hand type, base score, modifier, and final score.
-        is_preview: If True, compute without side effects (for UI previews).
+        is_preview: If True, compute without side effects (for UI previews); previews are memoized.
+        With is_preview=False this is commit_hand_score (rolls Lucky/Fragile and applies the effects).
         """
-        
-        held_rolls = [(die, value) for i, (die, value) in enumerate(self.rolls) if self.held[i]]
-        if not held_rolls:
-            return "Nothing", 0, "None", 0, 0, 0.0
-        values = [value for die, value in held_rolls]
-        colors_list = [die['color'] for die, value in held_rolls]
-        sorted_values = sorted(values)
-        counts = {i: values.count(i) for i in set(values)}
-        max_count = max(counts.values()) if counts else 0
-        pair_count = list(counts.values()).count(2)
-
-        # Group dice by value for color checks: {value: [colors]}
-        groups = {}
-        for (die, val) in held_rolls:
-            if val not in groups:
-                groups[val] = []
-            groups[val].append(die['color'])
-
-        hand_type = "Nothing"
-        base_score = 0
-        base_modifier = 0.0
-        modifier_desc = []  # List to collect descriptions, join later
-
-        straights = [[1,2,3,4], [2,3,4,5], [3,4,5,6]]
-        short_straights_small = [[1,2,3], [2,3,4], [3,4,5], [4,5,6]]
-        short_straights_large = [[1,2,3,4], [2,3,4,5], [3,4,5,6]]
-
-        has_four_fingers = any(c['type'] == 'short_straight' for c in self.equipped_charms if self.equipped_charms.index(c) not in self.disabled_charms)
-
-        if self.current_blind == 'Boss' and self.current_boss_effect and self.current_boss_effect['name'] == 'Value Vault':
-            values = [7 - v for v in values]
-            sorted_values = sorted(values)
-
-        # Collect wild faces with safety check
-        wild_faces = set()
-        for charm in self.equipped_charms:
-            if charm['type'] in ('face_wild', 'kind_wild') and 'face' in charm:
-                wild_faces.add(charm['face'])
-            elif charm['type'] in ('face_wild', 'kind_wild'):
-                pass  # No print to avoid spam
-
-        # Adjust counts/max_count for wilds
-        wild_count = sum(1 for v in values if v in wild_faces)
-        wild_colors = [colors_list[i] for i, v in enumerate(values) if v in wild_faces]  # Ensure flat list of strings
-        if wild_count > 0:
-            non_wild_counts = {k: v for k, v in counts.items() if k not in wild_faces}
-            if non_wild_counts:
-                max_non_wild_key = max(non_wild_counts, key=lambda k: (non_wild_counts[k], k))
-                counts[max_non_wild_key] += wild_count
-                max_count = max(counts.values())
-                # Update groups to reflect wilds for color checks
-                groups[max_non_wild_key] = groups.get(max_non_wild_key, []) + wild_colors[:wild_count]
-                for wild_face in wild_faces:
-                    if wild_face in groups and wild_face != max_non_wild_key:
-                        groups[wild_face] = [c for c in groups[wild_face] if c not in wild_colors[:wild_count]]
-                        if not groups[wild_face]:
-                            del groups[wild_face]
-            pair_count = list(counts.values()).count(2)
-
-        if max_count == 5:
-            hand_type = "5 of a Kind"
-            base_score = 250
-            actual_colors = [c for c in colors_list if c != 'Rainbow']
-            actual_set = set(actual_colors)
-            if len(actual_set) <= 1:
-                base_modifier += 3.0
-                modifier_desc.append("Monochrome +3")
-            elif len(actual_colors) == len(actual_set):
-                base_modifier += 2.0
-                modifier_desc.append("Rainbow +2")
-        elif max_count == 4:
-            hand_type = "4 of a Kind"
-            base_score = 160
-            for val, group_colors in groups.items():
-                if counts.get(val, 0) == 4:
-                    actual_colors = [c for c in group_colors if c != 'Rainbow']
-                    actual_set = set(actual_colors)
-                    if len(actual_set) <= 1:
-                        base_modifier += 2.0
-                        modifier_desc.append("Monochrome +2")
-                    elif len(actual_colors) == len(actual_set):
-                        base_modifier += 1.0
-                        modifier_desc.append("Rainbow +1")
-                    break
-        elif max_count == 3 and 2 in counts.values():
-            hand_type = "Full House"
-            base_score = 160
-            three_val = next((val for val, count in counts.items() if count == 3), None)
-            pair_val = next((val for val, count in counts.items() if count == 2), None)
-            three_group = groups.get(three_val, [])
-            pair_group = groups.get(pair_val, [])
-            actual_colors = [c for c in colors_list if c != 'Rainbow']
-            actual_set = set(actual_colors)
-            if len(actual_set) <= 1:
-                base_modifier += 3.0
-                modifier_desc.append("Full Mono +3")
-            elif len(actual_colors) == len(actual_set):
-                base_modifier += 2.0
-                modifier_desc.append("Rainbow +2")
+        if not is_preview:
+            return self.commit_hand_score()
+        key = self.preview_key()
+        result = self.preview_cache.get(key)
+        if result is None:
+            if len(self.preview_cache) >= 512:
+                self.preview_cache.clear()  # Counters drift all game; keep the cache small
+            result = self.preview_cache[key] = score_hand(self.take_score_snapshot())[0]
+        return result
+
+    def take_score_snapshot(self, is_preview=True):
+        """Freezes everything scoring reads into a ScoreSnapshot for scoring.score_hand."""
+        boss_name = self.current_boss_effect['name'] if self.current_blind == 'Boss' and self.current_boss_effect else None
+        return ScoreSnapshot(
+            rolls=tuple(self.rolls), held=tuple(self.held), charms=self.get_charm_pipeline(),
+            boss_effect=boss_name, boss_rainbow_color=self.boss_rainbow_color,
+            hand_multipliers=dict(self.hand_multipliers), coins=self.coins, score_mult=self.score_mult,
+            empty_charm_slots=self.max_charms - len(self.equipped_charms), avoid_streak=self.avoid_streak,
+            bag_size=len(self.full_bag), stake_milestones=getattr(self, 'stake_milestones', 0),
+            discards_used=getattr(self, 'discards_used_this_round', 0), discards_left=getattr(self, 'discards_left', 0),
+            before_reroll=self.rerolls_left == getattr(self, 'rerolls_left_initial', None),
+            is_last_hand=getattr(self, 'is_last_hand', False), is_final_discard=getattr(self, 'is_final_discard', False),
+            is_preview=is_preview)
+
+    def apply_score_effects(self, effects):
+        """Applies the side effects score_hand returned for a committed hand."""
+        for kind, value in effects:
+            if kind == 'coins':
+                self.coins += value
+            elif kind == 'lucky_triggers':
+                self.lucky_triggers = value
+            elif kind == 'broken_die':
+                self.start_break_effect(value)  # Roll index, for the break animation
+
+    def commit_hand_score(self):
+        """Scores the held dice for real (Lucky/Fragile rolls happen here) and applies the side effects."""
+        result, effects = score_hand(self.take_score_snapshot(is_preview=False), self.rng.enhancements)
+        self.apply_score_effects(effects)
+        return result
+
+    def die_kind(self, die):
+        """Everything scoring and rolling see of a die: color, enhancements, score bonus and the faces it rolls."""
+        return die['color'], tuple(die.get('enhancements', ())), die.get('score_bonus', 0), tuple(self.faces_of(die))
+
+    def loadout_key(self):
+        """What scores depend on besides the dice: the charm loadout (and only the counters its charms read),
+        the boss and the hand multipliers. Coins, streaks and the like only count when a charm uses them.
+        """
+        pipeline = self.get_charm_pipeline()
+        boss_name = self.current_boss_effect['name'] if self.current_blind == 'Boss' and self.current_boss_effect else None
+        return (pipeline.signature, self.score_version, boss_name, self.boss_rainbow_color,
+                tuple(self.hand_multipliers.items()), pipeline.counters(self.take_score_snapshot()))
+
+    def get_hold_advice(self):
+        """Rates every hold mask for the current roll by exact expected final score, best first.
+        The advisor (and its memo) is kept while the same kinds of dice and the same loadout stay in play.
+        """
+        dice = [die for die, _ in self.rolls]
+        key = (tuple(self.die_kind(die) for die in dice), self.loadout_key())
+        if self.hold_advisor is None or self.hold_advisor_key != key:
+            boss_name = self.current_boss_effect['name'] if self.current_blind == 'Boss' and self.current_boss_effect else None
+            face_lists = [self.faces_of(die) for die in dice]
+            no_hold_colors = ('Glass',) if boss_name == 'Glass Guard' else ()
+            max_reroll_holds = {'Hold Ban': 0, 'Hold Limit': 3}.get(boss_name)
+            self.hold_advisor = HoldAdvisor(self.take_score_snapshot(), dice, face_lists, no_hold_colors, max_reroll_holds)
+            self.hold_advisor_key = key
+        before_reroll = self.rerolls_left == getattr(self, 'rerolls_left_initial', None)
+        return self.hold_advisor.evaluate([value for _, value in self.rolls], self.rerolls_left, before_reroll)
+
+    def apply_best_hold(self):
+        """Holds the dice the advisor rates best and says whether to score or reroll them."""
+        if self.is_discard_phase or not self.rolls or self.show_popup:
+            return
+        expected, action, mask = self.get_hold_advice()[0]
+        self.held = list(mask)
+        self.update_hand_text()
+        if action == 'score':
+            self.show_temp_message(f"Best: score now ({int(expected)})")
+        else:
+            self.show_temp_message(f"Best: reroll the rest (avg {expected:.0f})")
+
+    def get_clear_odds(self, compute=True):
+        """(low, high) chance of beating the current blind from the start of the next hand, played with the hold
+        advisor (see odds.ClearOdds). The DP is kept while the kinds of dice in the bag, the loadout and the boss
+        stay the same. A cold one takes seconds, so with compute=True a missing answer is worked out on a worker
+        thread and None comes back until it lands (clear_odds_busy(); BlindsState redraws when it's done).
+        compute=False only returns an answer that is already there. Headless games compute inline.
+        """
+        key = (tuple(sorted(self.die_kind(die) for die in self.full_bag)), self.loadout_key())
+        if self.clear_odds is None or self.clear_odds_key != key:
+            if not compute or self.clear_odds_busy():
+                return None
+            boss_name = self.current_boss_effect['name'] if self.current_blind == 'Boss' and self.current_boss_effect else None
+            no_hold_colors = ('Glass',) if boss_name == 'Glass Guard' else ()
+            max_reroll_holds = {'Hold Ban': 0, 'Hold Limit': 3}.get(boss_name)
+            rerolls = MAX_REROLLS - 1 if boss_name == 'Reroll Ration' else MAX_REROLLS
+            self.clear_odds = ClearOdds(self.take_score_snapshot(), self.full_bag, self.faces_of, rerolls,
+                                        no_hold_colors=no_hold_colors, max_reroll_holds=max_reroll_holds)
+            self.clear_odds_key = key
+            self.clear_odds_results = {}
+        query = (self.get_blind_target() - self.round_score, self.clear_odds.counts(self.bag), self.hands_left)
+        result = self.clear_odds_results.get(query)
+        if result is None and compute and not self.clear_odds_busy():
+            if self.headless:
+                result = self.clear_odds_results[query] = self.clear_odds.probability_for_counts(*query)
             else:
-                mono_three = len(set(c for c in three_group if c != 'Rainbow')) <= 1 if three_group else False
-                mono_pair = len(set(c for c in pair_group if c != 'Rainbow')) <= 1 if pair_group else False
-                if mono_three and mono_pair:
-                    base_modifier += 1.0
-                    modifier_desc.append("Both Mono +1")
-                elif mono_three or mono_pair:
-                    base_modifier += 0.5
-                    modifier_desc.append("One Mono +0.5")
-        elif sorted_values in [[1,2,3,4,5], [2,3,4,5,6]] or (has_four_fingers and any(all(x in values for x in s) for s in short_straights_large)):
-            hand_type = "Large Straight"
-            base_score = 160
-            straight_len = 5
-            straight_colors = colors_list
-            straight_values = sorted_values if not has_four_fingers else next(s for s in short_straights_large if all(x in values for x in s)) or sorted_values
-            straight_len = len(straight_values)
-            straight_colors = []
-            for v in straight_values:
-                straight_colors += groups.get(v, [])
-            actual_colors = [c for c in straight_colors if c != 'Rainbow']
-            actual_set = set(actual_colors)
-            if len(actual_set) <= 1:
-                base_modifier += 1.0
-                modifier_desc.append("Monochrome +1")
-            elif len(actual_colors) == len(actual_set):
-                base_modifier += 1.0
-                modifier_desc.append("Rainbow +1")
-        elif any(all(x in values for x in s) for s in straights) or (has_four_fingers and any(all(x in values for x in s) for s in short_straights_small)):
-            hand_type = "Small Straight"
-            base_score = 90
-            straight_len = 4
-            straight_colors = colors_list
-            straight_values = next(s for s in straights if all(x in values for x in s)) if not has_four_fingers else next(s for s in short_straights_small if all(x in values for x in s)) or sorted_values
-            straight_len = len(straight_values)
-            straight_colors = []
-            for v in straight_values:
-                straight_colors += groups.get(v, [])
-            actual_colors = [c for c in straight_colors if c != 'Rainbow']
-            actual_set = set(actual_colors)
-            if len(actual_set) <= 1:
-                base_modifier += 1.0
-                modifier_desc.append("Monochrome +1")
-            elif len(actual_colors) == len(actual_set):
-                base_modifier += 1.0
-                modifier_desc.append("Rainbow +1")
-        elif max_count == 3:
-            hand_type = "3 of a Kind"
-            base_score = 80
-            for val, group_colors in groups.items():
-                if counts.get(val, 0) == 3:
-                    actual_colors = [c for c in group_colors if c != 'Rainbow']
-                    actual_set = set(actual_colors)
-                    if len(actual_set) <= 1:
-                        base_modifier += 1.0
-                        modifier_desc.append("Monochrome +1")
-                    elif len(actual_colors) == len(actual_set):
-                        base_modifier += 0.5
-                        modifier_desc.append("Rainbow +0.5")
-                    break
-        elif pair_count == 2:
-            hand_type = "2 Pair"
-            base_score = 60
-            mono_pairs = 0
-            for group_colors in groups.values():
-                if len(group_colors) == 2:
-                    actual_set = set(c for c in group_colors if c != 'Rainbow')
-                    if len(actual_set) <= 1:
-                        mono_pairs += 1
-            if mono_pairs == 1:
-                base_modifier += 0.5
-                modifier_desc.append("One Mono Pair +0.5")
-            elif mono_pairs == 2:
-                base_modifier += 1.0
-                modifier_desc.append("Two Mono Pairs +1")
-        elif pair_count == 1:
-            hand_type = "Pair"
-            base_score = 20
-            for val, group_colors in groups.items():
-                if counts.get(val, 0) == 2:
-                    actual_colors = [c for c in group_colors if c != 'Rainbow']
-                    actual_set = set(actual_colors)
-                    if len(actual_set) <= 1:
-                        base_modifier += 0.5
-                        modifier_desc.append("Monochrome +0.5")
-                    break
+                self.clear_odds_worker = threading.Thread(target=self._work_out_clear_odds, daemon=True,
+                                                          args=(self.clear_odds, self.clear_odds_results, query))
+                self.clear_odds_worker.start()
+        return result
 
-        if self.current_blind == 'Boss' and self.current_boss_effect and self.current_boss_effect['name'] == 'Rainbow Restriction':
-            colors_list = [self.boss_rainbow_color if c == 'Rainbow' else c for c in colors_list]
-            unique_colors = set(colors_list)
+    @staticmethod
+    def _work_out_clear_odds(clear_odds, results, query):
+        results[query] = clear_odds.probability_for_counts(*query)  # Runs on the worker; the dict store hands it back
+
+    def clear_odds_busy(self):
+        """True while the worker thread is still running a clear-odds DP."""
+        return self.clear_odds_worker is not None and self.clear_odds_worker.is_alive()
 
-        if self.current_blind == 'Boss' and self.current_boss_effect:
-            effect_name = self.current_boss_effect['name']
-            if effect_name == 'Score Dip':
-                base_score = int(base_score * 0.9)
-            if effect_name == 'Color Fade':
-                base_modifier = 0.0
-                modifier_desc = ["None"]
-            if effect_name == 'Mono Mixup' and len(set(colors_list)) > 1:
-                base_modifier -= 0.5
-
-        rune_chips = 0
-        rune_mult_add = 0.0
-        rune_break_dies = []
-        self.lucky_triggers = 0
-        for die, value in held_rolls:
-            enh = die.get('enhancements', [])
-            if 'Bonus' in enh:
-                rune_chips += 10
-            if 'Mult' in enh:
-                rune_mult_add += 0.5
-            if 'Lucky' in enh and not is_preview and random.random() < 0.33:
-                self.lucky_triggers += 1
-                self.coins += 1  # +1 coin
-            if 'Steel' in enh:
-                rune_mult_add += 0.5
-            if 'Fragile' in enh:
-                rune_mult_add += 1.0
-                if not is_preview and random.random() < 0.25:
-                    rune_break_dies.append(die)
-            if 'Stone' in enh:
-                rune_chips += 50
-
-        for die in rune_break_dies:
-            self.broken_dice.append(held_rolls.index((die, value)))
-
-        charm_chips = 0
-        charm_color_mult_add = 0.0
-        charm_mult_add = 0.0
-        is_mono = any("Mono" in d for d in modifier_desc)
-        is_rainbow = any("Rainbow" in d for d in modifier_desc)
-        num_dice_used = len(held_rolls)
-        is_small_straight = any(all(x in values for x in s) for s in straights) or (has_four_fingers and any(all(x in values for x in s) for s in short_straights_small))
-        is_large_straight = sorted_values in [[1,2,3,4,5], [2,3,4,5,6]] or (has_four_fingers and any(all(x in values for x in s) for s in short_straights_large))
-        self.confirmed_hands_this_round = getattr(self, 'confirmed_hands_this_round', 0)  # Ensure initialized
-        for idx, charm in enumerate(self.equipped_charms):
-            if idx in self.disabled_charms:
-                continue
-            if charm['type'] == 'flat_bonus':
-                charm_chips += charm['value']
-            elif charm['type'] == 'per_color_bonus':
-                charm_chips += colors_list.count(charm['color']) * charm['value']
-            elif charm['type'] == 'hand_bonus':
-                for h in charm['hands']:
-                    if h == 'Pair' and max_count >= 2:
-                        charm_chips += charm['value']
-                    elif h == '2 Pair' and pair_count >= 2:
-                        charm_chips += charm['value']
-                    elif h == '3 of a Kind' and max_count >= 3:
-                        charm_chips += charm['value']
-                    elif h == '4 of a Kind' and max_count >= 4:
-                        charm_chips += charm['value']
-                    elif h == '5 of a Kind' and max_count == 5:
-                        charm_chips += charm['value']
-                    elif h == 'Full House' and max_count == 3 and 2 in counts.values():
-                        charm_chips += charm['value']
-                    elif h == 'Small Straight' and is_small_straight:
-                        charm_chips += charm['value']
-                    elif h == 'Large Straight' and is_large_straight:
-                        charm_chips += charm['value']
-            elif charm['type'] == 'mono_mult_bonus':
-                if is_mono:
-                    charm_color_mult_add += charm['value']
-                    modifier_desc.append(f"{charm['name']} +{charm['value']}")
-            elif charm['type'] == 'few_dice_bonus':
-                if num_dice_used <= charm['max_dice']:
-                    charm_chips += charm['value']
-            elif charm['type'] == 'empty_slot_mult':
-                empty_slots = self.max_charms - len(self.equipped_charms)
-                mult_add = charm['value'] * empty_slots
-                if mult_add > 0:
-                    charm_mult_add += mult_add
-                    modifier_desc.append(f"{charm['name']} +{mult_add}")
-            elif charm['type'] == 'per_value_bonus':
-                count = 0
-                for _, value in held_rolls:
-                    if (charm['parity'] == 'even' and value % 2 == 0) or (charm['parity'] == 'odd' and value % 2 != 0):
-                        count += 1
-                    charm_chips += count * charm['value']
-            elif charm['type'] == 'rainbow_mult_bonus':
-                if is_rainbow:
-                    charm_color_mult_add += charm['value']
-                    modifier_desc.append(f"{charm['name']} +{charm['value']}")
-            elif charm['type'] == 'sacrifice_mult':
-                mult_add = self.score_mult
-                if mult_add > 0:
-                    charm_mult_add += mult_add
-                    modifier_desc.append(f"{charm['name']} +{mult_add}")
-            elif charm['type'] == 'mult_bonus':
-                if 'hands' in charm:
-                    if hand_type in charm['hands']:
-                        mult_add = charm['value'] - 1
-                        charm_mult_add += mult_add
-                        modifier_desc.append(f"{charm['name']} +{mult_add}")
-                else:
-                    mult_add = charm['value'] - 1
-                    charm_mult_add += mult_add
-                    modifier_desc.append(f"{charm['name']} +{mult_add}")
-            elif charm['type'] == 'color_mult':
-                count = sum(1 for die, _ in held_rolls if die['color'] == charm['color'])
-                mult_add = count * charm['value']
-                if mult_add > 0:
-                    charm_mult_add += mult_add
-                    modifier_desc.append(f"{charm['name']} +{mult_add} ({count} {charm['color']})")
-            elif charm['type'] == 'color_mult_conditional':
-                if not hasattr(self, 'rerolls_left_initial') or self.rerolls_left != self.rerolls_left_initial:
-                    continue
-                count = sum(1 for die, _ in held_rolls if die['color'] == charm['color'])
-                mult_add = count * charm['value']
-                if mult_add > 0:
-                    charm_mult_add += mult_add
-                    modifier_desc.append(f"{charm['name']} +{mult_add} ({count} {charm['color']})")
-            elif charm['type'] == 'mult_conditional':
-                if charm.get('mono', False):
-                    if len(set(colors_list)) == 1:
-                        mult_add = charm['value'] - 1
-                        charm_mult_add += mult_add
-                        modifier_desc.append(f"{charm['name']} +{mult_add}")
-                if charm.get('glass', False):
-                    glass_count = sum(1 for die, _ in held_rolls if die['color'] == 'Glass' or 'Glass' in die.get('enhancements', []))
-                    if glass_count > 0:
-                        mult_add = charm['value'] - 1
-                        charm_mult_add += mult_add
-                        modifier_desc.append(f"{charm['name']} +{mult_add}")
-            elif charm['type'] == 'mult_per_face':
-                count = sum(1 for _, v in held_rolls if v in charm['faces'])
-                mult_add = charm['value'] * count
-                if mult_add > 0:
-                    charm_mult_add += mult_add
-                    modifier_desc.append(f"{charm['name']} +{mult_add} ({count} faces)")
-            elif charm['type'] == 'bonus_per_charm':
-                count = len([c for idx, c in enumerate(self.equipped_charms) if idx not in self.disabled_charms])
-                mult_add = charm['mult'] * count
-                if mult_add > 0:
-                    charm_mult_add += mult_add
-                    modifier_desc.append(f"{charm['name']} +{mult_add} ({count} charms)")
-                charm_chips += charm['score'] * count
-            elif charm['type'] == 'mult_per_streak':
-                mult_add = round(charm['value'] * self.avoid_streak, 1)
-                if mult_add > 0:
-                    charm_mult_add += mult_add
-                    modifier_desc.append(f"{charm['name']} +{mult_add} ({self.avoid_streak} streak)")
-            elif charm['type'] == 'mult_per_low_bag':
-                low_count = max(0, 25 - len(self.full_bag))
-                mult_add = charm['value'] * low_count
-                if mult_add > 0:
-                    charm_mult_add += mult_add
-                    modifier_desc.append(f"{charm['name']} +{mult_add} ({low_count} below 25)")
-            elif charm['type'] == 'mult_per_lucky':
-                mult_add = charm.get('permanent_bonus', 0.0)  # EDIT: Only add permanent_bonus; no current lucky_triggers mult for this hand
-                if mult_add > 0:
-                    charm_mult_add += mult_add
-                    modifier_desc.append(f"{charm['name']} +{mult_add} (permanent)")  # EDIT: Always show as permanent
-            elif charm['type'] == 'mult_per_milestone':
-                mult_add = charm['value'] * getattr(self, 'stake_milestones', 0)
-                if mult_add > 0:
-                    charm_mult_add += mult_add
-                    modifier_desc.append(f"{charm['name']} +{mult_add} ({self.stake_milestones} milestones)")
-            elif charm['type'] == 'advantage_choice':
-            # Stub: Requires roll logic outside scoring (e.g., in roll phase)
-            # For now, no in-score effect; handle in roll method
-                pass
-            elif charm['type'] == 'reroll_advantage':
-                # Stub: Once per blind, allow advantage reroll; track in game state
-                if not is_preview and not getattr(self, 'used_reroll_advantage', False):
-                    # Logic would go in reroll method; here, no score effect
-                    pass
-            elif charm['type'] == 'rune_cast':
-                # Stub: Cast random rune once per shop; needs state (e.g., self.rune_cast_used)
-                if not is_preview and not getattr(self, 'rune_cast_used', False):
-                    # Apply random rune effect (to be defined in rune system)
-                    pass
-            elif charm['type'] == 'coin_per_lucky':
-                if not is_preview and self.lucky_triggers > 0:
-                    coins_added = charm['value'] * self.lucky_triggers
-                    self.coins += coins_added  # Add directly to coins
-                    modifier_desc.append(f"{charm['name']} +{coins_added} coins ({self.lucky_triggers} lucky)")
-            elif charm['type'] == 'random_rune':
-                # Stub: Add random rune at blind start; no per-hand effect
-                pass
-            elif charm['type'] == 'interest_bonus':
-                # Stub: Adds 1 coin per 10 coins at round end; handle in score_and_new_turn
-                pass
-            elif charm['type'] == 'retrigger_special':
-                # Stub: Retrigger enhancements on special colors; needs color check
-                if not is_preview:
-                    special_colors = ['Gold', 'Silver', 'Glass', 'Rainbow']  # Define as needed
-                    special_count = sum(1 for die, _ in held_rolls if die['color'] in special_colors)
-                    if special_count > 0:
-                        # Retrigger logic (e.g., double coin effects) to be defined
-                        pass
-            elif charm['type'] == 'mult_per_enhance':
-                enhance_count = sum(1 for die, _ in held_rolls if die.get('enhancements'))
-                mult_add = charm['value'] * enhance_count
-                if mult_add > 0:
-                    charm_mult_add += mult_add
-                    modifier_desc.append(f"{charm['name']} +{mult_add} ({enhance_count} enhancements)")
-            elif charm['type'] == 'discard_mult':
-                mult_add = charm['value'] * getattr(self, 'discards_used_this_round', 0)
-                if mult_add > 0:
-                    charm_mult_add += mult_add
-                    modifier_desc.append(f"{charm['name']} +{mult_add} ({self.discards_used_this_round} discards)")
-            elif charm['type'] == 'coin_per_wild':
-                wild_count = sum(1 for die, _ in held_rolls if die['color'] == 'Rainbow' and len(set([d['color'] for d, _ in held_rolls if d['color'] != 'Rainbow'])) <= 1)
-                if not is_preview and wild_count > 0:
-                    charm_chips += charm['value'] * wild_count
-                    modifier_desc.append(f"{charm['name']} +{charm['value'] * wild_count} coins ({wild_count} wilds)")
-            elif charm['type'] == 'final_mult_conditional':
-                # Stub: +3 mult on last hand with enhancement; needs hand count check
-                if not is_preview and getattr(self, 'is_last_hand', False) and any(die.get('enhancements') for die, _ in held_rolls):
-                    charm_mult_add += charm['value']
-                    modifier_desc.append(f"{charm['name']} +{charm['value']} (final)")
-            elif charm['type'] == 'face_buy_high':
-                # Stub: Pay 3 coins for +2 to a face; handle in event/turn logic
-                pass
-            elif charm['type'] == 'coin_per_discard':
-                discards_left = getattr(self, 'discards_left', 0)
-                if not is_preview and discards_left > 0:
-                    charm_chips += charm['value'] * discards_left
-                    modifier_desc.append(f"{charm['name']} +{charm['value'] * discards_left} coins ({discards_left} discards)")
-            elif charm['type'] == 'risk_mult':
-                # Stub: -1 to one die, +0.5 mult; handle die mod in roll phase
-                if not is_preview:
-                    charm_mult_add += charm['value']
-                    modifier_desc.append(f"{charm['name']} +{charm['value']} (risk)")
-            elif charm['type'] == 'loss_prevent':
-                # Stub: Prevent loss once per game; handle in game over logic
-                pass
-            elif charm['type'] == 'rune_scribe':
-                # Stub: Scribe rune on magic 3; handle in scoring or turn start
-                if not is_preview and any(value == 3 for _, value in held_rolls):
-                    # Logic to add to rune tray
-                    pass
-            elif charm['type'] == 'revive_die':
-                # Stub: 50% chance to revive a die; handle in break or turn end
-                pass
-            elif charm['type'] == 'discard_destroy_coin':
-                # Stub: Destroy 1 die for 3 coins on first discard; handle in discard phase
-                pass
-            elif charm['type'] == 'score_per_discard_color':
-                # Stub: +3 per discarded color die; needs discard tracking
-                pass
-            elif charm['type'] == 'mult_final_discard':
-                # Stub: +2 mult on final discard; needs discard count
-                if not is_preview and getattr(self, 'is_final_discard', False):
-                    charm_mult_add += charm['value']
-                    modifier_desc.append(f"{charm['name']} +{charm['value']} (final discard)")
-            elif charm['type'] == 'score_per_coin':
-                charm_chips += charm['value'] * self.coins
-            elif charm['type'] == 'score_bonus' and charm['value'] == 'stat_sum':
-                # Sum the face values of all held dice
-                face_sum = sum(value for _, value in held_rolls)
-                charm_chips += face_sum  # Add to chips (base score additive)
-                modifier_desc.append(f"{charm['name']} +{face_sum} (Sum of faces)")
-            elif charm['type'] == 'score_decay':
-                # Initialize hands_played on the charm if not present (per-charm counter)
-                if 'hands_played' not in charm:
-                    charm['hands_played'] = 0
-                decay_bonus = max(0, charm['start'] - (charm['decay'] * charm['hands_played']))
-                charm_chips += decay_bonus
-            elif charm['type'] == 'score_conditional':
-                if len(held_rolls) == charm['dice']:
-                    charm_chips += charm['value']
-                    charm_chips += charm.get('permanent_bonus', 0)
-            elif charm['type'] == 'die_bonus_perm':
-                # No calculation here; increment moved to score_and_new_turn to avoid previews
-                pass
-
-        # Sum per-die bonuses for scored dice
-        for die, _ in held_rolls:
-            bonus = die.get('score_bonus', 0)
-            #  print(f"Die ID {die.get('id', 'no_id')} bonus: {bonus}")  # Debug: shows if/why 0
-            charm_chips += die.get('score_bonus', 0)
-
-        total_modifier = base_modifier + charm_color_mult_add + rune_mult_add + charm_mult_add
-
-        if hand_type in self.hand_multipliers:
-            mult_add = self.hand_multipliers[hand_type] - 1
-            total_modifier += mult_add
-            if mult_add > 0:
-                modifier_desc.append(f"Prism Pack +{mult_add}")
-
-        silence_glass = False
-        if self.current_blind == 'Boss' and self.current_boss_effect and self.current_boss_effect['name'] == 'Special Silence':
-            silence_glass = True
-
-        glass_count = sum(1 for die, _ in held_rolls if die['color'] == 'Glass')
-        glass_mult = (3 + glass_count) if glass_count > 0 and not silence_glass else 0
-        if glass_mult > 0:
-            total_modifier += glass_mult
-            modifier_desc.append(f"Glass +{glass_mult}")
-
-        has_mime = any(c['type'] == 'retrigger_held' for idx, c in enumerate(self.equipped_charms) if idx not in self.disabled_charms)
-        if has_mime and not silence_glass and glass_count > 0:
-            total_modifier += glass_mult
-            modifier_desc.append(f"Mime (Glass) +{glass_mult}")
-
-        if self.current_blind == 'Boss' and self.current_boss_effect and self.current_boss_effect['name'] == 'Multiplier Mute':
-            total_modifier = min(total_modifier, 2.5)
-            if total_modifier >= 2.5:
-                modifier_desc.append("Multiplier Mute capped at +2.5")
-
-        modifier_desc = ", ".join(modifier_desc) if modifier_desc else "None"
-
-        final_score = int((base_score + charm_chips + rune_chips) * (1 + total_modifier))
-        return hand_type, base_score, modifier_desc, final_score, charm_chips, charm_color_mult_add
-    
     def calculate_score(self):
         """Calculates and returns the final score."""
         _, _, _, final_score, _, _ = self.get_hand_type_and_score()
@@ -1479,6 +1195,8 @@ class ChromaRollGame:
     
     def update_hand_text(self):
         """Updates the texts showing current hand and modifier."""
+        if self.headless:
+            return  # No HUD to update
         if self.is_discard_phase:
             # New: Show placeholders during discard phase
             self.current_hand_text = "Current Hand: Nothing (0 base) = 0 total"
@@ -1546,23 +1264,24 @@ class ChromaRollGame:
             button_y += BUTTON_HEIGHT + button_spacing
         return button_rects
 
-    def draw_dagger_icon(self, rect):
-        """Draws a simple dagger icon inside the given rect."""
+    def draw_dagger_icon(self, rect, surface=None):
+        """Draws a simple dagger icon inside the given rect (on surface, default the screen)."""
+        surface = surface or self.screen
         center_x = rect.x + rect.width // 2
         center_y = rect.y + rect.height // 2
         blade_length = rect.height // 3
         handle_length = rect.height // 5
         width = rect.width // 6
         # Blade
-        pygame.draw.polygon(self.screen, (192, 192, 192), [
+        pygame.draw.polygon(surface, (192, 192, 192), [
             (center_x, center_y - blade_length),
             (center_x - width // 2, center_y),
             (center_x + width // 2, center_y)
         ])
         # Handle
-        pygame.draw.rect(self.screen, (139, 69, 19), pygame.Rect(center_x - width // 4, center_y, width // 2, handle_length))
+        pygame.draw.rect(surface, (139, 69, 19), pygame.Rect(center_x - width // 4, center_y, width // 2, handle_length))
         # Crossguard
-        pygame.draw.line(self.screen, (169, 169, 169), (center_x - width // 2, center_y), (center_x + width // 2, center_y), 2)
+        pygame.draw.line(surface, (169, 169, 169), (center_x - width // 2, center_y), (center_x + width // 2, center_y), 2)
 
     def draw_charms(self):
         """Draws equipped charms at the top with hover tooltips."""
@@ -1596,24 +1315,8 @@ class ChromaRollGame:
             self.draw_charm_die(rect, charm)
 
     def get_charm_surface(self, charm, index):
-        """Returns the charm icon surface, grayscaled if disabled."""
-        # Load from cache (adjust path key if needed)
-        path = self.charm_icon_paths.get(charm['name'])
-        if path and path in self.charm_icon_cache:
-            surf = self.charm_icon_cache[path].copy()  # Copy to avoid modifying cache
-            
-            # Check if disabled
-            if index in self.disabled_charms:
-                surf = self.grayscale_surface(surf)  # Apply grayscale
-            
-            return surf
-        else:
-            # Fallback surface if no icon
-            surf = pygame.Surface((CHARM_SIZE, CHARM_SIZE))
-            surf.fill((200, 200, 200))  # Gray placeholder
-            text = self.tiny_font.render(charm['name'][:5], True, (0, 0, 0))
-            surf.blit(text, (10, 10))
-            return surf
+        """Returns the charm icon surface, grayscaled if disabled (shared from self.charm_tiles - don't modify it)."""
+        return self.charm_tiles.icon_surface(self, charm, index in self.disabled_charms)
 
     def draw_hand_type_icon(self, rect, hand_type):
         """Draws icon for hand type with white dice showing the combo."""
@@ -1655,13 +1358,14 @@ class ChromaRollGame:
 
     def reset_game(self):
         # Existing resets (e.g., coins=0, stake=1, blind='Small', etc.)
-        self.coins = 999999 if DEBUG else 0
+        self.rng = GameRNG()  # Fresh seed for the new run
+        self.coins = 999999 if self.debug else 0
         self.turn_initialized = False  # Reset for new round/turn
         self.current_stake = 1
         self.current_blind = 'Small'
         self.round_score = 0
         self.hands_left = MAX_HANDS
-        self.rerolls_left = MAX_REROLLS if not DEBUG else -1
+        self.rerolls_left = MAX_REROLLS if not self.debug else -1
         self.discards_left = MAX_DISCARDS
         self.hand = []
         self.rolls = []
@@ -1669,8 +1373,8 @@ class ChromaRollGame:
         self.discard_selected = [False] * NUM_DICE_IN_HAND
         self.is_discard_phase = False
         self.has_rolled = False
-        self.bag = create_dice_bag()  # Fresh 25 dice
-        self.full_bag = [d.copy() for d in self.bag]  # Copy fresh
+        self.bag = DiceBag(create_dice_bag())  # Fresh 25 dice
+        self.full_bag = DiceBag(self.bag)  # Same dice, owned
         self.equipped_charms = []
         self.disabled_charms = []
         self.shop_charms = []
@@ -1694,27 +1398,34 @@ class ChromaRollGame:
         self.popup_message = None
         self.dragging_charm_index = -1
         self.dragging_shop = False
+        self.reset_score_caches()  # New run: nothing cached for the old loadout or bag applies
         # Set initial hand texts
         self.update_hand_text()
         self.hand_multipliers = {ht: 1.0 for ht in data.HAND_TYPES}  # Reset to base 1.0 for all types
         # Add any other vars to reset (e.g., multipliers_hover=False)
         self.tutorial_step = 0; self.tutorial_mode = False; self.tutorial_completed = False; self.unlocks = {}
 
+    def new_die_id(self, color):
+        """First free id like 'Red6' (counting by color alone can repeat an id once runes recolor dice)."""
+        n = 1
+        while self.full_bag.get(f"{color}{n}") is not None:
+            n += 1
+        return f"{color}{n}"
+
     def apply_pouch(self, pouch):
         """Applies the selected pouch's bonuses to the game state."""
         self.current_pouch = pouch
         # Reset bag to base
-        self.bag = create_dice_bag()
-        self.full_bag = [d.copy() for d in self.bag]
+        self.bag = DiceBag(create_dice_bag())
+        self.full_bag = DiceBag(self.bag)
         
         # Add extra dice
         extras = pouch.get('bonus', {}).get('extra_dice', {})
         for color, count in extras.items():
             for i in range(count):
-                new_id = f"{color}{len([d for d in self.bag if d['color'] == color]) + 1}"
-                new_die = {'id': new_id, 'color': color, 'faces': DICE_FACES[:]}
+                new_die = Die(self.new_die_id(color), color)
                 self.bag.append(new_die)
-                self.full_bag.append(copy.deepcopy(new_die))
+                self.full_bag.append(new_die)
         
         # Apply action/coin bonuses
         self.discards_left += pouch.get('bonus', {}).get('discards', 0)
@@ -1728,26 +1439,26 @@ class ChromaRollGame:
         self.max_charms += pouch.get('bonus', {}).get('charm_slots', 0)  # e.g., Black
         self.hands_left += pouch.get('bonus', {}).get('hands', 0)  # Negative for Black
         if 'random_special' in pouch.get('bonus', {}).get('extra_dice', {}):
-            special_color = random.choice(SPECIAL_COLORS)
+            special_color = self.rng.bag.choice(SPECIAL_COLORS)
             # Add die logic like extras
-            new_id = f"{special_color}{len([d for d in self.bag if d['color'] == special_color]) + 1}"
-            new_die = {'id': new_id, 'color': special_color, 'faces': DICE_FACES[:]}
+            new_die = Die(self.new_die_id(special_color), special_color)
             self.bag.append(new_die)
-            self.full_bag.append(copy.deepcopy(new_die))
+            self.full_bag.append(new_die)
         if pouch.get('bonus', {}).get('randomize_bag', False):
             for die in self.bag:
-                die['color'] = random.choice(list(COLORS.keys()))  # Random color; add face randomize if wanted
+                die['color'] = self.rng.bag.choice(list(COLORS.keys()))  # Random color; add face randomize if wanted
         # For Plasma/Ghost: Add flags like self.balance_score = True, use in calculate_score/shop generation
 
     def generate_shop(self):
         self.shop_reroll_cost = 5
         all_packs = [0,1,2,3,4,5] + [6,7,8]  # Assume 0-5 existing, 6-8 for rune packs
         weights = [1]*6 + [1, 0.8, 0.3]  # Lower for Super
-        self.available_packs = random.choices(all_packs, weights=weights, k=2 + any(tag['name'] == 'Voucher Tag' for tag in self.active_tags))  # Extra if Voucher Tag
+        self.available_packs = self.rng.shop.choices(all_packs, weights=weights, k=2 + any(tag['name'] == 'Voucher Tag' for tag in self.active_tags))  # Extra if Voucher Tag
         # Map indices to packs, e.g., if pack_id in [6,7,8]: self.pack_choices = random.sample(data.MYSTIC_RUNES, pack['choices'])
         
         # Filter pool to exclude owned (as before)
-        available_pool = [c for c in data.CHARMS_POOL if c['name'] not in [e['name'] for e in self.equipped_charms]]
+        owned = {e['name'] for e in self.equipped_charms}
+        available_pool = [c for c in data.CHARMS_POOL if c['name'] not in owned]
         
         # Compute weights per charm: base rarity * stake modifier
         charm_weights = []
@@ -1764,7 +1475,7 @@ class ChromaRollGame:
         num_shop = min(3, len(available_pool))
         if sum(charm_weights) > 0:
             # Weighted but unique: Use choices, then dedup and resample if needed
-            candidates = random.choices(available_pool, weights=charm_weights, k=num_shop * 2)  # Oversample to ensure uniques
+            candidates = self.rng.shop.choices(available_pool, weights=charm_weights, k=num_shop * 2)  # Oversample to ensure uniques
             unique_candidates = []
             seen_names = set()
             for c in candidates:
@@ -1775,14 +1486,28 @@ class ChromaRollGame:
                     break
             self.shop_charms = unique_candidates[:num_shop]
             if len(self.shop_charms) < num_shop:  # Fallback if too few uniques
-                self.shop_charms += random.sample([c for c in available_pool if c['name'] not in seen_names], num_shop - len(self.shop_charms))
+                self.shop_charms += self.rng.shop.sample([c for c in available_pool if c['name'] not in seen_names], num_shop - len(self.shop_charms))
         else:
-            self.shop_charms = random.sample(available_pool, num_shop) if available_pool else []
+            self.shop_charms = self.rng.shop.sample(available_pool, num_shop) if available_pool else []
         
-        self.available_rune_packs = random.sample(data.RUNE_PACKS, min(2, len(data.RUNE_PACKS)))  # Random 1-2 rune packs
+        self.available_rune_packs = self.rng.shop.sample(data.RUNE_PACKS, min(2, len(data.RUNE_PACKS)))  # Random 1-2 rune packs
 
         #  print("DEBUG: Generated shop charms:", [c['name'] for c in self.shop_charms])  # Optional: Confirm no dups (remove after test)
 
+    def buy_shop_charm(self, index):
+        """Buys shop_charms[index] if a slot is free and coins allow (Debt Charm lets you go to -5). Returns True if bought."""
+        charm = self.shop_charms[index]
+        has_debt = any(c['type'] == 'negative_coins' for c in self.equipped_charms)
+        min_coins = -5 if has_debt else 0
+        if len(self.equipped_charms) >= self.max_charms or self.coins - charm['cost'] < min_coins:
+            return False
+        self.shop_charms.pop(index)
+        self.equipped_charms.append(copy.deepcopy(charm))  # Own copy - growth charms write permanent_bonus into it
+        self.coins -= charm['cost']
+        if self.current_boss_effect and self.current_boss_effect['name'] == 'Charm Eclipse':
+            self.disabled_charms = list(range(len(self.equipped_charms)))
+        return True
+
     def add_to_rune_tray(self, rune):
         for k in range(len(self.rune_tray)):
             if self.rune_tray[k] is None:
@@ -1797,16 +1522,13 @@ class ChromaRollGame:
             self.shop_reroll_cost += 3
             self.generate_shop()
 
-    def apply_boss_face_shuffle(self):
-        """Applies shuffled faces from the current boss effect to all relevant dice if active."""
-        if self.current_boss_effect and self.current_boss_effect.get('name') == 'Face Shuffle' and self.boss_shuffled_faces:
-            all_dice = self.full_bag + self.bag + self.hand + [r[0] for r in self.rolls] + self.broken_dice
-            for die in all_dice:
-                if die['id'] in self.boss_shuffled_faces:
-                    die['faces'] = copy.deepcopy(self.boss_shuffled_faces[die['id']])
-            # Optional: Log for debug
-            if DEBUG:
-                print("Applied boss face shuffle to", len(all_dice), "dice")
+    def faces_of(self, die):
+        """Faces the die rolls with right now: its Face Shuffle overlay entry while that boss is live, else its own.
+        The overlay (boss_shuffled_faces, die id -> faces) is filled when the boss starts and emptied by
+        advance_blind, so dice never have their faces rewritten.
+        """
+        overlay = self.boss_shuffled_faces
+        return overlay.get(die['id'], die['faces']) if overlay else die['faces']
 
     def apply_rune_effect(self, rune, die_list=None):
         if die_list is None:
@@ -1831,28 +1553,28 @@ class ChromaRollGame:
                 self.temp_message = "Select exactly 1 die!"
                 return
             for die in die_list:
-                die['enhancements'].append('Lucky')
+                die.add_enhancement('Lucky')
 
         elif name == 'Mystic Oracle Rune':
             # Assume UPGRADE_RUNES exists or stub: add 2 random hand boosts
             for _ in range(2):
-                ht = random.choice(data.HAND_TYPES)
+                ht = self.rng.enhancements.choice(data.HAND_TYPES)
                 self.hand_multipliers[ht] += 0.5  # Or add to rune tray if upgrades are runes
 
         elif name == 'Mystic Mult Rune':
             # Up to 2, but allow fewer
             for die in die_list:
-                die['enhancements'].append('Mult')
+                die.add_enhancement('Mult')
 
         elif name == 'Mystic Emperor Rune':
             for _ in range(2):
-                new_rune = random.choice(data.MYSTIC_RUNES)
+                new_rune = self.rng.enhancements.choice(data.MYSTIC_RUNES)
                 self.add_to_rune_tray(new_rune)
 
         elif name == 'Mystic Bonus Rune':
             # Up to 2
             for die in die_list:
-                die['enhancements'].append('Bonus')
+                die.add_enhancement('Bonus')
 
         elif name == 'Mystic Wild Rune':
             if len(die_list) != 1:
@@ -1860,21 +1582,21 @@ class ChromaRollGame:
                 return
             for die in die_list:
                 die['color'] = 'Rainbow'
-                die['enhancements'].append('Wild')
+                die.add_enhancement('Wild')
 
         elif name == 'Mystic Steel Rune':
             if len(die_list) != 1:
                 self.temp_message = "Select exactly 1 die!"
                 return
             for die in die_list:
-                die['enhancements'].append('Steel')
+                die.add_enhancement('Steel')
 
         elif name == 'Mystic Fragile Rune':
             if len(die_list) != 1:
                 self.temp_message = "Select exactly 1 die!"
                 return
             for die in die_list:
-                die['enhancements'].append('Fragile')
+                die.add_enhancement('Fragile')
 
         elif name == 'Mystic Wealth Rune':
             gain = min(self.coins, 20)
@@ -1882,19 +1604,19 @@ class ChromaRollGame:
             self.temp_message = f"Gained {gain} coins!"
 
         elif name == 'Mystic Fate Rune':
-            if random.random() < 0.25 and self.bag:
-                die = random.choice(self.bag)
-                edition = random.choice(['Foil', 'Holo', 'Poly'])
-                die['enhancements'].append(edition)
-                die['enhancements'].append('Fate')
+            if self.rng.enhancements.random() < 0.25 and self.bag:
+                die = self.rng.enhancements.choice(self.bag)
+                edition = self.rng.enhancements.choice(['Foil', 'Holo', 'Poly'])
+                die.add_enhancement(edition)
+                die.add_enhancement('Fate')
 
         elif name == 'Mystic Strength Rune':
             # Up to 2
             for die in die_list:
                 faces = sorted(die['faces'])
-                die['faces'] = faces[2:] + random.choices(faces[3:], k=2)  # Mid-high dups
+                die['faces'] = faces[2:] + self.rng.enhancements.choices(faces[3:], k=2)  # Mid-high dups
                 die['faces'] = die['faces'][:6]
-                die['enhancements'].append('Strength')
+                die.add_enhancement('Strength')
 
         elif name == 'Mystic Sacrifice Rune':
             # Up to 2
@@ -1912,7 +1634,7 @@ class ChromaRollGame:
             target, source = die_list  # First selected = target (#1), second = source (#2)
             target['color'] = source['color']
             target['faces'] = source['faces'][:]
-            target['enhancements'].append('Transmute')
+            target.add_enhancement('Transmute')
 
         elif name == 'Mystic Balance Rune':
             total = sum(c.get('cost', 0) for c in self.equipped_charms)
@@ -1924,27 +1646,27 @@ class ChromaRollGame:
                 return
             for die in die_list:
                 die['color'] = 'Gold'
-                die['enhancements'].append('Gold')
+                die.add_enhancement('Gold')
 
         elif name == 'Mystic Stone Rune':
             if len(die_list) != 1:
                 self.temp_message = "Select exactly 1 die!"
                 return
             for die in die_list:
-                die['enhancements'].append('Stone')
-                die['faces'] = [random.randint(3,6)] * 6  # Fixed high-ish
+                die.add_enhancement('Stone')
+                die['faces'] = [self.rng.enhancements.randint(3,6)] * 6  # Fixed high-ish
 
         elif name in ['Mystic Red Rune', 'Mystic Blue Rune', 'Mystic Green Rune', 'Mystic Purple Rune', 'Mystic Yellow Rune']:
             # Up to 3
             color = name.split()[1].capitalize()  # Red, etc.
             for die in die_list:
                 die['color'] = color
-                die['enhancements'].append(color)
+                die.add_enhancement(color)
 
         elif name == 'Mystic Judgement Rune':
-            charm = random.choice([c for c in data.CHARMS_POOL if c['rarity'] == 'Common'])
+            charm = self.rng.enhancements.choice([c for c in data.CHARMS_POOL if c['rarity'] == 'Common'])
             if len(self.equipped_charms) < self.max_charms:
-                self.equipped_charms.append(charm)
+                self.equipped_charms.append(copy.deepcopy(charm))
                 self.temp_message = f"Added {charm['name']}!"
             else:
                 self.temp_message = "Charm slots full!"
@@ -1955,7 +1677,7 @@ class ChromaRollGame:
                 return
             for die in die_list:
                 die['color'] = 'Silver'
-                die['enhancements'].append('Silver')
+                die.add_enhancement('Silver')
 
         self.last_rune = rune  # Track for Fool
         self.refresh_bag()  # Update visuals
@@ -1963,11 +1685,27 @@ class ChromaRollGame:
 
     def refresh_bag(self):
         """Force update bag visuals after rune apply."""
-        # Update full_bag to match bag (if needed for persistence)
-        self.full_bag = [d for d in self.full_bag if d in self.bag] + [d for d in self.bag if d not in self.full_bag]  # Sync
+        # Rune edits already land on the owned dice (bag holds the full_bag objects); just adopt any new bag die
+        self.full_bag.extend(self.bag)  # No-op for dice it already has
         # If in shop/game, force redraw (state will handle in next draw call)
         #  print("Bag refreshed")  # Debug; remove later
 
+    def update_layouts(self):
+        """Rebuilds the per-screen rects (layout.py) if the window size changed since they were worked out."""
+        if self.layout is None or self.layout.size != (self.width, self.height):
+            self.layout = GameLayout(self.width, self.height)
+            self.blinds_layout = BlindsLayout(self.width, self.height)
+            self.shop_layout = ShopLayout(self.width, self.height)
+
+    def on_resize(self, width, height):
+        """Window resized: track the new size and drop the caches that depend on it."""
+        self.width, self.height = width, height
+        self.update_layouts()
+        self.die_sprites.clear()
+        self.bag_layer.clear()
+        self.charm_tiles.clear()
+        self.state_machine.invalidate()
+
     def run(self):
         """Main game loop."""
         clock = pygame.time.Clock()
@@ -1977,14 +1715,19 @@ class ChromaRollGame:
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    self.state_machine.scheduler.finish('roll')  # Save the rolled hand, not animation faces
                     savegame.save_game(self)  # Save on close
                     running = False
+                elif event.type == pygame.VIDEORESIZE:
+                    self.on_resize(event.w, event.h)
                 self.state_machine.handle_event(event)
 
             self.state_machine.update(dt)
-            self.state_machine.draw()
-
-            pygame.display.flip()
+            dirty = self.state_machine.render()  # None = whole screen changed
+            if dirty is None:
+                pygame.display.flip()
+            elif dirty:
+                pygame.display.update(dirty)  # Static screens: only what input changed; idle frames push nothing
 
         pygame.quit()
         sys.exit()
@@ -0,0 +1,219 @@
+# advisor.py
+# Best-hold advisor: exact expected final score for every hold mask, using each die's real faces
+from collections import Counter
+from itertools import product
+from constants import BASE_COLORS
+from dice import face_probs
+from scoring import score_hand
+
+# Index pairs (held positions, rerolled positions) for every hold mask of n dice
+_MASK_SPLITS = [[([i for i in range(n) if bits >> i & 1], [i for i in range(n) if not bits >> i & 1])
+                 for bits in range(1 << n)] for n in range(8)]
+
+
+def plain_colors(snapshot, no_hold_colors=()):
+    """Base colors no charm, boss or hold rule singles out - dice in these colors only matter through matching."""
+    special = set(snapshot.charms.colors) | set(no_hold_colors)
+    if snapshot.boss_effect == 'Rainbow Restriction':
+        special.add(snapshot.boss_rainbow_color)
+    return set(BASE_COLORS) - special
+
+
+class HoldAdvisor:
+    """Expected-value search over hold masks for one hand of dice.
+    snapshot is a preview ScoreSnapshot (charms, boss, counters); face_lists gives each die's rollable faces
+    (Strength duplicates and Face Shuffle already applied). Dice that look the same (color, enhancements,
+    score bonus, faces) share a kind, and a die is coded kind * 8 + face (face 0 = about to be rerolled).
+    Plain colors that no charm or boss singles out only matter through which dice match, so kinds differing
+    only in such a color are relabeled away: states are canonical code multisets and every value is memoized
+    on them - later queries in the same hand mostly hit the cache.
+    Random boss effects (Reroll Rebound, Hold Hazard, Die Drain) are not modelled.
+    """
+    def __init__(self, snapshot, dice, face_lists, no_hold_colors=(), max_reroll_holds=None):
+        self.snapshot = snapshot
+        self.max_reroll_holds = max_reroll_holds  # Hold Limit / Hold Ban: cap on dice held through a reroll
+        self.kind_of = []  # Die position -> kind index
+        self.kind_dice = []  # Kind index -> representative die
+        self.kind_faces = []  # Kind index -> [(face, probability)]
+        self.unholdable = set()  # Kinds Glass Guard won't let you hold
+        plain = plain_colors(snapshot, no_hold_colors)
+        seen = {}
+        groups = {}  # (enhancements, score bonus, faces) -> interchangeable plain kinds
+        for die, faces in zip(dice, face_lists):
+            key = (die['color'], tuple(die.get('enhancements', ())), die.get('score_bonus', 0), tuple(sorted(faces)))
+            if key not in seen:
+                kind = seen[key] = len(self.kind_dice)
+                if die['color'] in no_hold_colors:
+                    self.unholdable.add(kind)
+                if die['color'] in plain:
+                    groups.setdefault(key[1:], []).append(kind)
+                self.kind_dice.append(die)
+                self.kind_faces.append([(face, p) for face, p in enumerate(face_probs(faces).tolist()) if p])
+            self.kind_of.append(seen[key])
+        self.symmetric = [kinds for kinds in groups.values() if len(kinds) > 1]
+        self.canonical_cache = {}  # sorted codes -> canonical codes
+        self.score_cache = {}  # (held codes, before_reroll) -> final score
+        self.best_cache = {}  # (state, before_reroll) -> best score with any hold
+        self.value_cache = {}  # (state, rerolls_left) -> expected score under best play (after a reroll)
+        self.expect_cache = {}  # (move, rerolls_left) -> expected score after making the move
+        self.outcome_cache = {}  # rerolled kinds -> [(outcome codes, probability)]
+        self.move_cache = {}  # move -> [(next state, probability)]
+        self.split_cache = {}  # (state, limit) -> [(kept codes, move)] for every distinct hold
+        self.reroll_cache = {}  # (state, rerolls_left) -> (expected score, move) of the best reroll
+
+    def canonical(self, codes):
+        """Sorted codes with interchangeable kinds relabeled in a fixed order (by the faces they show)."""
+        codes = tuple(sorted(codes))
+        if not self.symmetric:
+            return codes
+        result = self.canonical_cache.get(codes)
+        if result is not None:
+            return result
+        faces = {}
+        for code in codes:
+            faces.setdefault(code >> 3, []).append(code & 7)
+        relabel = {}
+        for kinds in self.symmetric:
+            present = sorted((k for k in kinds if k in faces), key=lambda k: sorted(faces[k]), reverse=True)
+            for new, old in zip(kinds, present):
+                relabel[old] = new
+        result = self.canonical_cache[codes] = tuple(sorted((relabel.get(code >> 3, code >> 3) << 3) | (code & 7)
+                                                            for code in codes))
+        return result
+
+    def score(self, held, before_reroll):
+        """Final score of holding exactly the dice coded in held (canonical)."""
+        key = (held, before_reroll)
+        result = self.score_cache.get(key)
+        if result is None:
+            rolls = tuple((self.kind_dice[code >> 3], code & 7) for code in held)
+            snap = self.snapshot._replace(rolls=rolls, held=(True,) * len(rolls), before_reroll=before_reroll)
+            result = self.score_cache[key] = score_hand(snap)[0].final_score
+        return result
+
+    def splits(self, state, limit=None):
+        """Every distinct way to hold part of state: (kept codes, move), where a move codes the rerolled dice
+        as face 0 so one canonical tuple stands for the whole reroll.
+        """
+        key = (state, limit)
+        result = self.split_cache.get(key)
+        if result is None:
+            pairs = {}
+            for held_idx, rerolled_idx in _MASK_SPLITS[len(state)]:
+                if limit is not None and len(held_idx) > limit:
+                    continue
+                kept = tuple(state[i] for i in held_idx)
+                if kept in pairs or self.unholdable and any(code >> 3 in self.unholdable for code in kept):
+                    continue
+                pairs[kept] = self.canonical(kept + tuple(state[i] & ~7 for i in rerolled_idx))
+            result = self.split_cache[key] = list(pairs.items())
+        return result
+
+    def best_score(self, state, before_reroll):
+        key = (state, before_reroll)
+        result = self.best_cache.get(key)
+        if result is None:
+            result = self.best_cache[key] = max(self.score(self.canonical(kept), before_reroll)
+                                                for kept, _ in self.splits(state))
+        return result
+
+    def outcomes(self, rerolled):
+        """Distribution of sorted codes for rerolling the given kinds."""
+        result = self.outcome_cache.get(rerolled)
+        if result is None:
+            dist = Counter()
+            for combo in product(*[[(kind * 8 + face, p) for face, p in self.kind_faces[kind]] for kind in rerolled]):
+                prob = 1.0
+                for _, p in combo:
+                    prob *= p
+                dist[tuple(sorted(code for code, _ in combo))] += prob
+            result = self.outcome_cache[rerolled] = list(dist.items())
+        return result
+
+    def move_outcomes(self, move):
+        """[(next state, probability)] for making a move."""
+        result = self.move_cache.get(move)
+        if result is None:
+            kept = tuple(code for code in move if code & 7)
+            rerolled = tuple(code >> 3 for code in move if not code & 7)
+            result = self.move_cache[move] = [(self.canonical(kept + outcome), p) for outcome, p in self.outcomes(rerolled)]
+        return result
+
+    def expect(self, move, rerolls_left):
+        """Expected score after making a move (then playing on optimally)."""
+        key = (move, rerolls_left)
+        result = self.expect_cache.get(key)
+        if result is None:
+            result = 0.0
+            if rerolls_left == 1:  # Last reroll: just score the best hold of each outcome
+                for state, prob in self.move_outcomes(move):
+                    result += prob * self.best_score(state, False)
+            else:
+                for state, prob in self.move_outcomes(move):
+                    result += prob * self.value(state, rerolls_left - 1)
+            self.expect_cache[key] = result
+        return result
+
+    def best_reroll(self, state, rerolls_left):
+        """(expected score, move) for the best hold to reroll state with."""
+        key = (state, rerolls_left)
+        result = self.reroll_cache.get(key)
+        if result is None:
+            result = self.reroll_cache[key] = max((self.expect(move, rerolls_left), move)
+                                                  for _, move in self.splits(state, self.max_reroll_holds))
+        return result
+
+    def value(self, state, rerolls_left):
+        """Expected final score of state (after a reroll) choosing optimally between scoring and rerolling."""
+        key = (state, rerolls_left)
+        result = self.value_cache.get(key)
+        if result is None:
+            result = self.best_score(state, False)
+            if rerolls_left > 0:
+                result = max(result, self.best_reroll(state, rerolls_left)[0])
+            self.value_cache[key] = result
+        return result
+
+    def evaluate(self, values, rerolls_left, before_reroll=False):
+        """Rates all hold masks for the dice showing values (before_reroll: no reroll used yet this hand).
+        Returns [(expected_score, action, held_mask)] best first; action is 'score' or 'reroll'.
+        """
+        n = len(values)
+        codes = [self.kind_of[i] * 8 + values[i] for i in range(n)]
+        options = []
+        for bits in range(1 << n):
+            mask = tuple(bool(bits >> i & 1) for i in range(n))
+            kept = [codes[i] for i in range(n) if mask[i]]
+            if any(code >> 3 in self.unholdable for code in kept):
+                continue
+            options.append((self.score(self.canonical(kept), before_reroll), 'score', mask))
+            if rerolls_left > 0 and (self.max_reroll_holds is None or len(kept) <= self.max_reroll_holds):
+                move = self.canonical(kept + [codes[i] & ~7 for i in range(n) if not mask[i]])
+                options.append((self.expect(move, rerolls_left), 'reroll', mask))
+        options.sort(key=lambda option: (-option[0], option[1] == 'reroll'))  # Ties: score now rather than reroll
+        return options
+
+    def score_distribution(self, kinds, rerolls_left, before_reroll=True):
+        """Final score distribution ({score: probability}) when dice of the given kinds are rolled fresh and
+        played with the expected-score-optimal holds. Kind indices follow the dice passed to the constructor.
+        """
+        dist = Counter()
+        frontier = self.move_outcomes(self.canonical([kind << 3 for kind in kinds]))  # Opening roll of every die
+        while frontier:
+            moves = Counter()  # States that reroll the same way share one expansion
+            for state, prob in frontier:
+                score_now = self.best_score(state, before_reroll)
+                if rerolls_left > 0:
+                    expected, move = self.best_reroll(state, rerolls_left)
+                    if expected > score_now:
+                        moves[move] += prob
+                        continue
+                dist[score_now] += prob
+            next_states = Counter()
+            for move, prob in moves.items():
+                for state, p in self.move_outcomes(move):
+                    next_states[state] += prob * p
+            frontier = list(next_states.items())
+            rerolls_left -= 1
+            before_reroll = False
+        return dist
@@ -0,0 +1,118 @@
+# check_hands.py
+# Equivalence check: hand_table.classify_hand and hand_eval.evaluate_hands against the original
+# get_hand_type_and_score (read from git history) over every held face multiset x Four Fingers x wild faces x boss
+import argparse
+import ast
+import itertools
+import os
+import random
+import subprocess
+import sys
+import textwrap
+import types
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import ChromaRoll
+import data
+import hand_eval
+from hand_table import classify_hand
+
+BOSSES = (None, 'Value Vault', 'Score Dip', 'Color Fade', 'Mono Mixup')  # The ones that touch type, base or modifier
+COLOR_NAMES = list(hand_eval.COLOR_CODES)
+FOUR_FINGERS = {'name': 'Four Fingers Charm', 'type': 'short_straight'}
+
+
+def git(*args):
+    return subprocess.run(['git', *args], capture_output=True, text=True, check=True,
+                          cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+
+
+def load_baseline(rev=None):
+    """get_hand_type_and_score from ChromaRoll.py at rev (default: just before hand_eval.py was added), patched
+    to also return the color modifier. Runs against a stand-in game object, see fake_game.
+    """
+    if rev is None:
+        rev = git('log', '--diff-filter=A', '--format=%H', '--', 'hand_eval.py').split()[-1] + '^'
+    source = git('show', f'{rev}:ChromaRoll.py')
+    method = next(node for node in ast.walk(ast.parse(source))
+                  if isinstance(node, ast.FunctionDef) and node.name == 'get_hand_type_and_score')
+    method_source = textwrap.dedent(ast.get_source_segment(source, method))
+    for old, new in (('return "Nothing", 0, "None", 0, 0, 0.0', 'return "Nothing", 0, "None", 0, 0, 0.0, 0.0'),
+                     ('return hand_type, base_score, modifier_desc, final_score, charm_chips, charm_color_mult_add',
+                      'return hand_type, base_score, modifier_desc, final_score, charm_chips, charm_color_mult_add, base_modifier')):
+        if method_source.count(old) != 1:
+            sys.exit(f"{rev}: get_hand_type_and_score doesn't look like the original (no `{old}`)")
+        method_source = method_source.replace(old, new)
+    namespace = {}
+    exec(method_source, dict(vars(ChromaRoll)), namespace)
+    return namespace['get_hand_type_and_score']
+
+
+def fake_game(rolls, held, charms, boss):
+    """Just the fields the original scoring read, with neutral counters."""
+    return types.SimpleNamespace(
+        rolls=rolls, held=held, equipped_charms=list(charms), disabled_charms=[],
+        current_blind='Boss' if boss else 'Small', current_boss_effect={'name': boss} if boss else None,
+        boss_rainbow_color='Red', max_charms=5, score_mult=1.0, hand_multipliers={h: 1.0 for h in data.HAND_TYPES},
+        coins=0, avoid_streak=0, full_bag=[], stake_milestones=0, discards_used_this_round=0, rerolls_left=2,
+        rerolls_left_initial=2, lucky_triggers=0, broken_dice=[], discards_left=0)
+
+
+def cases(rng, colorings):
+    """(faces, colors, held) rows: each held multiset at shuffled positions, the rest filled with unheld dice."""
+    for size in range(1, 6):
+        for multiset in itertools.combinations_with_replacement(range(1, 7), size):
+            for _ in range(colorings):
+                faces = list(multiset) + [rng.randint(1, 6) for _ in range(5 - size)]
+                held = [True] * size + [False] * (5 - size)
+                palette = rng.sample(COLOR_NAMES, rng.randint(1, 3))
+                colors = [rng.choice(palette) for _ in range(5)]
+                order = rng.sample(range(5), 5)
+                yield [faces[i] for i in order], [colors[i] for i in order], [held[i] for i in order]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the hand table and vectorized evaluator against the original scoring")
+    parser.add_argument('--rev', help="git revision holding the original get_hand_type_and_score (default: before hand_eval.py)")
+    parser.add_argument('--colorings', type=int, default=2, help="random colorings per face multiset")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.rev)
+    rows = list(cases(random.Random(args.seed), args.colorings))
+    checked = mismatches = 0
+    for four_fingers in (False, True):
+        for wild_count in range(7):
+            for wild_faces in itertools.combinations(range(1, 7), wild_count):
+                charms = ([FOUR_FINGERS] if four_fingers else []) + [
+                    {'name': f'Wild {face}', 'type': 'face_wild', 'face': face} for face in wild_faces]
+                for boss in BOSSES:
+                    expected = []
+                    for faces, colors, held in rows:
+                        rolls = [({'id': i, 'color': c}, v) for i, (c, v) in enumerate(zip(colors, faces))]
+                        hand_type, base_score, *_, modifier = baseline(fake_game(rolls, held, charms, boss))
+                        expected.append((hand_type, base_score, modifier))
+                    types_, bases, modifiers = hand_eval.evaluate_hands(
+                        [r[0] for r in rows], [[hand_eval.COLOR_CODES[c] for c in r[1]] for r in rows], [r[2] for r in rows],
+                        four_fingers=four_fingers, wild_faces=wild_faces, boss_effect=boss)
+                    for i, (faces, colors, held) in enumerate(rows):
+                        got = {'evaluate_hands': (hand_eval.HAND_TYPE_NAMES[types_[i]], int(bases[i]), float(modifiers[i]))}
+                        want = {'evaluate_hands': expected[i]}
+                        if boss in (None, 'Value Vault'):  # The table covers type and base score, no colors
+                            hand = classify_hand([v for v, h in zip(faces, held) if h], four_fingers, frozenset(wild_faces),
+                                                 boss == 'Value Vault')
+                            got['classify_hand'] = (hand.hand_type, hand.base_score)
+                            want['classify_hand'] = expected[i][:2]
+                        for name in got:
+                            checked += 1
+                            if got[name] != want[name]:
+                                mismatches += 1
+                                if mismatches <= 20:
+                                    print(f"{name}: faces={faces} colors={colors} held={held} four_fingers={four_fingers} "
+                                          f"wilds={wild_faces} boss={boss}: got {got[name]}, original {want[name]}")
+    print(f"{checked} comparisons, {mismatches} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
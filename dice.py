@@ -0,0 +1,248 @@
+# dice.py
+# Compact die type: interned color code, faces tuple and enhancement bitset behind the old dict-style access
+from collections.abc import Sequence
+import numpy as np
+from constants import COLORS, DICE_FACES
+from data import ENH_DESC
+
+COLOR_NAMES = list(COLORS)  # Color code -> name
+COLOR_CODES = {name: code for code, name in enumerate(COLOR_NAMES)}
+ENHANCEMENT_NAMES = list(ENH_DESC)  # Enhancement bit -> name (new names, e.g. editions, register on first use)
+ENHANCEMENT_BITS = {name: bit for bit, name in enumerate(ENHANCEMENT_NAMES)}
+
+
+def color_code(name):
+    code = COLOR_CODES.get(name)
+    if code is None:
+        code = COLOR_CODES[name] = len(COLOR_NAMES)
+        COLOR_NAMES.append(name)
+    return code
+
+
+def enhancement_bit(name):
+    bit = ENHANCEMENT_BITS.get(name)
+    if bit is None:
+        bit = ENHANCEMENT_BITS[name] = len(ENHANCEMENT_NAMES)
+        ENHANCEMENT_NAMES.append(name)
+    return bit
+
+
+_FACE_CACHE = {}  # Faces tuple -> (probability of each value 0-6, cumulative) - dice with equal faces share one
+
+
+def _face_entry(faces):
+    entry = _FACE_CACHE.get(faces)
+    if entry is None:
+        probs = np.bincount(faces, minlength=7) / len(faces)
+        cumulative = np.cumsum(probs)
+        cumulative[-1] = 1.0  # No float shortfall for roll_faces to fall through
+        entry = _FACE_CACHE[faces] = (probs, cumulative)
+    return entry
+
+
+def face_probs(faces):
+    """Exact chance of rolling each value (index = face value, 0-6) on a die with these faces - duplicates
+    (Strength) count twice. Cached on the faces tuple, so a die that gets new faces simply maps to a new entry.
+    """
+    return _face_entry(tuple(faces))[0]
+
+
+def roll_faces(face_lists, gen, n=None):
+    """Rolls one die per face list with a single vectorized draw from the NumPy Generator gen.
+    Returns a list of values, or with n an (n, len(face_lists)) array of n independent rolls.
+    """
+    cumulative = np.array([_face_entry(tuple(faces))[1] for faces in face_lists])
+    u = gen.random(len(face_lists) if n is None else (n, len(face_lists)))
+    values = (u[..., None] >= cumulative).sum(axis=-1)
+    return values.tolist() if n is None else values
+
+
+class Die:
+    """One die. Reads like the old dict (die['color'], die.get('score_bonus', 0), 'enhancements' in die) so
+    the rules and screens don't care, but every field is immutable or an int, so copies are one small object.
+    Enhancements are a set of flags (no duplicates, listed in ENHANCEMENT_NAMES order): use add_enhancement,
+    die['enhancements'] is a read-only tuple. to_dict/from_dict give the save.json shape.
+    """
+    __slots__ = ('id', 'code', 'faces', 'enh', 'score_bonus', 'is_temp')
+    _KEYS = ('id', 'color', 'faces', 'enhancements', 'score_bonus', 'is_temp')
+    revision = 0  # Bumped whenever any die's color or enhancements change (screens cache what dice look like)
+
+    def __init__(self, id, color, faces=DICE_FACES, enhancements=(), score_bonus=0, is_temp=False):
+        self.id = id
+        self.code = color_code(color)
+        self.faces = tuple(faces)
+        self.enh = 0
+        for name in enhancements:
+            self.enh |= 1 << enhancement_bit(name)
+        self.score_bonus = score_bonus
+        self.is_temp = is_temp  # Debug-forced die that isn't in the bag
+
+    @classmethod
+    def from_dict(cls, d):
+        if isinstance(d, Die):
+            return d
+        return cls(d['id'], d['color'], d['faces'], d.get('enhancements', ()), d.get('score_bonus', 0),
+                   d.get('is_temp', False))
+
+    def to_dict(self):
+        d = {'id': self.id, 'color': self.color, 'faces': list(self.faces), 'enhancements': list(self.enhancements)}
+        if self.score_bonus:
+            d['score_bonus'] = self.score_bonus
+        if self.is_temp:
+            d['is_temp'] = True
+        return d
+
+    @property
+    def color(self):
+        return COLOR_NAMES[self.code]
+
+    @color.setter
+    def color(self, name):
+        self.code = color_code(name)
+        Die.revision += 1
+
+    @property
+    def enhancements(self):
+        enh = self.enh
+        return tuple(ENHANCEMENT_NAMES[bit] for bit in range(enh.bit_length()) if enh >> bit & 1)
+
+    @enhancements.setter
+    def enhancements(self, names):
+        self.enh = 0
+        for name in names:
+            self.enh |= 1 << enhancement_bit(name)
+        Die.revision += 1
+
+    @property
+    def face_probs(self):
+        return _face_entry(self.faces)[0]
+
+    def add_enhancement(self, name):
+        self.enh |= 1 << enhancement_bit(name)
+        Die.revision += 1
+
+    def has_enhancement(self, name):
+        bit = ENHANCEMENT_BITS.get(name)
+        return bit is not None and bool(self.enh >> bit & 1)
+
+    # Dict-style access for the existing die['color'] / die.get(...) call sites
+    def __getitem__(self, key):
+        if key == 'color':
+            return COLOR_NAMES[self.code]
+        if key in self._KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        setattr(self, key, tuple(value) if key == 'faces' else value)
+
+    def get(self, key, default=None):
+        return self[key] if key in self._KEYS else default
+
+    def __contains__(self, key):
+        return key in self._KEYS
+
+    def copy(self):
+        die = Die.__new__(Die)
+        die.id, die.code, die.faces, die.enh, die.score_bonus, die.is_temp = (
+            self.id, self.code, self.faces, self.enh, self.score_bonus, self.is_temp)
+        return die
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        return self.copy()  # Every field is immutable, so a shallow copy is already deep
+
+    def __eq__(self, other):
+        if not isinstance(other, Die):
+            return NotImplemented
+        return (self.id, self.code, self.faces, self.enh, self.score_bonus) == \
+            (other.id, other.code, other.faces, other.enh, other.score_bonus)
+
+    __hash__ = None  # Mutable like the dicts it replaces
+
+    def __repr__(self):
+        return f"Die({self.to_dict()!r})"
+
+
+class DiceBag(Sequence):
+    """Dice with an id -> position index, so lookups, membership and removal by id are O(1).
+    Removal swaps the last die into the hole, so the order is not kept (draws are random anyway; screens sort).
+    A die id is in the bag at most once - appending a die that's already in is a no-op.
+    draw() deals like a shuffled deck without ever shuffling: each draw is one Fisher-Yates step from the tail.
+    version goes up on every change to the contents, so views of the bag know when to redraw.
+    """
+    __slots__ = ('dice', 'pos', 'version')
+
+    def __init__(self, dice=()):
+        self.dice = []
+        self.pos = {}  # Die id -> index into dice
+        self.version = 0
+        self.extend(dice)
+
+    def __len__(self):
+        return len(self.dice)
+
+    def __getitem__(self, index):
+        return self.dice[index]
+
+    def __iter__(self):
+        return iter(self.dice)
+
+    def __contains__(self, die):
+        return die['id'] in self.pos
+
+    def get(self, die_id):
+        """The die with this id, or None."""
+        i = self.pos.get(die_id)
+        return None if i is None else self.dice[i]
+
+    def append(self, die):
+        if die['id'] not in self.pos:
+            self.pos[die['id']] = len(self.dice)
+            self.dice.append(die)
+            self.version += 1
+
+    def extend(self, dice):
+        for die in dice:
+            self.append(die)
+
+    def remove_id(self, die_id):
+        """Swap-removes the die with this id. Returns it, or None if it wasn't in the bag."""
+        i = self.pos.pop(die_id, None)
+        if i is None:
+            return None
+        die = self.dice[i]
+        last = self.dice.pop()
+        self.version += 1
+        if last is not die:
+            self.dice[i] = last
+            self.pos[last['id']] = i
+        return die
+
+    def remove(self, die):
+        if self.remove_id(die['id']) is None:
+            raise ValueError(f"{die['id']} not in bag")
+
+    def draw(self, rng, k=1):
+        """Removes and returns k random dice (fewer if the bag runs out), uniform without replacement, in O(k)."""
+        drawn = []
+        for _ in range(min(k, len(self.dice))):
+            drawn.append(self.remove_id(self.dice[rng.randrange(len(self.dice))]['id']))
+        return drawn
+
+    def refill(self, dice, rng=None, size=None):
+        """Replaces the contents (e.g. bag.refill(full_bag)). With size, keeps a uniform random subset of that
+        many dice instead (partial Fisher-Yates with rng) - Bag Bottleneck's half bag."""
+        dice = list(dice)
+        if size is not None and size < len(dice):
+            for i in range(size):
+                j = rng.randrange(i, len(dice))
+                dice[i], dice[j] = dice[j], dice[i]
+            del dice[size:]
+        self.dice.clear()
+        self.pos.clear()
+        self.version += 1
+        self.extend(dice)
@@ -0,0 +1,184 @@
+# hand_eval.py
+# Vectorized hand evaluation for balance sweeps (mirrors ChromaRollGame.get_hand_type_and_score)
+import numpy as np
+import constants
+import data
+from hand_table import BASE_SCORES
+
+HAND_TYPE_NAMES = ['Nothing'] + data.HAND_TYPES  # Row results are indices into this list
+HAND_TYPE_CODES = {name: i for i, name in enumerate(HAND_TYPE_NAMES)}
+COLOR_CODES = {name: i for i, name in enumerate(constants.COLORS)}  # Same order as the bag visual sort
+
+_RAINBOW_BIT = 1 << COLOR_CODES['Rainbow']
+_POPCOUNT = np.array([bin(i).count('1') for i in range(1 << len(COLOR_CODES))], dtype=np.int8)
+_BASE_SCORE_BY_CODE = np.array([BASE_SCORES[name] for name in HAND_TYPE_NAMES], dtype=np.int32)
+_DIPPED_SCORE_BY_CODE = np.array([int(BASE_SCORES[name] * 0.9) for name in HAND_TYPE_NAMES], dtype=np.int32)
+_RUNS_4 = [(1, 2, 3, 4), (2, 3, 4, 5), (3, 4, 5, 6)]
+_RUNS_3 = [(1, 2, 3), (2, 3, 4), (3, 4, 5), (4, 5, 6)]
+
+
+def encode_colors(color_rows):
+    """Converts nested lists of color names (e.g. from a bag) into an int array of color codes."""
+    return np.array([[COLOR_CODES[c] for c in row] for row in color_rows], dtype=np.int32)
+
+
+def _first_group(first_pos, exists, mask):
+    """Face (1-6) of the earliest-seen group where mask holds, or 0 if none (mimics dict insertion order)."""
+    pos = np.where(exists & mask, first_pos, 99)
+    face = pos.argmin(axis=1)
+    return np.where(pos[np.arange(len(pos)), face] < 99, face, 0)
+
+
+def _take(arr, face):
+    return arr[np.arange(len(arr)), face]
+
+
+def evaluate_hands(values, colors, held, four_fingers=False, wild_faces=(), boss_effect=None):
+    """Evaluates N hands at once. values/colors/held are (N, 5) arrays of faces (1-6), color codes and hold flags.
+    four_fingers/wild_faces mirror the equipped charms; boss_effect is the active Boss effect name (or None).
+    Returns (hand_type_codes, base_scores, color_modifiers) matching get_hand_type_and_score row for row.
+    """
+    values = np.asarray(values, dtype=np.int32)
+    colors = np.asarray(colors, dtype=np.int32)
+    held = np.asarray(held, dtype=bool)
+    n = len(values)
+    faces = np.arange(7)  # Column 0 unused so face f lives in column f
+    wild = np.zeros(7, dtype=bool)
+    for face in wild_faces:
+        wild[face] = True
+
+    bits = np.where(held, 1 << colors, 0)
+    nonrb = held & (colors != COLOR_CODES['Rainbow'])
+    n_held = held.sum(axis=1)
+    all_mask = np.bitwise_or.reduce(bits, axis=1)
+    all_nonrb = nonrb.sum(axis=1)
+
+    # Groups keyed by the original face: count, color mask, non-Rainbow length, first position seen
+    # (accumulated one die position at a time, which is much faster than reducing an (N, 5, 7) array)
+    is_face = held[:, :, None] & (values[:, :, None] == faces)  # (N, 5, 7)
+    counts = np.zeros((n, 7), dtype=np.int32)
+    group_mask = np.zeros((n, 7), dtype=np.int32)
+    group_nonrb = np.zeros((n, 7), dtype=np.int32)
+    first_pos = np.full((n, 7), 99, dtype=np.int32)
+    for pos in range(values.shape[1] - 1, -1, -1):
+        hit = is_face[:, pos]
+        counts += hit
+        group_mask |= np.where(hit, bits[:, pos, None], 0)
+        group_nonrb += hit & nonrb[:, pos, None]
+        first_pos[hit] = pos
+    group_len = counts.copy()
+
+    # Value Vault inverts the values used for straights and wild matching (groups stay on original faces)
+    rolled = 7 - values if boss_effect == 'Value Vault' else values
+    present = np.zeros((n, 7), dtype=bool)
+    for pos in range(values.shape[1]):
+        present[np.nonzero(held[:, pos])[0], rolled[held[:, pos], pos]] = True
+
+    # Wild faces: pile them onto the best non-wild group (counts keep the wild faces too)
+    is_wild = held & wild[rolled]
+    wild_count = is_wild.sum(axis=1)
+    wild_bits = np.bitwise_or.reduce(np.where(is_wild, bits, 0), axis=1)
+    wild_nonrb = (is_wild & nonrb).sum(axis=1)
+    key_rank = np.where((counts > 0) & ~wild, counts * 8 + faces, -1)
+    key = key_rank.argmax(axis=1)
+    apply = (wild_count > 0) & (_take(key_rank, key) >= 0)
+    rows = np.nonzero(apply)[0]
+    counts[rows, key[rows]] += wild_count[rows]
+    group_mask[rows, key[rows]] |= wild_bits[rows]
+    group_len[rows, key[rows]] += wild_count[rows]
+    group_nonrb[rows, key[rows]] += wild_nonrb[rows]
+    exists = counts > 0
+    exists[:, 0] = False
+    for face in np.nonzero(wild)[0]:
+        # Other wild-face groups lose every color that went wild (removal is by color, like the list filter)
+        strip = apply & (key != face) & (group_len[:, face] > 0)
+        keep = is_face[:, :, face] & ((bits & wild_bits[:, None]) == 0)
+        group_mask[strip, face] &= ~wild_bits[strip]
+        group_len[strip, face] = keep.sum(axis=1)[strip]
+        group_nonrb[strip, face] = (keep & nonrb).sum(axis=1)[strip]
+        exists[strip, face] = group_len[strip, face] > 0
+    max_count = counts.max(axis=1)
+    pair_count = (counts[:, 1:] == 2).sum(axis=1)
+
+    def mono(mask):
+        return _POPCOUNT[mask & ~_RAINBOW_BIT] <= 1
+
+    def distinct(mask, nonrb_len):
+        return _POPCOUNT[mask & ~_RAINBOW_BIT] == nonrb_len
+
+    # Straights use the (possibly inverted) rolled values
+    run4 = np.stack([present[:, list(r)].all(axis=1) for r in _RUNS_4], axis=1)
+    run3 = np.stack([present[:, list(r)].all(axis=1) for r in _RUNS_3], axis=1)
+    large5 = (n_held == 5) & (run4[:, 0] & present[:, 5] | run4[:, 1] & present[:, 6])
+    is_large = large5 | (four_fingers & run4.any(axis=1))
+    is_small = run4.any(axis=1) | (four_fingers & run3.any(axis=1))
+
+    conditions = [n_held == 0, max_count == 5, max_count == 4, (max_count == 3) & (pair_count > 0),
+                  is_large, is_small, max_count == 3, pair_count == 2, pair_count == 1]
+    names = ['Nothing', '5 of a Kind', '4 of a Kind', 'Full House', 'Large Straight', 'Small Straight',
+             '3 of a Kind', '2 Pair', 'Pair']
+    hand_type = np.select(conditions, [HAND_TYPE_CODES[name] for name in names], HAND_TYPE_CODES['Nothing'])
+    modifier = np.zeros(n)
+
+    # 5 of a Kind / Full House check every held color
+    all_mono = mono(all_mask)
+    all_distinct = distinct(all_mask, all_nonrb)
+    sel = hand_type == HAND_TYPE_CODES['5 of a Kind']
+    modifier[sel] = np.where(all_mono, 3.0, np.where(all_distinct, 2.0, 0.0))[sel]
+    sel = hand_type == HAND_TYPE_CODES['Full House']
+    if sel.any():
+        three_val = np.where(counts == 3, faces, 99).min(axis=1) % 99
+        pair_val = np.where(counts == 2, faces, 99).min(axis=1) % 99
+        mono_three = _take(exists, three_val) & mono(_take(group_mask, three_val))
+        mono_pair = _take(exists, pair_val) & mono(_take(group_mask, pair_val))
+        partial = np.where(mono_three & mono_pair, 1.0, np.where(mono_three | mono_pair, 0.5, 0.0))
+        modifier[sel] = np.where(all_mono, 3.0, np.where(all_distinct, 2.0, partial))[sel]
+
+    # Kinds and the single Pair score the first group (in roll order) with the matching count
+    for name, size, mono_bonus, distinct_bonus in (('4 of a Kind', 4, 2.0, 1.0), ('3 of a Kind', 3, 1.0, 0.5),
+                                                    ('Pair', 2, 0.5, 0.0)):
+        sel = hand_type == HAND_TYPE_CODES[name]
+        if not sel.any():
+            continue
+        face = _first_group(first_pos, exists, counts == size)
+        mask = _take(group_mask, face)
+        bonus = np.where(mono(mask), mono_bonus, np.where(distinct(mask, _take(group_nonrb, face)), distinct_bonus, 0.0))
+        modifier[sel] = np.where(face > 0, bonus, 0.0)[sel]
+
+    sel = hand_type == HAND_TYPE_CODES['2 Pair']
+    if sel.any():
+        mono_pairs = (exists & (group_len == 2) & mono(group_mask)).sum(axis=1)
+        modifier[sel] = np.select([mono_pairs == 1, mono_pairs == 2], [0.5, 1.0], 0.0)[sel]
+
+    # Straights score the colors of the groups along the chosen run
+    sel = (hand_type == HAND_TYPE_CODES['Large Straight']) | (hand_type == HAND_TYPE_CODES['Small Straight'])
+    if sel.any():
+        if four_fingers:
+            long_runs, short_runs = _RUNS_4, _RUNS_3
+            long_hit, short_hit = run4, run3
+        else:
+            long_runs, short_runs = [(1, 2, 3, 4, 5), (2, 3, 4, 5, 6)], _RUNS_4
+            long_hit = np.stack([run4[:, 0] & present[:, 5], ~(run4[:, 0] & present[:, 5])], axis=1)
+            short_hit = run4
+        is_ls = hand_type == HAND_TYPE_CODES['Large Straight']
+        run_mask = np.zeros(n, dtype=np.int32)
+        run_nonrb = np.zeros(n, dtype=np.int32)
+        chosen = np.zeros(n, dtype=bool)
+        for runs, hits, rows_sel in ((long_runs, long_hit, is_ls), (short_runs, short_hit, ~is_ls)):
+            for i, run in enumerate(runs):
+                take = sel & rows_sel & ~chosen & hits[:, i]
+                chosen |= take
+                for face in run:
+                    in_group = take & exists[:, face]
+                    run_mask[in_group] |= group_mask[in_group, face]
+                    run_nonrb[in_group] += group_nonrb[in_group, face]
+        bonus = np.where(mono(run_mask) | distinct(run_mask, run_nonrb), 1.0, 0.0)
+        modifier[sel] = bonus[sel]
+
+    base_score = (_DIPPED_SCORE_BY_CODE if boss_effect == 'Score Dip' else _BASE_SCORE_BY_CODE)[hand_type]
+    if boss_effect == 'Color Fade':
+        modifier[:] = 0.0
+    elif boss_effect == 'Mono Mixup':
+        modifier -= np.where(_POPCOUNT[all_mask] > 1, 0.5, 0.0)
+    modifier[n_held == 0] = 0.0
+    return hand_type, base_score, modifier
@@ -0,0 +1,91 @@
+# hand_table.py
+# Precomputed hand classification: every sorted face multiset is classified once so scoring is a dict lookup
+from collections import namedtuple
+from itertools import combinations, combinations_with_replacement
+import data
+
+BASE_SCORES = {'Nothing': 0, 'Pair': 20, '2 Pair': 60, '3 of a Kind': 80, '4 of a Kind': 160, '5 of a Kind': 250,
+               'Full House': 160, 'Small Straight': 90, 'Large Straight': 160}
+STRAIGHTS = [[1, 2, 3, 4], [2, 3, 4, 5], [3, 4, 5, 6]]  # Small Straights (also Four Fingers' short Large)
+SHORT_STRAIGHTS = [[1, 2, 3], [2, 3, 4], [3, 4, 5], [4, 5, 6]]  # Four Fingers' short Small Straights
+LARGE_STRAIGHTS = [[1, 2, 3, 4, 5], [2, 3, 4, 5, 6]]
+
+# counts/max_count/pair_count include wild faces; wild_key is the face the wilds were added to (or None).
+# counts is shared between lookups - treat it as read-only.
+HandClass = namedtuple('HandClass', ['hand_type', 'base_score', 'max_count', 'pair_count', 'counts', 'wild_key',
+                                     'is_small_straight', 'is_large_straight', 'straight_values'])
+
+
+def _classify(sorted_values, four_fingers, wild_faces, vault):
+    """Runs the hand-type ladder for one sorted multiset of held faces (no color checks)."""
+    counts = {v: sorted_values.count(v) for v in sorted(set(sorted_values))}  # Keyed by the faces as rolled
+    max_count = max(counts.values())
+    values = [7 - v for v in sorted_values] if vault else list(sorted_values)  # Value Vault inverts for straights/wilds
+    rolled = sorted(values)
+
+    wild_key = None
+    wild_count = sum(1 for v in values if v in wild_faces)
+    if wild_count > 0:
+        non_wild_counts = {k: c for k, c in counts.items() if k not in wild_faces}
+        if non_wild_counts:
+            wild_key = max(non_wild_counts, key=lambda k: (non_wild_counts[k], k))
+            counts[wild_key] += wild_count
+            max_count = max(counts.values())
+    pair_count = list(counts.values()).count(2)
+
+    runs = [s for s in STRAIGHTS if all(x in values for x in s)]
+    short_runs = [s for s in SHORT_STRAIGHTS if all(x in values for x in s)] if four_fingers else []
+    is_large_straight = rolled in LARGE_STRAIGHTS or (four_fingers and bool(runs))
+    is_small_straight = bool(runs) or bool(short_runs)
+
+    straight_values = []
+    if max_count == 5:
+        hand_type = "5 of a Kind"
+    elif max_count == 4:
+        hand_type = "4 of a Kind"
+    elif max_count == 3 and 2 in counts.values():
+        hand_type = "Full House"
+    elif is_large_straight:
+        hand_type = "Large Straight"
+        straight_values = runs[0] if four_fingers else rolled
+    elif is_small_straight:
+        hand_type = "Small Straight"
+        straight_values = short_runs[0] if four_fingers else runs[0]
+    elif max_count == 3:
+        hand_type = "3 of a Kind"
+    elif pair_count == 2:
+        hand_type = "2 Pair"
+    elif pair_count == 1:
+        hand_type = "Pair"
+    else:
+        hand_type = "Nothing"
+    return HandClass(hand_type, BASE_SCORES[hand_type], max_count, pair_count, counts, wild_key,
+                     is_small_straight, is_large_straight, tuple(straight_values))
+
+
+def _build_table():
+    """Classifies all 461 sorted hands of 1-5 dice for each Four Fingers / Value Vault / wild-face combination."""
+    wild_pool = sorted({c['face'] for c in data.CHARMS_POOL if c['type'] in ('face_wild', 'kind_wild') and 'face' in c})
+    wild_sets = [frozenset(s) for size in range(len(wild_pool) + 1) for s in combinations(wild_pool, size)]
+    table = {}
+    for size in range(1, 6):
+        for hand in combinations_with_replacement(range(1, 7), size):
+            for four_fingers in (False, True):
+                for vault in (False, True):
+                    for wild_faces in wild_sets:
+                        table[(hand, four_fingers, wild_faces, vault)] = _classify(hand, four_fingers, wild_faces, vault)
+    return table
+
+
+HAND_TABLE = _build_table()
+
+
+def classify_hand(values, four_fingers=False, wild_faces=frozenset(), vault=False):
+    """Looks up the classification of the held face values (any order). wild_faces must be a frozenset.
+    Faces outside 1-6 (or wild faces no charm in the pool uses) are classified on first sight and cached.
+    """
+    key = (tuple(sorted(values)), four_fingers, wild_faces, vault)
+    hand = HAND_TABLE.get(key)
+    if hand is None:
+        hand = HAND_TABLE[key] = _classify(key[0], four_fingers, wild_faces, vault)
+    return hand
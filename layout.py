@@ -0,0 +1,134 @@
+# layout.py
+# Screen geometry (die slots, buttons, charm slots, bag grid...) worked out once per window size.
+# Drawing and click/hover handling both read these rects, so what you see is what you click.
+import math
+import pygame
+import constants
+
+DIE_GAP = 20  # Between hand dice
+CHARM_GAP = 10  # Between charm dice on the game screen
+
+
+class BagGrid:
+    """The bag panel for a given dice count: its rect, column count and one slot rect per die (in drawn order)."""
+    __slots__ = ('rect', 'columns', 'slots')
+
+    def __init__(self, rect, columns, slots):
+        self.rect = rect
+        self.columns = columns
+        self.slots = slots
+
+
+class GameLayout:
+    """Rects for the game screen at one window size. Rebuilt by ChromaRollGame.update_layouts (resize, state entry)."""
+    def __init__(self, width, height):
+        self.size = (width, height)
+        step = constants.DIE_SIZE + DIE_GAP
+        start_x = (width - (constants.NUM_DICE_IN_HAND * step - DIE_GAP)) // 2
+        die_y = height - constants.DIE_SIZE - 100
+        held_size = constants.DIE_SIZE * constants.HELD_DIE_SCALE
+        held_offset = (constants.DIE_SIZE - held_size) / 2  # Held dice shrink around their slot's center
+        self.hand_slots = [pygame.Rect(start_x + i * step, die_y, constants.DIE_SIZE, constants.DIE_SIZE)
+                           for i in range(constants.NUM_DICE_IN_HAND)]
+        self.held_slots = [pygame.Rect(r.x + held_offset, r.y + held_offset, held_size, held_size) for r in self.hand_slots]
+
+        bottom_y = height - constants.BUTTON_HEIGHT - 20
+        self.discard_rect = pygame.Rect(50, bottom_y, constants.BUTTON_WIDTH, constants.BUTTON_HEIGHT)
+        self.start_roll_rect = pygame.Rect(width - constants.BUTTON_WIDTH - 50, bottom_y, constants.BUTTON_WIDTH, constants.BUTTON_HEIGHT)
+        self.reroll_rect = pygame.Rect(width // 2 - constants.BUTTON_WIDTH - 20, bottom_y, constants.BUTTON_WIDTH, constants.BUTTON_HEIGHT)
+        self.end_turn_rect = pygame.Rect(width // 2 + 20, bottom_y, constants.BUTTON_WIDTH, constants.BUTTON_HEIGHT)
+
+        size = constants.MULTIPLIERS_BUTTON_SIZE
+        self.multipliers_button_rect = pygame.Rect(width - size - 10, height - size - 100, size, size)
+        self.multipliers_panel_rect = pygame.Rect(width - constants.MULTIPLIERS_PANEL_WIDTH - 10,
+                                                  height - constants.MULTIPLIERS_PANEL_HEIGHT - size - 120,
+                                                  constants.MULTIPLIERS_PANEL_WIDTH, constants.MULTIPLIERS_PANEL_HEIGHT)
+
+        # Rune tray sits left of where a 5-column bag would start, so it doesn't jump as the bag grows
+        tray_step = constants.TRAY_SLOT_SIZE + constants.TRAY_SLOT_SPACING
+        tray_x = max(width - self.bag_width(5) - 20 - (2 * tray_step - constants.TRAY_SLOT_SPACING) - 10, 10)
+        self.tray_slots = [pygame.Rect(tray_x + i * tray_step, 50, constants.TRAY_SLOT_SIZE, constants.TRAY_SLOT_SIZE)
+                           for i in range(2)]
+        self.bag_grids = {}  # Dice count -> BagGrid
+
+    def hand_die_rect(self, i, held):
+        return self.held_slots[i] if held else self.hand_slots[i]
+
+    def charm_rect(self, i):
+        return pygame.Rect(50 + i * (constants.CHARM_SIZE + CHARM_GAP), 10, constants.CHARM_SIZE, constants.CHARM_SIZE)
+
+    @staticmethod
+    def bag_width(columns):
+        return columns * (constants.SMALL_DIE_SIZE + constants.SMALL_DIE_SPACING) - constants.SMALL_DIE_SPACING + 2 * constants.BAG_PADDING
+
+    def bag(self, num_dice):
+        """The bag panel holding num_dice (6 columns past 30 dice), hugging the top right."""
+        grid = self.bag_grids.get(num_dice)
+        if grid is None:
+            columns = 6 if num_dice > 30 else 5
+            rows = math.ceil(num_dice / columns)
+            step = constants.SMALL_DIE_SIZE + constants.SMALL_DIE_SPACING
+            bag_width = self.bag_width(columns)
+            rect = pygame.Rect(self.size[0] - bag_width - 10, 50, bag_width, rows * step - constants.SMALL_DIE_SPACING + 2 * constants.BAG_PADDING)
+            slots = [pygame.Rect(rect.x + constants.BAG_PADDING + col * step, rect.y + constants.BAG_PADDING + row * step,
+                                 constants.SMALL_DIE_SIZE, constants.SMALL_DIE_SIZE)
+                     for row, col in (divmod(j, columns) for j in range(num_dice))]
+            grid = self.bag_grids[num_dice] = BagGrid(rect, columns, slots)
+        return grid
+
+
+class BlindsLayout:
+    """Rects for the blinds screen at one window size."""
+    BOX_WIDTH, BOX_HEIGHT = 150, 100
+    BOX_SPACING = 50
+    PANEL_WIDTH, PANEL_HEIGHT = 300, 300  # Debug boss dropdown
+    ITEM_HEIGHT = 25
+
+    def __init__(self, width, height):
+        self.size = (width, height)
+        start_x = (width - (3 * self.BOX_WIDTH + 2 * self.BOX_SPACING)) // 2
+        self.blind_boxes = [pygame.Rect(start_x + i * (self.BOX_WIDTH + self.BOX_SPACING), height // 3, self.BOX_WIDTH, self.BOX_HEIGHT)
+                            for i in range(3)]
+        self.continue_rect = pygame.Rect(width // 2 - constants.BUTTON_WIDTH // 2, height // 2 + 100, constants.BUTTON_WIDTH, constants.BUTTON_HEIGHT)
+        self.debug_button_rect = pygame.Rect(width - 200, height - 100, 180, 40)
+        self.debug_jump_rect = pygame.Rect(width - 200, height - 60, 180, 40)
+
+        # Dropdown above the select button, hugging the right; below it if it would clip the top
+        panel_y = self.debug_button_rect.y - self.PANEL_HEIGHT - 10
+        if panel_y < 0:
+            panel_y = self.debug_button_rect.bottom + 10
+        self.panel_rect = pygame.Rect(width - self.PANEL_WIDTH - 10, panel_y, self.PANEL_WIDTH, self.PANEL_HEIGHT)
+        self.up_rect = pygame.Rect(self.panel_rect.right - 30, panel_y, 30, 30)
+        self.down_rect = pygame.Rect(self.panel_rect.right - 30, self.panel_rect.bottom - 30, 30, 30)
+        self.visible_items = self.PANEL_HEIGHT // self.ITEM_HEIGHT
+
+    def item_rect(self, row):
+        """Row row (0 = top visible effect) of the dropdown list, up to the scroll arrows."""
+        return pygame.Rect(self.panel_rect.x, self.panel_rect.y + row * self.ITEM_HEIGHT, self.PANEL_WIDTH - 30, self.ITEM_HEIGHT)
+
+
+class ShopLayout:
+    """The shop's fixed rects (equipped charm slots, rune tray, continue and debug buttons) at one window size.
+    Shop and pack rows depend on what's for sale, so draw_shop_screen still lays those out and returns them.
+    """
+    def __init__(self, width, height):
+        self.size = (width, height)
+        # Continue sits left of the hand multipliers list (top right)
+        self.continue_rect = pygame.Rect(width - 200 - constants.BUTTON_WIDTH - 20, 50, constants.BUTTON_WIDTH, constants.BUTTON_HEIGHT)
+
+        # Rune tray centered under where the game screen's M button is, clamped to the bottom
+        size = constants.MULTIPLIERS_BUTTON_SIZE
+        anchor = pygame.Rect(width - size - 10, height - size - 100, size, size)
+        tray_step = constants.TRAY_SLOT_SIZE + constants.TRAY_SLOT_SPACING
+        tray_x = anchor.centerx - (2 * tray_step - constants.TRAY_SLOT_SPACING) // 2
+        tray_y = min(anchor.bottom + 10, height - constants.TRAY_SLOT_SIZE - 10)
+        self.tray_slots = [pygame.Rect(tray_x + i * tray_step, tray_y, constants.TRAY_SLOT_SIZE, constants.TRAY_SLOT_SIZE)
+                           for i in range(2)]
+
+        self.debug_rect = pygame.Rect(width - constants.DEBUG_BUTTON_SIZE[0] - 50, height - constants.DEBUG_BUTTON_SIZE[1] - 50,
+                                      *constants.DEBUG_BUTTON_SIZE)
+        self.debug_menu_rect = pygame.Rect(self.debug_rect.x, self.debug_rect.y - 60, 150, 50)  # Above the debug button
+
+    def equipped_charm_rect(self, i):
+        return pygame.Rect(50 + i * (constants.CHARM_BOX_WIDTH + constants.CHARM_SPACING), 150,
+                           constants.CHARM_BOX_WIDTH, constants.CHARM_BOX_HEIGHT)
@@ -0,0 +1,131 @@
+# odds.py
+# Chance of clearing a blind: DP over the hands left on canonical bag states, each hand played with the hold advisor
+import math
+from collections import Counter
+import numpy as np
+from advisor import HoldAdvisor, plain_colors
+
+
+def _die_key(die, faces):
+    return die['color'], tuple(die.get('enhancements', ())), die.get('score_bonus', 0), tuple(sorted(faces))
+
+
+class ClearOdds:
+    """Probability of scoring `need` more points within the hands left.
+    Each hand draws from the bag without replacement (refilling from the full bag when it runs low, like draw_hand)
+    and is rolled with the advisor's expected-score-optimal holds; discards and random boss effects aren't modelled,
+    so real optimal play can only do better. Plain-colored dice no charm or boss cares about are interchangeable,
+    so bags and hands are memoized on counts sorted within those groups. Scores are bucketed into `resolution`
+    steps of the target, which is what makes the result a (low, high) bracket rather than one number.
+    """
+    def __init__(self, snapshot, full_bag, faces_of=None, rerolls=2, no_hold_colors=(), max_reroll_holds=None,
+                 resolution=64):
+        faces_of = faces_of or (lambda die: die['faces'])
+        self.rerolls = rerolls
+        self.resolution = resolution
+        plain = plain_colors(snapshot, no_hold_colors)
+        kinds = {}
+        for die in full_bag:
+            kinds.setdefault(_die_key(die, faces_of(die)), die)
+        # Interchangeable kinds share a group; each group is contiguous so canonical() can sort counts within it
+        groups = {}
+        for key in kinds:
+            color, enhancements, bonus, faces = key
+            if color in plain:
+                group = ('plain', enhancements, bonus, faces)
+            else:
+                group = key
+            groups.setdefault(group, []).append(key)
+        self.kind_keys = [key for group in sorted(groups, key=repr) for key in sorted(groups[group])]
+        self.kind_index = {key: i for i, key in enumerate(self.kind_keys)}
+        self.group_slices = []
+        start = 0
+        for group in sorted(groups, key=repr):
+            self.group_slices.append((start, start + len(groups[group])))
+            start += len(groups[group])
+        dice = [kinds[key].copy() for key in self.kind_keys]  # Own copies: the DP may run on a worker thread while runes edit the bag
+        self.faces_of = faces_of
+        self.advisor = HoldAdvisor(snapshot, dice, [key[3] for key in self.kind_keys], no_hold_colors, max_reroll_holds)
+        self.full_counts = self.counts(full_bag)
+        self.hand_cache = {}  # canonical hand counts -> {score: probability}
+        self.draw_cache = {}  # canonical bag counts -> [(probability, hand counts, rest counts)]
+        self.value_cache = {}  # (mode, bag counts, hands_left, step) -> array of P(clear) by need in steps
+
+    def counts(self, dice):
+        """Canonical kind counts for a list of dice."""
+        counts = [0] * len(self.kind_keys)
+        for die in dice:
+            counts[self.kind_index[_die_key(die, self.faces_of(die))]] += 1
+        return self.canonical(counts)
+
+    def canonical(self, counts):
+        result = []
+        for start, end in self.group_slices:
+            result.extend(sorted(counts[start:end], reverse=True))
+        return tuple(result)
+
+    def hand_distribution(self, hand):
+        result = self.hand_cache.get(hand)
+        if result is None:
+            kinds = [kind for kind, n in enumerate(hand) for _ in range(n)]
+            result = self.hand_cache[hand] = self.advisor.score_distribution(kinds, self.rerolls)
+        return result
+
+    def draws(self, bag, hand_size=5):
+        """Every distinct (probability, hand, rest of bag) for drawing a hand from bag (refilled when low)."""
+        if sum(bag) < hand_size:
+            bag = self.full_counts
+        result = self.draw_cache.get(bag)
+        if result is None:
+            total = sum(bag)
+            size = min(hand_size, total)
+            ways = math.comb(total, size)
+            merged = Counter()
+            def pick(i, left, hand, weight):
+                if i == len(bag) - 1:
+                    if left <= bag[i]:
+                        full_hand = hand + [left]
+                        rest = [b - h for b, h in zip(bag, full_hand)]
+                        merged[(self.canonical(full_hand), self.canonical(rest))] += weight * math.comb(bag[i], left)
+                    return
+                for take in range(min(left, bag[i]) + 1):
+                    pick(i + 1, left - take, hand + [take], weight * math.comb(bag[i], take))
+            pick(0, size, [], 1)
+            result = self.draw_cache[bag] = [(weight / ways, hand, rest) for (hand, rest), weight in merged.items()]
+        return result
+
+    def value(self, mode, bag, hands_left, step):
+        """P(clear) for every need of 0..resolution steps. mode 'low' rounds scores down, 'high' rounds them up."""
+        key = (mode, bag, hands_left, step)
+        result = self.value_cache.get(key)
+        if result is None:
+            size = self.resolution + 1
+            result = np.zeros(size)
+            result[0] = 1.0
+            if hands_left > 0:
+                rounding = math.floor if mode == 'low' else math.ceil
+                for prob, hand, rest in self.draws(bag):
+                    later = self.value(mode, rest, hands_left - 1, step)
+                    for score, p in self.hand_distribution(hand).items():
+                        shift = min(rounding(score / step), size)
+                        # Needs up to the score are cleared outright; the rest carry over to the next hand
+                        result[1:shift] += prob * p
+                        if shift < size:
+                            result[max(shift, 1):] += prob * p * later[max(shift, 1) - shift:size - shift]
+            self.value_cache[key] = result
+        return result
+
+    def probability(self, need, bag, hands_left):
+        """(low, high) bounds on the chance to score need more points with hands_left hands from bag (dice list)."""
+        return self.probability_for_counts(need, self.counts(bag), hands_left)
+
+    def probability_for_counts(self, need, bag_counts, hands_left):
+        """probability() for a bag already turned into counts(), so it can be called away from the live dice."""
+        if need <= 0:
+            return 1.0, 1.0
+        if hands_left <= 0:
+            return 0.0, 0.0
+        step = max(1, math.ceil(need / self.resolution))
+        low = self.value('low', bag_counts, hands_left, step)[min(math.ceil(need / step), self.resolution)]
+        high = self.value('high', bag_counts, hands_left, step)[math.floor(need / step)]
+        return min(float(low), 1.0), min(float(high), 1.0)  # Float sums can creep past 1
@@ -0,0 +1,46 @@
+# rng.py
+# Per-game random streams: one seeded generator per subsystem, so a run replays exactly from its seed
+import random
+import numpy as np
+
+STREAMS = ('bag', 'rolls', 'shop', 'boss', 'enhancements')
+NUMPY_STREAMS = ('rolls',)  # NumPy Generators, so dice.roll_faces rolls a whole hand in one draw
+
+
+class GameRNG:
+    """Separate streams for bag draws, dice rolls, the shop, boss picks and enhancements (Lucky/Fragile rolls,
+    Glass breaks, rune effects) - random.Random, except rolls which is a NumPy Generator. Each stream is
+    seeded from the game seed plus its name, so e.g. rerolling the shop never shifts the dice rolls that
+    follow. Cosmetic randomness (the roll animation frames) stays on the global random module.
+    """
+    def __init__(self, seed=None):
+        self.seed = random.randrange(1 << 63) if seed is None else seed
+        for name in STREAMS:
+            stream = random.Random(f"{self.seed}:{name}")
+            if name in NUMPY_STREAMS:
+                stream = np.random.default_rng(stream.getrandbits(128))
+            setattr(self, name, stream)
+
+    def get_state(self):
+        """JSON-friendly state of every stream (stored in save.json)."""
+        state = {'seed': self.seed}
+        for name in STREAMS:
+            if name in NUMPY_STREAMS:
+                state[name] = getattr(self, name).bit_generator.state  # Plain dict of ints
+            else:
+                version, internal, gauss_next = getattr(self, name).getstate()
+                state[name] = [version, list(internal), gauss_next]
+        return state
+
+    def set_state(self, state):
+        """Restores streams saved by get_state (streams missing from an older save keep their fresh seed)."""
+        self.seed = state.get('seed', self.seed)
+        for name in STREAMS:
+            if name not in state:
+                continue
+            if name in NUMPY_STREAMS:
+                if isinstance(state[name], dict):  # Saves from before the stream moved to NumPy keep a fresh one
+                    getattr(self, name).bit_generator.state = state[name]
+            else:
+                version, internal, gauss_next = state[name]
+                getattr(self, name).setstate((version, tuple(internal), gauss_next))
@@ -4,6 +4,7 @@ import os
 import copy
 import data  # For restoring pouch by name
 import constants
+from dice import Die, DiceBag
 # At the top of savegame.py, ensure these imports are present (add any missing ones):
 from states.splash import SplashState
 from states.prompt import PromptState
@@ -25,8 +26,8 @@ def save_game(game):
         'version': 1,  # Add versioning for future-proofing (increment on breaking changes)
         'coins': game.coins,
         'extra_coins': game.extra_coins,
-        'bag': copy.deepcopy(game.bag),  # Deep copy for dicts/lists
-        'full_bag': copy.deepcopy(game.full_bag),
+        'bag': [die.to_dict() for die in game.bag],
+        'full_bag': [die.to_dict() for die in game.full_bag],
         'equipped_charms': copy.deepcopy(game.equipped_charms),
         'disabled_charms': game.disabled_charms[:],  # List copy
         'current_stake': game.current_stake,
@@ -85,11 +86,14 @@ def save_game(game):
         
         # Unlocks (new, deepcopy for dict)
         'unlocks': copy.deepcopy(game.unlocks),
-        'hand_multipliers': copy.deepcopy(game.hand_multipliers)
+        'hand_multipliers': copy.deepcopy(game.hand_multipliers),
+
+        # RNG streams (new) - a loaded run keeps drawing the same dice, rolls and shops
+        'rng': game.rng.get_state()
     }
     try:
         with open('save.json', 'w') as f:
-            json.dump(save_data, f, default=lambda o: o.__dict__ if hasattr(o, '__dict__') else o)
+            json.dump(save_data, f, default=lambda o: o.to_dict() if hasattr(o, 'to_dict') else o.__dict__ if hasattr(o, '__dict__') else o)  # Dice -> old dict shape
     except IOError as e:
         print(f"Error saving game: {e}")  # Basic logging; could set game.temp_message instead
 
@@ -105,6 +109,20 @@ STATE_MAP = {
     'PauseMenuState': PauseMenuState,
 }
 
+def link_dice(saved, owned):
+    """Saved die dicts -> the matching Die objects from owned (by id, preferring identical content), so the
+    loaded bag/hand/rolls share dice with full_bag again. Dice with no owner load standalone."""
+    by_id = {}
+    for die in owned:
+        by_id.setdefault(die['id'], []).append(die)
+    linked = []
+    for d in saved:
+        die = Die.from_dict(d)
+        candidates = by_id.get(die['id'], [])
+        i = next((i for i, c in enumerate(candidates) if c == die), 0 if candidates else None)
+        linked.append(candidates.pop(i) if i is not None else die)
+    return linked
+
 def load_game(game):
     """Loads the game state from JSON."""
     try:
@@ -123,8 +141,8 @@ def load_game(game):
         game.turn_initialized = save_data.get('turn_initialized', False)
         game.coins = save_data.get('coins', 0)
         game.extra_coins = save_data.get('extra_coins', 0)
-        game.bag = copy.deepcopy(save_data.get('bag', []))
-        game.full_bag = copy.deepcopy(save_data.get('full_bag', []))
+        full_bag = [Die.from_dict(d) for d in save_data.get('full_bag', [])]
+        bag = link_dice(save_data.get('bag', []), full_bag)
         game.equipped_charms = copy.deepcopy(save_data.get('equipped_charms', []))
         game.disabled_charms = save_data.get('disabled_charms', [])
         game.current_stake = save_data.get('current_stake', 1)
@@ -144,8 +162,22 @@ def load_game(game):
         game.rerolls_left = save_data.get('rerolls_left', constants.MAX_REROLLS)
         game.discards_left = save_data.get('discards_left', constants.MAX_DISCARDS)
         game.discard_used_this_round = save_data.get('discard_used_this_round', False)
-        game.hand = copy.deepcopy(save_data.get('hand', []))
-        game.rolls = copy.deepcopy(save_data.get('rolls', []))
+        game.hand = link_dice(save_data.get('hand', []), full_bag)
+        saved_rolls = save_data.get('rolls', [])
+        game.rolls = list(zip(link_dice([d for d, _ in saved_rolls], game.hand), [value for _, value in saved_rolls]))
+        # Older saves can repeat ids (dice were named by counting their color); the bags index by id, so renumber
+        taken = {die['id'] for die in full_bag}
+        seen = set()
+        for die in full_bag:
+            if die['id'] in seen:
+                n = 1
+                while f"{die['color']}{n}" in taken:
+                    n += 1
+                die['id'] = f"{die['color']}{n}"  # Shared object, so bag/hand/rolls follow
+                taken.add(die['id'])
+            seen.add(die['id'])
+        game.full_bag = DiceBag(full_bag)
+        game.bag = DiceBag(bag)
         game.held = save_data.get('held', [False] * constants.NUM_DICE_IN_HAND)
         game.discard_selected = save_data.get('discard_selected', [False] * constants.NUM_DICE_IN_HAND)
         game.is_discard_phase = save_data.get('is_discard_phase', False)
@@ -157,11 +189,13 @@ def load_game(game):
         game.upcoming_boss_effect = copy.deepcopy(save_data.get('upcoming_boss_effect', None))
         game.current_boss_effect = copy.deepcopy(save_data.get('current_boss_effect', None))
         game.boss_rainbow_color = save_data.get('boss_rainbow_color', None)
-        game.boss_shuffled_faces = copy.deepcopy(save_data.get('boss_shuffled_faces', {}))
+        game.boss_shuffled_faces = {die_id: tuple(faces) for die_id, faces in save_data.get('boss_shuffled_faces', {}).items()}
         game.boss_reroll_count = save_data.get('boss_reroll_count', 0)
         game.shop_charms = copy.deepcopy(save_data.get('shop_charms', []))
         game.available_packs = save_data.get('available_packs', [])
         game.shop_reroll_cost = save_data.get('shop_reroll_cost', 5)
+        if 'rng' in save_data:
+            game.rng.set_state(save_data['rng'])  # Old saves keep the fresh streams from __init__
         game.mute = save_data.get('mute', False)
         game.toggle_mute()  # Applies volumes immediately (ensures SFX are set correctly on load)
         game.hand_multipliers = copy.deepcopy(save_data.get('hand_multipliers', {}))
@@ -196,8 +230,7 @@ def load_game(game):
         # Unlocks (new)
         game.unlocks = copy.deepcopy(save_data.get('unlocks', {}))
 
-        # In load_game, remove/replace the existing if-block with:
-        game.apply_boss_face_shuffle()
+        game.reset_score_caches()  # Loaded charms/bag are new objects; drop what was cached for the old ones
 
         # Recompute hand/modifier texts based on loaded state
         game.update_hand_text()
@@ -0,0 +1,571 @@
+# scoring.py
+# Hand scoring: a pure score_hand(snapshot) plus the charm scorer registry it runs.
+# Equipped charms are compiled once per loadout; nothing here touches the game object.
+import itertools
+import random
+from collections import namedtuple
+from functools import partial
+from hand_table import classify_hand
+
+CHARM_SCORERS = {}  # charm['type'] -> scorer(charm, ctx); types with no in-hand effect are simply not registered
+CHARM_READS = {}  # charm['type'] -> ScoreSnapshot counters its scorer reads in previews (see CharmPipeline.counters)
+_pipeline_ids = itertools.count()  # CharmPipeline.signature: unique per pipeline, never reused like id() can be
+
+# Everything scoring reads, copied off the game. rolls are (die, face) pairs; the die dicts are shared, never mutated.
+# boss_effect is the active Boss effect name (None outside Boss blinds); charms is the compiled CharmPipeline.
+ScoreSnapshot = namedtuple('ScoreSnapshot', ['rolls', 'held', 'charms', 'boss_effect', 'boss_rainbow_color',
+                                             'hand_multipliers', 'coins', 'score_mult', 'empty_charm_slots',
+                                             'avoid_streak', 'bag_size', 'stake_milestones', 'discards_used',
+                                             'discards_left', 'before_reroll', 'is_last_hand', 'is_final_discard',
+                                             'is_preview'])
+# Same order as the tuple get_hand_type_and_score has always returned
+ScoreResult = namedtuple('ScoreResult', ['hand_type', 'base_score', 'modifier_desc', 'final_score', 'charm_chips',
+                                         'charm_color_mult_add'])
+# Side effects come back as (kind, value) pairs for the game to apply:
+#   ('coins', n) add coins, ('lucky_triggers', n) set this hand's Lucky triggers, ('broken_die', i) roll index broke
+NO_SCORE = ScoreResult("Nothing", 0, "None", 0, 0, 0.0)
+
+
+def charm_scorer(*charm_types, reads=()):
+    """Decorator that registers a scorer for one or more charm types.
+    reads names the ScoreSnapshot counters (coins, avoid_streak...) the scorer looks at when previewing, so caches
+    keyed on the loadout only watch the counters that can change a score.
+    """
+    def register(fn):
+        for charm_type in charm_types:
+            CHARM_SCORERS[charm_type] = fn
+            CHARM_READS[charm_type] = tuple(reads)
+        return fn
+    return register
+
+
+class ScoreContext:
+    """Per-hand inputs plus the running totals and side effects the charm scorers add to."""
+    def __init__(self, snap, held_rolls, colors_list, hand, hand_type, modifier_desc, lucky_triggers, effects):
+        self.snap = snap
+        self.held_rolls = held_rolls
+        self.colors_list = colors_list  # Held colors after Rainbow Restriction
+        self.hand = hand  # HandClass from hand_table
+        self.hand_type = hand_type
+        self.modifier_desc = modifier_desc
+        self.is_preview = snap.is_preview
+        self.is_mono = any("Mono" in d for d in modifier_desc)
+        self.is_rainbow = any("Rainbow" in d for d in modifier_desc)
+        self.lucky_triggers = lucky_triggers
+        self.coins = snap.coins + lucky_triggers  # Lucky coins land before the charms run
+        self.effects = effects
+        self.charm_chips = 0
+        self.charm_color_mult_add = 0.0
+        self.charm_mult_add = 0.0
+        self.active_charms = 0  # Set by CharmPipeline.run
+
+
+class CharmPipeline:
+    """Equipped charms flattened into bound scorers, plus the loadout flags scoring needs."""
+    def __init__(self, equipped_charms, disabled_charms):
+        self.charms = tuple(equipped_charms)  # The exact dicts compiled, compared by identity in matches()
+        self.disabled = tuple(disabled_charms)
+        self.signature = next(_pipeline_ids)  # Cache-key stand-in for this loadout (score previews)
+        active = [c for idx, c in enumerate(equipped_charms) if idx not in disabled_charms]
+        self.active_count = len(active)
+        self.has_four_fingers = any(c['type'] == 'short_straight' for c in active)
+        self.has_mime = any(c['type'] == 'retrigger_held' for c in active)
+        self.colors = frozenset(c['color'] for c in active if 'color' in c)  # Colors some charm singles out
+        # Wild faces apply even while the charm is disabled (matches the old scoring loop)
+        self.wild_faces = frozenset(c['face'] for c in equipped_charms if c['type'] in ('face_wild', 'kind_wild') and 'face' in c)
+        self.steps = [partial(CHARM_SCORERS[c['type']], c) for c in active if c['type'] in CHARM_SCORERS]
+        self.reads = tuple(sorted({name for c in active for name in CHARM_READS.get(c['type'], ())}))
+
+    def matches(self, equipped_charms, disabled_charms):
+        """True if this pipeline was compiled from these very charm dicts (same objects, same order) and disabled set."""
+        return (len(equipped_charms) == len(self.charms) and all(a is b for a, b in zip(equipped_charms, self.charms))
+                and tuple(disabled_charms) == self.disabled)
+
+    def counters(self, snap):
+        """The snapshot counters this loadout's preview scores depend on (empty for most loadouts)."""
+        return tuple(getattr(snap, name) for name in self.reads)
+
+    def run(self, ctx):
+        ctx.active_charms = self.active_count
+        for step in self.steps:
+            step(ctx)
+        return ctx
+
+
+def score_hand(snap, rng=random):
+    """Scores the held dice in snap (a ScoreSnapshot) without touching any game state.
+    Returns (ScoreResult, effects). Lucky/Fragile rolls use rng and only happen when snap.is_preview is False.
+    """
+    held_positions = [i for i, is_held in enumerate(snap.held) if is_held and i < len(snap.rolls)]
+    held_rolls = [snap.rolls[i] for i in held_positions]
+    if not held_rolls:
+        return NO_SCORE, []
+    is_preview = snap.is_preview
+    effects = []
+    values = [value for die, value in held_rolls]
+    colors_list = [die['color'] for die, value in held_rolls]
+
+    pipeline = snap.charms
+    has_four_fingers = pipeline.has_four_fingers
+    is_vault = snap.boss_effect == 'Value Vault'
+
+    wild_faces = pipeline.wild_faces
+
+    # Hand type, counts and straights come from the precomputed table (one dict lookup)
+    hand = classify_hand(values, has_four_fingers, wild_faces, is_vault)
+    hand_type = hand.hand_type
+    base_score = hand.base_score
+    counts = hand.counts
+    max_count = hand.max_count
+    pair_count = hand.pair_count
+    base_modifier = 0.0
+    modifier_desc = []  # List to collect descriptions, join later
+
+    # Group dice by value for color checks: {value: [colors]}
+    groups = {}
+    for (die, val) in held_rolls:
+        if val not in groups:
+            groups[val] = []
+        groups[val].append(die['color'])
+
+    # Move wild dice colors onto the group the wilds joined
+    if hand.wild_key is not None:
+        rolled_values = [7 - v for v in values] if is_vault else values
+        wild_colors = [colors_list[i] for i, v in enumerate(rolled_values) if v in wild_faces]  # Ensure flat list of strings
+        groups[hand.wild_key] = groups.get(hand.wild_key, []) + wild_colors
+        for wild_face in wild_faces:
+            if wild_face in groups and wild_face != hand.wild_key:
+                groups[wild_face] = [c for c in groups[wild_face] if c not in wild_colors]
+                if not groups[wild_face]:
+                    del groups[wild_face]
+
+    if hand_type == "5 of a Kind":
+        actual_colors = [c for c in colors_list if c != 'Rainbow']
+        actual_set = set(actual_colors)
+        if len(actual_set) <= 1:
+            base_modifier += 3.0
+            modifier_desc.append("Monochrome +3")
+        elif len(actual_colors) == len(actual_set):
+            base_modifier += 2.0
+            modifier_desc.append("Rainbow +2")
+    elif hand_type == "4 of a Kind":
+        for val, group_colors in groups.items():
+            if counts.get(val, 0) == 4:
+                actual_colors = [c for c in group_colors if c != 'Rainbow']
+                actual_set = set(actual_colors)
+                if len(actual_set) <= 1:
+                    base_modifier += 2.0
+                    modifier_desc.append("Monochrome +2")
+                elif len(actual_colors) == len(actual_set):
+                    base_modifier += 1.0
+                    modifier_desc.append("Rainbow +1")
+                break
+    elif hand_type == "Full House":
+        three_val = next((val for val, count in counts.items() if count == 3), None)
+        pair_val = next((val for val, count in counts.items() if count == 2), None)
+        three_group = groups.get(three_val, [])
+        pair_group = groups.get(pair_val, [])
+        actual_colors = [c for c in colors_list if c != 'Rainbow']
+        actual_set = set(actual_colors)
+        if len(actual_set) <= 1:
+            base_modifier += 3.0
+            modifier_desc.append("Full Mono +3")
+        elif len(actual_colors) == len(actual_set):
+            base_modifier += 2.0
+            modifier_desc.append("Rainbow +2")
+        else:
+            mono_three = len(set(c for c in three_group if c != 'Rainbow')) <= 1 if three_group else False
+            mono_pair = len(set(c for c in pair_group if c != 'Rainbow')) <= 1 if pair_group else False
+            if mono_three and mono_pair:
+                base_modifier += 1.0
+                modifier_desc.append("Both Mono +1")
+            elif mono_three or mono_pair:
+                base_modifier += 0.5
+                modifier_desc.append("One Mono +0.5")
+    elif hand_type in ("Large Straight", "Small Straight"):
+        straight_colors = []
+        for v in hand.straight_values:
+            straight_colors += groups.get(v, [])
+        actual_colors = [c for c in straight_colors if c != 'Rainbow']
+        actual_set = set(actual_colors)
+        if len(actual_set) <= 1:
+            base_modifier += 1.0
+            modifier_desc.append("Monochrome +1")
+        elif len(actual_colors) == len(actual_set):
+            base_modifier += 1.0
+            modifier_desc.append("Rainbow +1")
+    elif hand_type == "3 of a Kind":
+        for val, group_colors in groups.items():
+            if counts.get(val, 0) == 3:
+                actual_colors = [c for c in group_colors if c != 'Rainbow']
+                actual_set = set(actual_colors)
+                if len(actual_set) <= 1:
+                    base_modifier += 1.0
+                    modifier_desc.append("Monochrome +1")
+                elif len(actual_colors) == len(actual_set):
+                    base_modifier += 0.5
+                    modifier_desc.append("Rainbow +0.5")
+                break
+    elif hand_type == "2 Pair":
+        mono_pairs = 0
+        for group_colors in groups.values():
+            if len(group_colors) == 2:
+                actual_set = set(c for c in group_colors if c != 'Rainbow')
+                if len(actual_set) <= 1:
+                    mono_pairs += 1
+        if mono_pairs == 1:
+            base_modifier += 0.5
+            modifier_desc.append("One Mono Pair +0.5")
+        elif mono_pairs == 2:
+            base_modifier += 1.0
+            modifier_desc.append("Two Mono Pairs +1")
+    elif hand_type == "Pair":
+        for val, group_colors in groups.items():
+            if counts.get(val, 0) == 2:
+                actual_colors = [c for c in group_colors if c != 'Rainbow']
+                actual_set = set(actual_colors)
+                if len(actual_set) <= 1:
+                    base_modifier += 0.5
+                    modifier_desc.append("Monochrome +0.5")
+                break
+
+    if snap.boss_effect == 'Rainbow Restriction':
+        colors_list = [snap.boss_rainbow_color if c == 'Rainbow' else c for c in colors_list]
+
+    if snap.boss_effect:
+        effect_name = snap.boss_effect
+        if effect_name == 'Score Dip':
+            base_score = int(base_score * 0.9)
+        if effect_name == 'Color Fade':
+            base_modifier = 0.0
+            modifier_desc = ["None"]
+        if effect_name == 'Mono Mixup' and len(set(colors_list)) > 1:
+            base_modifier -= 0.5
+
+    rune_chips = 0
+    rune_mult_add = 0.0
+    lucky_triggers = 0
+    for pos, (die, value) in zip(held_positions, held_rolls):
+        enh = die.get('enhancements', [])
+        if 'Bonus' in enh:
+            rune_chips += 10
+        if 'Mult' in enh:
+            rune_mult_add += 0.5
+        if 'Lucky' in enh and not is_preview and rng.random() < 0.33:
+            lucky_triggers += 1  # +1 coin each
+        if 'Steel' in enh:
+            rune_mult_add += 0.5
+        if 'Fragile' in enh:
+            rune_mult_add += 1.0
+            if not is_preview and rng.random() < 0.25:
+                effects.append(('broken_die', pos))
+        if 'Stone' in enh:
+            rune_chips += 50
+
+    if not is_preview:
+        effects.append(('lucky_triggers', lucky_triggers))
+        if lucky_triggers:
+            effects.append(('coins', lucky_triggers))
+
+    charms = pipeline.run(ScoreContext(snap, held_rolls, colors_list, hand, hand_type, modifier_desc, lucky_triggers, effects))
+    charm_chips = charms.charm_chips
+    charm_color_mult_add = charms.charm_color_mult_add
+    charm_mult_add = charms.charm_mult_add
+
+    # Sum per-die bonuses for scored dice
+    for die, _ in held_rolls:
+        bonus = die.get('score_bonus', 0)
+        #  print(f"Die ID {die.get('id', 'no_id')} bonus: {bonus}")  # Debug: shows if/why 0
+        charm_chips += die.get('score_bonus', 0)
+
+    total_modifier = base_modifier + charm_color_mult_add + rune_mult_add + charm_mult_add
+
+    if hand_type in snap.hand_multipliers:
+        mult_add = snap.hand_multipliers[hand_type] - 1
+        total_modifier += mult_add
+        if mult_add > 0:
+            modifier_desc.append(f"Prism Pack +{mult_add}")
+
+    silence_glass = snap.boss_effect == 'Special Silence'
+
+    glass_count = sum(1 for die, _ in held_rolls if die['color'] == 'Glass')
+    glass_mult = (3 + glass_count) if glass_count > 0 and not silence_glass else 0
+    if glass_mult > 0:
+        total_modifier += glass_mult
+        modifier_desc.append(f"Glass +{glass_mult}")
+
+    if pipeline.has_mime and not silence_glass and glass_count > 0:
+        total_modifier += glass_mult
+        modifier_desc.append(f"Mime (Glass) +{glass_mult}")
+
+    if snap.boss_effect == 'Multiplier Mute':
+        total_modifier = min(total_modifier, 2.5)
+        if total_modifier >= 2.5:
+            modifier_desc.append("Multiplier Mute capped at +2.5")
+
+    modifier_desc = ", ".join(modifier_desc) if modifier_desc else "None"
+
+    final_score = int((base_score + charm_chips + rune_chips) * (1 + total_modifier))
+    return ScoreResult(hand_type, base_score, modifier_desc, final_score, charm_chips, charm_color_mult_add), effects
+
+
+@charm_scorer('flat_bonus')
+def _flat_bonus(charm, ctx):
+    ctx.charm_chips += charm['value']
+
+
+@charm_scorer('per_color_bonus')
+def _per_color_bonus(charm, ctx):
+    ctx.charm_chips += ctx.colors_list.count(charm['color']) * charm['value']
+
+
+@charm_scorer('hand_bonus')
+def _hand_bonus(charm, ctx):
+    hand = ctx.hand
+    for h in charm.get('hands', []):  # Burglar Bag shares the type but has no 'hands'
+        if h == 'Pair' and hand.max_count >= 2:
+            ctx.charm_chips += charm['value']
+        elif h == '2 Pair' and hand.pair_count >= 2:
+            ctx.charm_chips += charm['value']
+        elif h == '3 of a Kind' and hand.max_count >= 3:
+            ctx.charm_chips += charm['value']
+        elif h == '4 of a Kind' and hand.max_count >= 4:
+            ctx.charm_chips += charm['value']
+        elif h == '5 of a Kind' and hand.max_count == 5:
+            ctx.charm_chips += charm['value']
+        elif h == 'Full House' and hand.max_count == 3 and 2 in hand.counts.values():
+            ctx.charm_chips += charm['value']
+        elif h == 'Small Straight' and hand.is_small_straight:
+            ctx.charm_chips += charm['value']
+        elif h == 'Large Straight' and hand.is_large_straight:
+            ctx.charm_chips += charm['value']
+
+
+@charm_scorer('mono_mult_bonus')
+def _mono_mult_bonus(charm, ctx):
+    if ctx.is_mono:
+        ctx.charm_color_mult_add += charm['value']
+        ctx.modifier_desc.append(f"{charm['name']} +{charm['value']}")
+
+
+@charm_scorer('rainbow_mult_bonus')
+def _rainbow_mult_bonus(charm, ctx):
+    if ctx.is_rainbow:
+        ctx.charm_color_mult_add += charm['value']
+        ctx.modifier_desc.append(f"{charm['name']} +{charm['value']}")
+
+
+@charm_scorer('few_dice_bonus')
+def _few_dice_bonus(charm, ctx):
+    if len(ctx.held_rolls) <= charm['max_dice']:
+        ctx.charm_chips += charm['value']
+
+
+@charm_scorer('empty_slot_mult', reads=('empty_charm_slots',))
+def _empty_slot_mult(charm, ctx):
+    mult_add = charm['value'] * ctx.snap.empty_charm_slots
+    if mult_add > 0:
+        ctx.charm_mult_add += mult_add
+        ctx.modifier_desc.append(f"{charm['name']} +{mult_add}")
+
+
+@charm_scorer('per_value_bonus')
+def _per_value_bonus(charm, ctx):
+    count = 0
+    for _, value in ctx.held_rolls:
+        if (charm['parity'] == 'even' and value % 2 == 0) or (charm['parity'] == 'odd' and value % 2 != 0):
+            count += 1
+    ctx.charm_chips += count * charm['value']
+
+
+@charm_scorer('sacrifice_mult', reads=('score_mult',))
+def _sacrifice_mult(charm, ctx):
+    mult_add = ctx.snap.score_mult
+    if mult_add > 0:
+        ctx.charm_mult_add += mult_add
+        ctx.modifier_desc.append(f"{charm['name']} +{mult_add}")
+
+
+@charm_scorer('mult_bonus')
+def _mult_bonus(charm, ctx):
+    if 'hands' in charm and ctx.hand_type not in charm['hands']:
+        return
+    mult_add = charm['value'] - 1
+    ctx.charm_mult_add += mult_add
+    ctx.modifier_desc.append(f"{charm['name']} +{mult_add}")
+
+
+@charm_scorer('color_mult')
+def _color_mult(charm, ctx):
+    count = sum(1 for die, _ in ctx.held_rolls if die['color'] == charm['color'])
+    mult_add = count * charm['value']
+    if mult_add > 0:
+        ctx.charm_mult_add += mult_add
+        ctx.modifier_desc.append(f"{charm['name']} +{mult_add} ({count} {charm['color']})")
+
+
+@charm_scorer('color_mult_conditional')  # before_reroll is per query; preview_key and the advisor pass it themselves
+def _color_mult_conditional(charm, ctx):
+    if not ctx.snap.before_reroll:
+        return  # Only before any reroll
+    _color_mult(charm, ctx)
+
+
+@charm_scorer('mult_conditional')
+def _mult_conditional(charm, ctx):
+    if charm.get('mono', False):
+        if len(set(ctx.colors_list)) == 1:
+            mult_add = charm['value'] - 1
+            ctx.charm_mult_add += mult_add
+            ctx.modifier_desc.append(f"{charm['name']} +{mult_add}")
+    if charm.get('glass', False):
+        glass_count = sum(1 for die, _ in ctx.held_rolls if die['color'] == 'Glass' or 'Glass' in die.get('enhancements', []))
+        if glass_count > 0:
+            mult_add = charm['value'] - 1
+            ctx.charm_mult_add += mult_add
+            ctx.modifier_desc.append(f"{charm['name']} +{mult_add}")
+
+
+@charm_scorer('mult_per_face')
+def _mult_per_face(charm, ctx):
+    count = sum(1 for _, v in ctx.held_rolls if v in charm['faces'])
+    mult_add = charm['value'] * count
+    if mult_add > 0:
+        ctx.charm_mult_add += mult_add
+        ctx.modifier_desc.append(f"{charm['name']} +{mult_add} ({count} faces)")
+
+
+@charm_scorer('bonus_per_charm')
+def _bonus_per_charm(charm, ctx):
+    count = ctx.active_charms
+    mult_add = charm['mult'] * count
+    if mult_add > 0:
+        ctx.charm_mult_add += mult_add
+        ctx.modifier_desc.append(f"{charm['name']} +{mult_add} ({count} charms)")
+    ctx.charm_chips += charm['score'] * count
+
+
+@charm_scorer('mult_per_streak', reads=('avoid_streak',))
+def _mult_per_streak(charm, ctx):
+    mult_add = round(charm['value'] * ctx.snap.avoid_streak, 1)
+    if mult_add > 0:
+        ctx.charm_mult_add += mult_add
+        ctx.modifier_desc.append(f"{charm['name']} +{mult_add} ({ctx.snap.avoid_streak} streak)")
+
+
+@charm_scorer('mult_per_low_bag', reads=('bag_size',))
+def _mult_per_low_bag(charm, ctx):
+    low_count = max(0, 25 - ctx.snap.bag_size)
+    mult_add = charm['value'] * low_count
+    if mult_add > 0:
+        ctx.charm_mult_add += mult_add
+        ctx.modifier_desc.append(f"{charm['name']} +{mult_add} ({low_count} below 25)")
+
+
+@charm_scorer('mult_per_lucky')
+def _mult_per_lucky(charm, ctx):
+    mult_add = charm.get('permanent_bonus', 0.0)  # Only the permanent bonus; this hand's triggers count next time
+    if mult_add > 0:
+        ctx.charm_mult_add += mult_add
+        ctx.modifier_desc.append(f"{charm['name']} +{mult_add} (permanent)")
+
+
+@charm_scorer('mult_per_milestone', reads=('stake_milestones',))
+def _mult_per_milestone(charm, ctx):
+    mult_add = charm['value'] * ctx.snap.stake_milestones
+    if mult_add > 0:
+        ctx.charm_mult_add += mult_add
+        ctx.modifier_desc.append(f"{charm['name']} +{mult_add} ({ctx.snap.stake_milestones} milestones)")
+
+
+@charm_scorer('coin_per_lucky')
+def _coin_per_lucky(charm, ctx):
+    lucky_triggers = ctx.lucky_triggers
+    if not ctx.is_preview and lucky_triggers > 0:
+        coins_added = charm['value'] * lucky_triggers
+        ctx.coins += coins_added
+        ctx.effects.append(('coins', coins_added))
+        ctx.modifier_desc.append(f"{charm['name']} +{coins_added} coins ({lucky_triggers} lucky)")
+
+
+@charm_scorer('mult_per_enhance')
+def _mult_per_enhance(charm, ctx):
+    enhance_count = sum(1 for die, _ in ctx.held_rolls if die.get('enhancements'))
+    mult_add = charm['value'] * enhance_count
+    if mult_add > 0:
+        ctx.charm_mult_add += mult_add
+        ctx.modifier_desc.append(f"{charm['name']} +{mult_add} ({enhance_count} enhancements)")
+
+
+@charm_scorer('discard_mult', reads=('discards_used',))
+def _discard_mult(charm, ctx):
+    mult_add = charm['value'] * ctx.snap.discards_used
+    if mult_add > 0:
+        ctx.charm_mult_add += mult_add
+        ctx.modifier_desc.append(f"{charm['name']} +{mult_add} ({ctx.snap.discards_used} discards)")
+
+
+@charm_scorer('coin_per_wild')
+def _coin_per_wild(charm, ctx):
+    if ctx.is_preview:
+        return
+    base_colors = set(die['color'] for die, _ in ctx.held_rolls if die['color'] != 'Rainbow')
+    wild_count = sum(1 for die, _ in ctx.held_rolls if die['color'] == 'Rainbow') if len(base_colors) <= 1 else 0
+    if wild_count > 0:
+        ctx.charm_chips += charm['value'] * wild_count
+        ctx.modifier_desc.append(f"{charm['name']} +{charm['value'] * wild_count} coins ({wild_count} wilds)")
+
+
+@charm_scorer('final_mult_conditional')
+def _final_mult_conditional(charm, ctx):
+    if not ctx.is_preview and ctx.snap.is_last_hand and any(die.get('enhancements') for die, _ in ctx.held_rolls):
+        ctx.charm_mult_add += charm['value']
+        ctx.modifier_desc.append(f"{charm['name']} +{charm['value']} (final)")
+
+
+@charm_scorer('coin_per_discard')
+def _coin_per_discard(charm, ctx):
+    discards_left = ctx.snap.discards_left
+    if not ctx.is_preview and discards_left > 0:
+        ctx.charm_chips += charm['value'] * discards_left
+        ctx.modifier_desc.append(f"{charm['name']} +{charm['value'] * discards_left} coins ({discards_left} discards)")
+
+
+@charm_scorer('risk_mult')
+def _risk_mult(charm, ctx):
+    # Stub: -1 to one die, +0.5 mult; die mod belongs in the roll phase
+    if not ctx.is_preview:
+        ctx.charm_mult_add += charm['value']
+        ctx.modifier_desc.append(f"{charm['name']} +{charm['value']} (risk)")
+
+
+@charm_scorer('mult_final_discard')
+def _mult_final_discard(charm, ctx):
+    if not ctx.is_preview and ctx.snap.is_final_discard:
+        ctx.charm_mult_add += charm['value']
+        ctx.modifier_desc.append(f"{charm['name']} +{charm['value']} (final discard)")
+
+
+@charm_scorer('score_per_coin', reads=('coins',))
+def _score_per_coin(charm, ctx):
+    ctx.charm_chips += charm['value'] * ctx.coins
+
+
+@charm_scorer('score_bonus')
+def _score_bonus(charm, ctx):
+    if charm['value'] == 'stat_sum':
+        face_sum = sum(value for _, value in ctx.held_rolls)  # Sum the face values of all held dice
+        ctx.charm_chips += face_sum
+        ctx.modifier_desc.append(f"{charm['name']} +{face_sum} (Sum of faces)")
+
+
+@charm_scorer('score_decay')
+def _score_decay(charm, ctx):
+    ctx.charm_chips += max(0, charm['start'] - (charm['decay'] * charm.get('hands_played', 0)))
+
+
+@charm_scorer('score_conditional')
+def _score_conditional(charm, ctx):
+    if len(ctx.held_rolls) == charm['dice']:
+        ctx.charm_chips += charm['value']
+        ctx.charm_chips += charm.get('permanent_bonus', 0)
@@ -1,88 +1,23 @@
 # screens.py
 import pygame
 import time
-import random
 import math
+from collections import OrderedDict
 from utils import *  # For draw_rounded_element, get_easing, etc.
 import constants  # For THEME, SPLASH_*, etc.
 import data  # For DICE_DESCRIPTIONS, etc. if needed in drawing
 from data import ENH_DESC  # For enhancement descriptions in tooltips
+from dice import Die
 
 def draw_splash_screen(game):
     mouse_pos = pygame.mouse.get_pos()  # For hover
-    if game.splash_start_time == 0:
-        game.splash_start_time = time.time()
-    if not hasattr(game, 'splash_total_start') or game.splash_total_start == 0:
-        game.splash_total_start = time.time()
-
-    time_elapsed = time.time() - game.splash_start_time
-    total_elapsed = time.time() - game.splash_total_start
-    image_width, image_height = game.splash_image.get_size()
-
-    # Safeguard with total_elapsed
-    total_duration = constants.SPLASH_DURATION_PAN + constants.SPLASH_DURATION_HOLD + constants.SPLASH_DURATION_ZOOM_OUT
-    if total_elapsed >= total_duration:
-        game.splash_phase = 'done'
 
     # Fill background for sides
     game.screen.fill((19, 16, 59))  # Or Dark Blue matching pool in splash image
 
-    current_zoom = constants.SPLASH_INITIAL_ZOOM
-    visible_height = game.height / current_zoom
-    focus_y = 0
-
-    if game.splash_phase == 'pan':
-        progress = min(time_elapsed / constants.SPLASH_DURATION_PAN, 1.0)
-        easing_progress = get_easing(progress, constants.SPLASH_EASING)  # Replace inline with call
-
-        start_focus_y = image_height - visible_height / 2
-        end_focus_y = visible_height / 2
-        focus_y = start_focus_y + (end_focus_y - start_focus_y) * easing_progress
-
-        if time_elapsed >= constants.SPLASH_DURATION_PAN:
-            game.splash_phase = 'hold'
-            game.splash_start_time = time.time()
-
-    elif game.splash_phase == 'hold':
-        visible_height = game.height / constants.SPLASH_INITIAL_ZOOM
-        focus_y = visible_height / 2
-        if time_elapsed >= constants.SPLASH_DURATION_HOLD:
-            game.splash_phase = 'zoom_out'
-            game.splash_start_time = time.time()
-
-    elif game.splash_phase == 'zoom_out':
-        progress = min(time_elapsed / constants.SPLASH_DURATION_ZOOM_OUT, 1.0)
-        easing_progress = get_easing(progress, constants.SPLASH_EASING)  # Replace inline with call
-
-        fit_zoom = game.height / image_height
-        current_zoom = constants.SPLASH_INITIAL_ZOOM - (constants.SPLASH_INITIAL_ZOOM - fit_zoom) * easing_progress
-        visible_height = game.height / current_zoom
-
-        start_focus_y = (game.height / constants.SPLASH_INITIAL_ZOOM) / 2
-        end_focus_y = image_height / 2
-        focus_y = start_focus_y + (end_focus_y - start_focus_y) * easing_progress
-
-        if time_elapsed >= constants.SPLASH_DURATION_ZOOM_OUT:
-            game.splash_phase = 'done'
-
-    elif game.splash_phase == 'done':
-        fit_zoom = game.height / image_height
-        current_zoom = fit_zoom
-        visible_height = game.height / current_zoom
-        focus_y = image_height / 2
-
-    # Derive view_y, clamp, scale, and blit (do this before button so button is on top)
-    view_y = max(0, focus_y - visible_height / 2)
-    view_y = min(view_y, image_height - visible_height)
-
-    scaled_width = int(image_width * current_zoom)
-    scaled_height = int(image_height * current_zoom)
-    scaled_image = pygame.transform.smoothscale(game.splash_image, (scaled_width, scaled_height))
-
-    x_pos = (game.width - scaled_width) // 2
-    y_pos = -int(view_y * current_zoom)
-
-    game.screen.blit(scaled_image, (x_pos, y_pos))
+    # Zoom and scroll come from SplashState.update; the pyramid only scales what's on screen (and reuses still frames)
+    current_zoom, view_y = game.splash_view
+    game.splash_pyramid.draw(game.screen, current_zoom, view_y)
 
     # Draw "Start Game" button after image (only in 'done')
     if game.splash_phase == 'done':
@@ -210,28 +145,17 @@ def draw_game_screen(game):
             overlay = game.break_icon.copy()  # Copy to modify alpha
             overlay.set_alpha(alpha)
             for idx in game.broken_dice:
-                # Get die position (same as in dice draw loop)
-                total_dice_width = constants.NUM_DICE_IN_HAND * (constants.DIE_SIZE + 20) - 20
-                start_x = (game.width - total_dice_width) // 2
-                x = start_x + idx * (constants.DIE_SIZE + 20)
-                size = constants.DIE_SIZE * constants.HELD_DIE_SCALE if game.held[idx] else constants.DIE_SIZE
-                offset = (constants.DIE_SIZE - size) / 2 if game.held[idx] else 0
-                die_rect = pygame.Rect(x + offset, game.height - constants.DIE_SIZE - 100 + offset, size, size)
+                die_rect = game.layout.hand_die_rect(idx, game.held[idx])
                 # Blit overlay centered on die
                 overlay_rect = overlay.get_rect(center=die_rect.center)
                 game.screen.blit(overlay, overlay_rect)
-        else:
-            # Reset after duration
-            game.broken_dice = []
-            game.break_effect_start = 0
+        # Cleared after break_effect_duration by a scheduler timer (ChromaRollGame.start_break_effect)
     draw_text(game)
 
     draw_bag_visual(game)
     # Add equipped charms drawing loop here (with grayscale for disabled)
     for i, charm in enumerate(game.equipped_charms):
-        x = 50 + i * (constants.CHARM_SIZE + 10)  # Note: 10 is original spacing; update if changed
-        y = 10  # Top for game screen
-        rect = pygame.Rect(x, y, constants.CHARM_SIZE, constants.CHARM_SIZE)
+        rect = game.layout.charm_rect(i)  # Same rect GameState hit-tests for drags
         draw_charm_die(game, rect, charm, index=i)  # Draw directly with frame, icon, and grayscale if disabled
         # Optional tooltip on hover - UPDATED HERE
         if rect.collidepoint(mouse_pos):
@@ -309,24 +233,11 @@ def draw_game_screen(game):
             if i in game.disabled_charms:
                 tooltip_text += " (Disabled this round by Boss Effect)"
             
-            draw_tooltip(game, x, y + constants.CHARM_SIZE + constants.TOOLTIP_PADDING, tooltip_text)
+            draw_tooltip(game, rect.x, rect.bottom + constants.TOOLTIP_PADDING, tooltip_text)
     # Removed self.draw_charms() to eliminate duplicate drawing and tooltip issues
 
-    # Calculate bag_rect dynamically
-    columns = 5
-    rows = math.ceil(len(game.bag) / columns) if game.bag else 1
-    bag_width = columns * (constants.SMALL_DIE_SIZE + constants.SMALL_DIE_SPACING) - constants.SMALL_DIE_SPACING + constants.BAG_PADDING * 2
-    bag_height = rows * (constants.SMALL_DIE_SIZE + constants.SMALL_DIE_SPACING) - constants.SMALL_DIE_SPACING + constants.BAG_PADDING * 2
-    bag_x = game.width - bag_width - 20
-    bag_y = 50
-    bag_rect = pygame.Rect(bag_x, bag_y, bag_width, bag_height)
-
     # New: Tray to the left of bag
-    tray_width = 2 * constants.TRAY_SLOT_SIZE + constants.TRAY_SLOT_SPACING
-    tray_x = max(bag_rect.left - tray_width - 10, 10)  # Left of bag, clamp to screen left
-    tray_y = bag_rect.y  # Align top
-    for i in range(2):
-        slot_rect = pygame.Rect(tray_x + i * (constants.TRAY_SLOT_SIZE + constants.TRAY_SLOT_SPACING), tray_y, constants.TRAY_SLOT_SIZE, constants.TRAY_SLOT_SIZE)
+    for i, slot_rect in enumerate(game.layout.tray_slots):
         pygame.draw.rect(game.screen, (150, 150, 150), slot_rect, border_radius=5)
         if game.rune_tray[i]:
             text = game.tiny_font.render(f"#{game.rune_tray[i].get('id', i+1)}", True, constants.THEME['text'])
@@ -364,14 +275,13 @@ def draw_game_screen(game):
             boss_text = game.small_font.render(line, True, (255, 0, 0))  # Red text
             game.screen.blit(boss_text, (text_x, text_y + i * line_spacing))
 
-    multipliers_button_rect = pygame.Rect(game.width - constants.MULTIPLIERS_BUTTON_SIZE - 10, game.height - constants.MULTIPLIERS_BUTTON_SIZE - 100, constants.MULTIPLIERS_BUTTON_SIZE, constants.MULTIPLIERS_BUTTON_SIZE)
+    multipliers_button_rect = game.layout.multipliers_button_rect
     pygame.draw.rect(game.screen, (100, 100, 100), multipliers_button_rect)
     button_text = game.tiny_font.render("M", True, (constants.THEME['text']))
     game.screen.blit(button_text, (multipliers_button_rect.x + 20, multipliers_button_rect.y + 15))
     if multipliers_button_rect.collidepoint(mouse_pos):
-        panel_x = game.width - constants.MULTIPLIERS_PANEL_WIDTH - 10
-        panel_y = game.height - constants.MULTIPLIERS_PANEL_HEIGHT - constants.MULTIPLIERS_BUTTON_SIZE - 120
-        panel_rect = pygame.Rect(panel_x, panel_y, constants.MULTIPLIERS_PANEL_WIDTH, constants.MULTIPLIERS_PANEL_HEIGHT)
+        panel_rect = game.layout.multipliers_panel_rect
+        panel_x, panel_y = panel_rect.topleft
         draw_rounded_element(game.screen, panel_rect, constants.UI_PANEL_COLOR, border_color=(0, 0, 0), border_width=2, radius=constants.UI_PANEL_BORDER_RADIUS, inner_content=None)
         y_offset = panel_y + 10
         for ht in data.HAND_TYPES:  # Iterate all types from data.py
@@ -437,26 +347,11 @@ def draw_shop_screen(game, skip_tooltips=False):
     reroll_x = coins_text_x + coins_text.get_width() + 20  # Right of coins with padding
     reroll_y = coins_y - 10  # Align vertically with coins (slight offset if needed)
     reroll_rect = pygame.Rect(reroll_x, reroll_y, constants.BUTTON_WIDTH, constants.BUTTON_HEIGHT)
-    draw_custom_button(game, reroll_rect, "Reroll (5)", is_hover=reroll_rect.collidepoint(mouse_pos))
-
-    # Calculate bag_rect dynamically (keep for consistency, even if not used for tray)
-    columns = 5
-    rows = math.ceil(len(game.bag) / columns) if game.bag else 1
-    bag_width = columns * (constants.SMALL_DIE_SIZE + constants.SMALL_DIE_SPACING) - constants.SMALL_DIE_SPACING + constants.BAG_PADDING * 2
-    bag_height = rows * (constants.SMALL_DIE_SIZE + constants.SMALL_DIE_SPACING) - constants.SMALL_DIE_SPACING + constants.BAG_PADDING * 2
-    bag_x = game.width - bag_width - 20
-    bag_y = 50
-    bag_rect = pygame.Rect(bag_x, bag_y, bag_width, bag_height)
-
-    # New: Tray underneath continue (use multipliers_button_rect as proxy; adjust if actual continue differs)
-    multipliers_button_rect = pygame.Rect(game.width - constants.MULTIPLIERS_BUTTON_SIZE - 10, game.height - constants.MULTIPLIERS_BUTTON_SIZE - 100, constants.MULTIPLIERS_BUTTON_SIZE, constants.MULTIPLIERS_BUTTON_SIZE)  # From your code
-    continue_rect = multipliers_button_rect  # Proxy; replace with actual continue_rect if defined
-    tray_width = 2 * constants.TRAY_SLOT_SIZE + constants.TRAY_SLOT_SPACING
-    tray_x = continue_rect.centerx - tray_width // 2  # Center under
-    tray_y = continue_rect.bottom + 10  # Below
-    tray_y = min(tray_y, game.height - constants.TRAY_SLOT_SIZE - 10)  # Clamp to bottom
-    for i in range(2):
-        slot_rect = pygame.Rect(tray_x + i * (constants.TRAY_SLOT_SIZE + constants.TRAY_SLOT_SPACING), tray_y, constants.TRAY_SLOT_SIZE, constants.TRAY_SLOT_SIZE)
+    draw_custom_button(game, reroll_rect, "Reroll (5)", is_hover=hovering(game, reroll_rect))
+
+    layout = game.shop_layout
+    # New: Tray underneath where the game screen's M button sits
+    for i, slot_rect in enumerate(layout.tray_slots):
         pygame.draw.rect(game.screen, (150, 150, 150), slot_rect, border_radius=5)
         if game.rune_tray[i]:
             text = game.tiny_font.render(f"#{game.rune_tray[i].get('id', i+1)}", True, constants.THEME['text'])
@@ -489,9 +384,7 @@ def draw_shop_screen(game, skip_tooltips=False):
     for i, charm in enumerate(game.equipped_charms):
         if i == game.dragging_charm_index and game.dragging_shop:
             continue
-        x = 50 + i * (constants.CHARM_BOX_WIDTH + constants.CHARM_SPACING)
-        y = 150
-        eq_rect = pygame.Rect(x, y, constants.CHARM_BOX_WIDTH, constants.CHARM_BOX_HEIGHT)
+        eq_rect = layout.equipped_charm_rect(i)
         icon_rect = pygame.Rect(eq_rect.x + (constants.CHARM_BOX_WIDTH - constants.CHARM_DIE_SIZE) // 2, eq_rect.y + 10, constants.CHARM_DIE_SIZE, constants.CHARM_DIE_SIZE)  # Adjusted padding
         draw_charm_die(game, icon_rect, charm)
         sell_val = charm['cost'] // 2
@@ -503,7 +396,7 @@ def draw_shop_screen(game, skip_tooltips=False):
         game.screen.blit(sell_text, (sell_rect.x + 10, sell_rect.y + 3))
         sell_rects.append(sell_rect)
         equipped_rects.append(eq_rect)
-        if eq_rect.collidepoint(mouse_pos):
+        if hovering(game, eq_rect):
             tooltip_text = charm['name'] + ": " + charm['desc']
             if charm['type'] == 'sacrifice_mult':
                 tooltip_text += f" (Current mult: x{game.score_mult})"
@@ -563,7 +456,7 @@ def draw_shop_screen(game, skip_tooltips=False):
                 tooltip_text += "\nPreview: +3 per discarded color die"
             if charm['type'] == 'mult_final_discard':
                 tooltip_text += "\nPreview: +2 mult on final discard"
-            equipped_hover = (x, y + constants.CHARM_BOX_HEIGHT + 5, tooltip_text)
+            equipped_hover = (eq_rect.x, eq_rect.bottom + 5, tooltip_text)
     
     # Draw dragged charm in shop
     if game.dragging_charm_index != -1 and game.dragging_shop:
@@ -600,7 +493,7 @@ def draw_shop_screen(game, skip_tooltips=False):
         game.screen.blit(buy_text, (buy_rect.x + 10, buy_rect.y + 3))
         buy_rects.append(buy_rect)
         shop_rects.append(shop_rect)
-        if shop_rect.collidepoint(mouse_pos):
+        if hovering(game, shop_rect):
             tooltip_text = charm['name'] + ": " + charm['desc']
             if charm['type'] == 'empty_slot_mult':
                 preview_mult = charm['value'] * (game.max_charms - len(game.equipped_charms))
@@ -649,7 +542,7 @@ def draw_shop_screen(game, skip_tooltips=False):
             pygame.draw.rect(game.screen, constants.BAG_COLOR, pack_rect, border_radius=constants.BAG_BORDER_RADIUS)  # Generic brown
             text = game.small_font.render(f"Rune Pack ${pack_costs[pack_idx]}", True, constants.THEME['text'])
             game.screen.blit(text, (pack_rect.centerx - text.get_width()//2, pack_rect.centery))
-        if not skip_tooltips and pack_rect.collidepoint(mouse_pos):
+        if hovering(game, pack_rect) and not skip_tooltips:
             tooltip_text = f"{pack_names[pack_idx]}\nCost: {pack_costs[pack_idx]}"
             tooltip_y = pack_rect.y + 80 + 5  # Lowered
             if tooltip_y + 50 > game.height:
@@ -675,11 +568,9 @@ def draw_shop_screen(game, skip_tooltips=False):
         game.screen.blit(mult_text, (mult_x, y_offset))
         y_offset += 25
 
-    # Position continue button left of hand multipliers (top right, aligned with title)
-    continue_x = mult_x - constants.BUTTON_WIDTH - 20  # Left of multipliers with padding
-    continue_y = mult_y  # Align with multipliers title
-    continue_rect = pygame.Rect(continue_x, continue_y, constants.BUTTON_WIDTH, constants.BUTTON_HEIGHT)
-    draw_custom_button(game, continue_rect, "Continue", is_hover=continue_rect.collidepoint(mouse_pos))  # No is_red for positive action
+    # Continue button left of hand multipliers (top right, aligned with title)
+    continue_rect = layout.continue_rect
+    draw_custom_button(game, continue_rect, "Continue", is_hover=hovering(game, continue_rect))  # No is_red for positive action
 
     return continue_rect, sell_rects, buy_rects, equipped_rects, shop_rects, pack_rects, reroll_rect
 
@@ -690,17 +581,12 @@ def draw_blinds_screen(game):
     title_text = game.font.render(f"Stake {game.current_stake}", True, (constants.THEME['text']))
     game.screen.blit(title_text, (game.width // 2 - title_text.get_width() // 2, game.height // 10))
     if game.upcoming_boss_effect is None:
-        game.upcoming_boss_effect = random.choice(data.BOSS_EFFECTS)  # Fallback generate if not set
+        game.upcoming_boss_effect = game.rng.boss.choice(data.BOSS_EFFECTS)  # Fallback generate if not set
 
+    layout = game.blinds_layout
     blind_order = ['Small', 'Big', 'Boss']
-    box_width, box_height = 150, 100
-    box_spacing = 50  # Spacing between blind boxes (pixels)
-    total_blinds_width = 3 * box_width + 2 * box_spacing
-    start_x = (game.width - total_blinds_width) // 2
-    start_y = game.height // 3
-    for i, blind in enumerate(blind_order):
-        x = start_x + i * (box_width + box_spacing)
-        rect = pygame.Rect(x, start_y, box_width, box_height)
+    box_width, box_height = layout.BOX_WIDTH, layout.BOX_HEIGHT
+    for blind, rect in zip(blind_order, layout.blind_boxes):
         pygame.draw.rect(game.screen, (100, 100, 100), rect)
         # Highlight current blind
         if blind == game.current_blind:
@@ -709,6 +595,16 @@ def draw_blinds_screen(game):
         game.screen.blit(blind_text, (rect.x + (box_width - blind_text.get_width()) // 2, rect.y + 20))
         target_text = game.small_font.render(f"Score: {int(game.get_blind_target(blind))}", True, (constants.THEME['text']))
         game.screen.blit(target_text, (rect.x + (box_width - target_text.get_width()) // 2, rect.y + 50))
+        if blind == game.current_blind:
+            odds = game.get_clear_odds(compute=False)  # Only computed on request (O), the DP takes a moment
+            if odds is None:
+                odds_str = "Odds: computing..." if game.clear_odds_busy() else "O: clear odds"
+            elif round(odds[0] * 100) == round(odds[1] * 100):
+                odds_str = f"Odds: {odds[0] * 100:.0f}%"
+            else:
+                odds_str = f"Odds: {odds[0] * 100:.0f}-{odds[1] * 100:.0f}%"
+            odds_text = game.small_font.render(odds_str, True, (constants.THEME['text']))
+            game.screen.blit(odds_text, (rect.x + (box_width - odds_text.get_width()) // 2, rect.y + 75))
 
         # Preview for Boss
         if blind == 'Boss' and game.upcoming_boss_effect:
@@ -744,7 +640,7 @@ def draw_blinds_screen(game):
     debug_jump_rect = None
     
     # Draw continue button (always)
-    continue_rect = pygame.Rect(game.width // 2 - constants.BUTTON_WIDTH // 2, game.height // 2 + 100, constants.BUTTON_WIDTH, constants.BUTTON_HEIGHT)
+    continue_rect = layout.continue_rect
     pygame.draw.rect(game.screen, constants.THEME['button_bg'], continue_rect)
     continue_text = game.font.render("Continue", True, constants.THEME['text'])
     game.screen.blit(continue_text, (continue_rect.x + 20, continue_rect.y + 10))
@@ -752,35 +648,25 @@ def draw_blinds_screen(game):
     if constants.DEBUG:
         # Debug Boss Select Button
         debug_button_text = game.small_font.render("Select Boss (Debug)", True, (0, 255, 0))  # Green for debug
-        debug_button_rect = pygame.Rect(game.width - 200, game.height - 100, 180, 40)  # Bottom-right; adjust
+        debug_button_rect = layout.debug_button_rect  # Bottom-right
         pygame.draw.rect(game.screen, (50, 50, 50), debug_button_rect, border_radius=5)
         game.screen.blit(debug_button_text, (debug_button_rect.x + 10, debug_button_rect.y + 10))
         debug_jump_text = game.small_font.render("Jump to Boss (Debug)", True, (0, 255, 0))  # Green for debug
-        debug_jump_rect = pygame.Rect(game.width - 200, game.height - 60, 180, 40)  # Above the select button; adjust y to avoid overlap
+        debug_jump_rect = layout.debug_jump_rect  # Under the select button
         pygame.draw.rect(game.screen, (50, 50, 50), debug_jump_rect, border_radius=5)
         game.screen.blit(debug_jump_text, (debug_jump_rect.x + 10, debug_jump_rect.y + 10))
 
         if game.debug_boss_dropdown_open:
-            # Dropdown Panel: Scrollable list
-            panel_width, panel_height = 300, 300  # Size for ~10-15 visible items
-            
-            # Position: Above the button, hugging right side
-            panel_x = game.width - panel_width - 10  # Hug right with padding
-            panel_y = debug_button_rect.y - panel_height - 10  # Above button with padding
-            
-            # Adaptive: If above clips top, shift below as fallback
-            if panel_y < 0:
-                panel_y = debug_button_rect.y + debug_button_rect.height + 10
-
-            pygame.draw.rect(game.screen, (20, 20, 20), (panel_x, panel_y, panel_width, panel_height))  # Dark panel
+            # Dropdown Panel: Scrollable list, above the button (below if that clips the top)
+            panel_x, panel_y = layout.panel_rect.topleft
+            pygame.draw.rect(game.screen, (20, 20, 20), layout.panel_rect)  # Dark panel
 
-            item_height = 25  # Each effect row
-            visible_items = panel_height // item_height
+            visible_items = layout.visible_items
             total_items = len(data.BOSS_EFFECTS)
-            
+
             # Scroll arrows (simple up/down buttons)
-            up_rect = pygame.Rect(panel_x + panel_width - 30, panel_y, 30, 30)
-            down_rect = pygame.Rect(panel_x + panel_width - 30, panel_y + panel_height - 30, 30, 30)
+            up_rect = layout.up_rect
+            down_rect = layout.down_rect
             pygame.draw.rect(game.screen, (100, 100, 100), up_rect)
             pygame.draw.rect(game.screen, (100, 100, 100), down_rect)
             game.screen.blit(game.small_font.render("^", True, (constants.THEME['text'])), (up_rect.x + 10, up_rect.y + 5))
@@ -790,7 +676,7 @@ def draw_blinds_screen(game):
             for i in range(game.debug_boss_scroll_offset, min(game.debug_boss_scroll_offset + visible_items, total_items)):
                 effect = data.BOSS_EFFECTS[i]
                 item_text = game.small_font.render(f"{effect['name']}: {effect['desc'][:30]}...", True, (constants.THEME['text']))  # Truncate long desc
-                item_y = panel_y + (i - game.debug_boss_scroll_offset) * item_height + 5
+                item_y = layout.item_rect(i - game.debug_boss_scroll_offset).y + 5
                 game.screen.blit(item_text, (panel_x + 10, item_y))
 
     # Update return to include debug rects
@@ -814,7 +700,7 @@ def draw_tutorial_screen(game):
 
     # Mock data for steps
     mock_colors = ['Red', 'Blue', 'Green', 'Purple', 'Yellow']  # Varied for visual interest
-    mock_dice = [{'id': f'Mock{i}', 'color': mock_colors[i % 5], 'faces': constants.DICE_FACES} for i in range(constants.NUM_DICE_IN_HAND)]
+    mock_dice = [Die(f'Mock{i}', mock_colors[i % 5]) for i in range(constants.NUM_DICE_IN_HAND)]
     if game.tutorial_step in [1, 2, 3]:  # Discard, Roll/Hold, Scoring - mock hand/dice
         game.hand = mock_dice
         if game.tutorial_step == 2:  # Step 3: Fixed faces 6,6,2,3,4 and hold first two
@@ -983,100 +869,34 @@ def draw_tutorial_screen(game):
 def draw_dice(game):
         """Draws the current rolls on the screen."""
         hand_rects = []
-        total_dice_width = constants.NUM_DICE_IN_HAND * (constants.DIE_SIZE + 20) - 20
-        start_x = (game.width - total_dice_width) // 2
         current_time = time.time()  # For animation
         for i, (die, value) in enumerate(game.rolls):
-            x = start_x + i * (constants.DIE_SIZE + 20)
-            y = game.height - constants.DIE_SIZE - 100
-            size = constants.DIE_SIZE * constants.HELD_DIE_SCALE if game.held[i] else constants.DIE_SIZE
-            offset = (constants.DIE_SIZE - constants.DIE_SIZE * constants.HELD_DIE_SCALE) / 2 if game.held[i] else 0
             color = die['color']
             if color == 'Rainbow':
                 color_index = int(current_time / constants.CYCLE_SPEED) % len(constants.BASE_COLORS)
                 color_rgb = constants.COLORS[constants.BASE_COLORS[color_index]]
             else:
                 color_rgb = constants.COLORS[color]
-            # Draw die background with rounded corners
-            rect = pygame.Rect(x + offset, y + offset, size, size)
-
-            # New: Mini-function for dots (moves your existing loop here)
-            def _draw_dots(inner_rect):
-                for pos in data.DOT_POSITIONS.get(value, []):
-                    dot_x = inner_rect.x + pos[0] * inner_rect.width  # Updated to use inner_rect (was x + offset + pos[0] * size)
-                    dot_y = inner_rect.y + pos[1] * inner_rect.height  # Updated to use inner_rect (was y + offset + pos[1] * size)
-                    pygame.draw.circle(game.screen, (0, 0, 0), (dot_x, dot_y), constants.DOT_RADIUS)
-            # Highlight if selected for discard (red border outside black)
-            if game.discard_selected[i]:
-                outer_rect = pygame.Rect(x + offset - 3, y + offset - 3, size + 6, size + 6)
-                pygame.draw.rect(game.screen, (255, 0, 0), outer_rect, 3, border_radius=constants.DIE_BORDER_RADIUS)
-            # Draw dots
-            inner_content = lambda r: [
-                _draw_dots(r),  # Existing pips
-                draw_enhancement_visuals(game, r, die)  # Add enhancements/animations
-            ]
-            draw_rounded_element(game.screen, rect, color_rgb, border_color=(0, 0, 0), border_width=2, radius=constants.DIE_BORDER_RADIUS, inner_content=inner_content)
+            # Pre-rendered die (pips, enhancements, red discard outline) - one blit per die
+            rect = game.layout.hand_die_rect(i, game.held[i])
+            sprite = game.die_sprites.hand_die(game, color_rgb, value, rect.width, game.discard_selected[i], die['enhancements'])
+            game.screen.blit(sprite, (rect.x - 3, rect.y - 3))
         return hand_rects, game.rolls  # Return rects and rolls
 
 # In screens.py, update draw_bag_visual to use inner_content with lambda for enhancements (no need for draw_dots_or_icon if small dies have no pips; add if needed)
 def draw_bag_visual(game):
     """Draws a brown bag with rounded corners and black border, with dice inside."""
-    num_dice = len(game.bag)
-    if num_dice > 30:
-        columns = 6
-    else:
-        columns = 5
-    rows = math.ceil(num_dice / columns)
-    grid_width = columns * (constants.SMALL_DIE_SIZE + constants.SMALL_DIE_SPACING) - constants.SMALL_DIE_SPACING
-    grid_height = rows * (constants.SMALL_DIE_SIZE + constants.SMALL_DIE_SPACING) - constants.SMALL_DIE_SPACING
-    bag_width = grid_width + 2 * constants.BAG_PADDING
-    bag_height = grid_height + 2 * constants.BAG_PADDING
-    bag_x = game.width - bag_width - 10
-    bag_y = 50
-    bag_rect = pygame.Rect(bag_x, bag_y, bag_width, bag_height)
-    # In draw_game_screen or draw_bag_visual (update the rect draw line)
-    bag_color = game.get_bag_color()
-    # Draw upside-down triangle at bottom of Z-order
-    triangle_points = [
-        (bag_x + bag_width // 2, bag_y + 10), # bottom tip
-        (bag_x + bag_width // 2 - 15, bag_y - 10), # top left
-        (bag_x + bag_width // 2 + 15, bag_y - 10) # top right
-    ]
-    pygame.draw.polygon(game.screen, bag_color, triangle_points)
-    pygame.draw.polygon(game.screen, (0, 0, 0), triangle_points, 2)
-    draw_rounded_element(game.screen, bag_rect, bag_color, border_color=(0, 0, 0), border_width=2, radius=constants.BAG_BORDER_RADIUS, inner_content=None)
-    sorted_bag = sorted(game.bag, key=lambda d: list(constants.COLORS.keys()).index(d['color']))
-    start_x = bag_x + constants.BAG_PADDING
-    start_y = bag_y + constants.BAG_PADDING
-    index = 0
-    current_time = time.time() # For animation
-    for row in range(rows):
-        y = start_y + row * (constants.SMALL_DIE_SIZE + constants.SMALL_DIE_SPACING)
-        for col in range(columns):
-            if index < num_dice:
-                die = sorted_bag[index]
-                x = start_x + col * (constants.SMALL_DIE_SIZE + constants.SMALL_DIE_SPACING)
-                rect = pygame.Rect(x, y, constants.SMALL_DIE_SIZE, constants.SMALL_DIE_SIZE)
-                color = die['color']
-                if color == 'Rainbow':
-                    color_index = int(current_time / constants.CYCLE_SPEED) % len(constants.BASE_COLORS)
-                    color_rgb = constants.COLORS[constants.BASE_COLORS[color_index]]
-                else:
-                    color_rgb = constants.COLORS[color]
-                inner_content = lambda r: draw_bag_enhancement_visuals(game, r, die)  # Add this; no pips for small dies
-                draw_rounded_element(game.screen, rect, color_rgb, border_color=(0, 0, 0), border_width=1, radius=constants.SMALL_DIE_BORDER_RADIUS, inner_content=inner_content)
-                index += 1
-            else:
-                break
+    game.bag_layer.draw(game)  # Pre-composited; re-rendered only when the bag changes (sprites.BagLayer)
 
 # In screens.py, add this function to handle enhancements visuals for hand dice (full animations)
 # Call it inside draw_rounded_element's inner_content lambda, after drawing base dots/icon: draw_enhancement_visuals(game, r, die)
 # You'll need to import time and random at top if not already: import time, import random
 
-def draw_enhancement_visuals(game, die_rect, die):
+def draw_enhancement_visuals(game, die_rect, die, surface=None):
     enhs = die.get('enhancements', [])
     if not enhs:
         return
+    surface = surface or game.screen  # Sprites render into their own surface
     icon_size = 15
     start_x = die_rect.x + 5
     start_y = die_rect.y + die_rect.height - icon_size - 5  # Bottom row
@@ -1088,41 +908,42 @@ def draw_enhancement_visuals(game, die_rect, die):
         color = (255, 255, 255)  # White default
         if enh == 'Lucky':
             color = (255, 215, 0)  # Gold
-            pygame.draw.polygon(game.screen, color, [(x+7, start_y), (x, start_y+icon_size//2), (x+icon_size, start_y+icon_size//2)])  # Triangle star
+            pygame.draw.polygon(surface, color, [(x+7, start_y), (x, start_y+icon_size//2), (x+icon_size, start_y+icon_size//2)])  # Triangle star
         elif enh == 'Mult':
             text = game.tiny_font.render("x", True, (0, 255, 0))  # Green x
-            game.screen.blit(text, (x, start_y))
+            surface.blit(text, (x, start_y))
         elif enh == 'Bonus':
-            pygame.draw.circle(game.screen, (0, 255, 0), (x+7, start_y+7), 5)  # Green dot
+            pygame.draw.circle(surface, (0, 255, 0), (x+7, start_y+7), 5)  # Green dot
         elif enh == 'Steel':
-            pygame.draw.rect(game.screen, (169, 169, 169), pygame.Rect(x, start_y, icon_size, icon_size), 2)  # Gray border
+            pygame.draw.rect(surface, (169, 169, 169), pygame.Rect(x, start_y, icon_size, icon_size), 2)  # Gray border
         elif enh == 'Fragile':
-            pygame.draw.line(game.screen, (255, 0, 0), (x, start_y), (x+icon_size, start_y+icon_size), 2)  # Red crack
+            pygame.draw.line(surface, (255, 0, 0), (x, start_y), (x+icon_size, start_y+icon_size), 2)  # Red crack
         elif enh == 'Fate':
             text = game.tiny_font.render("E", True, (255, 0, 255))  # Magenta E for edition
-            game.screen.blit(text, (x, start_y))
+            surface.blit(text, (x, start_y))
         elif enh == 'Strength':
-            pygame.draw.polygon(game.screen, (0, 0, 255), [(x+7, start_y), (x, start_y+icon_size), (x+icon_size, start_y+icon_size)])  # Blue arrow
+            pygame.draw.polygon(surface, (0, 0, 255), [(x+7, start_y), (x, start_y+icon_size), (x+icon_size, start_y+icon_size)])  # Blue arrow
         elif enh == 'Sacrifice':
-            pygame.draw.circle(game.screen, (255, 0, 0), (x+7, start_y+7), 7, 2)  # Red circle (destroyed)
+            pygame.draw.circle(surface, (255, 0, 0), (x+7, start_y+7), 7, 2)  # Red circle (destroyed)
         elif enh == 'Transmute':
             text = game.tiny_font.render("T", True, (128, 0, 128))  # Purple T
-            game.screen.blit(text, (x, start_y))
+            surface.blit(text, (x, start_y))
         elif enh in ['Gold', 'Silver']:
             color = constants.COLORS[enh]
-            pygame.draw.rect(game.screen, color, pygame.Rect(x, start_y, icon_size, icon_size))
+            pygame.draw.rect(surface, color, pygame.Rect(x, start_y, icon_size, icon_size))
         elif enh == 'Stone':
-            pygame.draw.rect(game.screen, (128, 128, 128), pygame.Rect(x, start_y, icon_size, icon_size))  # Gray block
+            pygame.draw.rect(surface, (128, 128, 128), pygame.Rect(x, start_y, icon_size, icon_size))  # Gray block
         # Add more if new enh (e.g., 'Judgement' no visual needed)
 
     # Color swaps (Red/Blue/etc.): Already handled by base die color, no extra visual needed
     # Non-die effects (Wealth, Balance, Judgement, Sacrifice, Transmute): Handled in apply, no ongoing visual
 
 # For bag: Simpler static version (call in draw_bag_visual after each small die draw)
-def draw_bag_enhancement_visuals(game, die_rect, die):
+def draw_bag_enhancement_visuals(game, die_rect, die, surface=None):
     enhs = die.get('enhancements', [])
     if not enhs:
         return
+    surface = surface or game.screen  # Sprites render into their own surface
     icon_size = 15
     start_x = die_rect.x + 5
     start_y = die_rect.y + die_rect.height - icon_size - 5  # Bottom row
@@ -1134,31 +955,31 @@ def draw_bag_enhancement_visuals(game, die_rect, die):
         color = (255, 255, 255)  # White default
         if enh == 'Lucky':
             color = (255, 215, 0)  # Gold
-            pygame.draw.polygon(game.screen, color, [(x+7, start_y), (x, start_y+icon_size//2), (x+icon_size, start_y+icon_size//2)])  # Triangle star
+            pygame.draw.polygon(surface, color, [(x+7, start_y), (x, start_y+icon_size//2), (x+icon_size, start_y+icon_size//2)])  # Triangle star
         elif enh == 'Mult':
             text = game.tiny_font.render("x", True, (0, 255, 0))  # Green x
-            game.screen.blit(text, (x, start_y))
+            surface.blit(text, (x, start_y))
         elif enh == 'Bonus':
-            pygame.draw.circle(game.screen, (0, 255, 0), (x+7, start_y+7), 5)  # Green dot
+            pygame.draw.circle(surface, (0, 255, 0), (x+7, start_y+7), 5)  # Green dot
         elif enh == 'Steel':
-            pygame.draw.rect(game.screen, (169, 169, 169), pygame.Rect(x, start_y, icon_size, icon_size), 2)  # Gray border
+            pygame.draw.rect(surface, (169, 169, 169), pygame.Rect(x, start_y, icon_size, icon_size), 2)  # Gray border
         elif enh == 'Fragile':
-            pygame.draw.line(game.screen, (255, 0, 0), (x, start_y), (x+icon_size, start_y+icon_size), 2)  # Red crack
+            pygame.draw.line(surface, (255, 0, 0), (x, start_y), (x+icon_size, start_y+icon_size), 2)  # Red crack
         elif enh == 'Fate':
             text = game.tiny_font.render("E", True, (255, 0, 255))  # Magenta E for edition
-            game.screen.blit(text, (x, start_y))
+            surface.blit(text, (x, start_y))
         elif enh == 'Strength':
-            pygame.draw.polygon(game.screen, (0, 0, 255), [(x+7, start_y), (x, start_y+icon_size), (x+icon_size, start_y+icon_size)])  # Blue arrow
+            pygame.draw.polygon(surface, (0, 0, 255), [(x+7, start_y), (x, start_y+icon_size), (x+icon_size, start_y+icon_size)])  # Blue arrow
         elif enh == 'Sacrifice':
-            pygame.draw.circle(game.screen, (255, 0, 0), (x+7, start_y+7), 7, 2)  # Red circle (destroyed)
+            pygame.draw.circle(surface, (255, 0, 0), (x+7, start_y+7), 7, 2)  # Red circle (destroyed)
         elif enh == 'Transmute':
             text = game.tiny_font.render("T", True, (128, 0, 128))  # Purple T
-            game.screen.blit(text, (x, start_y))
+            surface.blit(text, (x, start_y))
         elif enh in ['Gold', 'Silver']:
             color = constants.COLORS[enh]
-            pygame.draw.rect(game.screen, color, pygame.Rect(x, start_y, icon_size, icon_size))
+            pygame.draw.rect(surface, color, pygame.Rect(x, start_y, icon_size, icon_size))
         elif enh == 'Stone':
-            pygame.draw.rect(game.screen, (128, 128, 128), pygame.Rect(x, start_y, icon_size, icon_size))  # Gray block
+            pygame.draw.rect(surface, (128, 128, 128), pygame.Rect(x, start_y, icon_size, icon_size))  # Gray block
         # Add more if new enh (e.g., 'Judgement' no visual needed)
 
 def draw_ui_panel(game):
@@ -1219,10 +1040,16 @@ def draw_text(game):
         game.screen.blit(score_text, (50, 180))
 
 def draw_charm_die(game, rect, charm, index=None):
-    """Draws a charm as a die with icon inside. Grays out if disabled using built-in Pygame transform."""
-    # Determine if disabled
+    """Draws a charm as a die with icon inside. Grays out if disabled (the tile comes from game.charm_tiles)."""
     is_disabled = index is not None and index in game.disabled_charms
-    
+    game.screen.blit(game.charm_tiles.tile(game, charm, rect.size, is_disabled), rect.topleft)
+
+def render_charm_tile(game, size, charm, is_disabled):
+    """Builds the finished charm die (background, border, icon or fallback drawing) on its own surface.
+    Used by sprites.CharmTileCache - call draw_charm_die to draw one."""
+    tile = pygame.Surface(size, pygame.SRCALPHA)
+    rect = tile.get_rect()
+
     # Draw die background (white face with border) - gray the background too if disabled for better effect
     bg_color = (128, 128, 128) if is_disabled else constants.DIE_BACKGROUND_COLOR
 
@@ -1242,14 +1069,14 @@ def draw_charm_die(game, rect, charm, index=None):
         # Load icon from cache
         path = game.charm_icon_paths.get(charm['name'])
         if path and path in game.charm_icon_cache:
-            icon_surf = game.charm_icon_cache[path].copy()  # Always copy to avoid modifying cache
+            icon_surf = game.charm_icon_cache[path]  # grayscale returns a new surface, so the cache is never touched
 
             # Apply grayscale if disabled
             if is_disabled:
                 icon_surf = pygame.transform.grayscale(icon_surf)  # Built-in grayscale (returns new surface)
             
             # Blit icon
-            game.screen.blit(icon_surf, inner_sub_rect.topleft)
+            tile.blit(icon_surf, inner_sub_rect.topleft)
         else:
             # Create a temporary surface for fallback drawing (to allow grayscaling)
             fallback_surf = pygame.Surface((inner_size, inner_size), pygame.SRCALPHA)  # Transparent for clean blit
@@ -1341,7 +1168,7 @@ def draw_charm_die(game, rect, charm, index=None):
                 pygame.draw.line(fallback_surf, (0, 0, 0), (center_x - box_size // 2, center_y - box_size // 2), (center_x - box_size // 2, center_y + box_size // 2), 2)
                 pygame.draw.line(fallback_surf, (0, 0, 0), (center_x + box_size // 2, center_y - box_size // 2), (center_x + box_size // 2, center_y + box_size // 2), 2)
             elif charm['type'] == 'sacrifice_mult':
-                game.draw_dagger_icon(rect)  # Assuming this draws on the full rect; scale if needed
+                game.draw_dagger_icon(rect, tile)  # Draws on the full rect; scale if needed
             # Add any other fallback drawings for charms not in the icon paths (scale similarly if complex)
             else:
                 # Fallback for unmapped charms: text with name to debug
@@ -1352,23 +1179,50 @@ def draw_charm_die(game, rect, charm, index=None):
             if is_disabled:
                 fallback_surf = pygame.transform.grayscale(fallback_surf)  # Grayscale the drawings
             
-            # Blit the fallback_surf onto the screen at inner_rect
-            game.screen.blit(fallback_surf, inner_sub_rect.topleft)  # Changed name
+            # Blit the fallback_surf onto the tile at inner_rect
+            tile.blit(fallback_surf, inner_sub_rect.topleft)  # Changed name
 
-    draw_rounded_element(game.screen, rect, bg_color, border_color=constants.DIE_BORDER_COLOR, border_width=constants.DIE_BORDER_WIDTH, radius=constants.CHARM_DIE_BORDER_RADIUS, inner_content=_draw_inner_charm)  # <--- Replaced call
+    draw_rounded_element(tile, rect, bg_color, border_color=constants.DIE_BORDER_COLOR, border_width=constants.DIE_BORDER_WIDTH, radius=constants.CHARM_DIE_BORDER_RADIUS, inner_content=_draw_inner_charm)  # <--- Replaced call
+    return tile
 
-def draw_tooltip(game, x, y, text):
+TOOLTIP_CACHE_SIZE = 64
+_tooltip_surfaces = OrderedDict()  # (font, text) -> finished tooltip, LRU
+
+
+def tooltip_surface(game, text):
+    """The whole tooltip box for this text (background and wrapped lines), built once and reused while hovered."""
+    key = (game.small_font, text)
+    surface = _tooltip_surfaces.get(key)
+    if surface is not None:
+        _tooltip_surfaces.move_to_end(key)
+        return surface
     lines = wrap_text(game.small_font, text, constants.TOOLTIP_MAX_WIDTH)
     line_height = game.small_font.get_height()
     width = max(game.small_font.size(line)[0] for line in lines) + constants.TOOLTIP_PADDING * 2
     height = len(lines) * line_height + constants.TOOLTIP_PADDING * 2
-    if x + width > game.width:
-        x = game.width - width
-    tooltip_rect = pygame.Rect(x, y, width, height)
-    pygame.draw.rect(game.screen, (100, 100, 100), tooltip_rect)
+    surface = pygame.Surface((width, height))
+    surface.fill((100, 100, 100))
     for i, line in enumerate(lines):
         desc_surface = game.small_font.render(line, True, (constants.THEME['text']))
-        game.screen.blit(desc_surface, (x + constants.TOOLTIP_PADDING, y + constants.TOOLTIP_PADDING + i * line_height))
+        surface.blit(desc_surface, (constants.TOOLTIP_PADDING, constants.TOOLTIP_PADDING + i * line_height))
+    _tooltip_surfaces[key] = surface
+    if len(_tooltip_surfaces) > TOOLTIP_CACHE_SIZE:
+        _tooltip_surfaces.popitem(last=False)
+    return surface
+
+def draw_tooltip(game, x, y, text):
+    surface = tooltip_surface(game, text)
+    if x + surface.get_width() > game.width:
+        x = game.width - surface.get_width()
+    game.tooltip_rects.append(game.screen.blit(surface, (x, y)))
+
+def hovering(game, rect):
+    """True if the mouse is over rect. The check is remembered for the frame, so static screens only redraw the
+    rects whose hover flips (StateMachine.track_hover) instead of the whole screen on every mouse move.
+    """
+    hit = rect.collidepoint(pygame.mouse.get_pos())
+    game.hover_targets.append((pygame.Rect(rect), hit))
+    return hit
 
     
 
@@ -1412,7 +1266,7 @@ def draw_pause_menu(game):
         game.screen.blit(text, (game.mute_button_rect.centerx - text.get_width() // 2, game.mute_button_rect.centery - text.get_height() // 2))
 
     # Optional: Hover effect (subtle glow)
-    if game.mute_button_rect.collidepoint(pygame.mouse.get_pos()):
+    if hovering(game, game.mute_button_rect):
         pygame.draw.rect(game.screen, constants.THEME['button_hover'], game.mute_button_rect, border_radius=5, width=2)  # Border glow
 
     # Return the rects for handle_event
@@ -1451,26 +1305,21 @@ def draw_buttons(game):
     start_roll_rect = None
     score_rect = None
     end_turn_rect = None
-    bottom_y = game.height - constants.BUTTON_HEIGHT - 20
-    left_button_x = 50
-    right_button_x = game.width - constants.BUTTON_WIDTH - 50
-    center_left_x = game.width // 2 - constants.BUTTON_WIDTH - 20
-    center_right_x = game.width // 2 + 20
     mouse_pos = pygame.mouse.get_pos()  # For hover
 
     if game.is_discard_phase:
-        discard_rect = pygame.Rect(left_button_x, bottom_y, constants.BUTTON_WIDTH, constants.BUTTON_HEIGHT)
+        discard_rect = game.layout.discard_rect
         draw_custom_button(game, discard_rect, "Discard", is_hover=discard_rect.collidepoint(mouse_pos), is_red=True)
 
-        start_roll_rect = pygame.Rect(right_button_x, bottom_y, constants.BUTTON_WIDTH, constants.BUTTON_HEIGHT)
+        start_roll_rect = game.layout.start_roll_rect
         draw_custom_button(game, start_roll_rect, "Start Roll", is_hover=start_roll_rect.collidepoint(mouse_pos))
 
     else:
-        reroll_rect = pygame.Rect(center_left_x, bottom_y, constants.BUTTON_WIDTH, constants.BUTTON_HEIGHT)
+        reroll_rect = game.layout.reroll_rect
         button_text = "Reroll" if (game.rerolls_left > 0 or constants.DEBUG) else "Draw and Score"
         draw_custom_button(game, reroll_rect, button_text, is_hover=reroll_rect.collidepoint(mouse_pos))
 
-        end_turn_rect = pygame.Rect(center_right_x, bottom_y, constants.BUTTON_WIDTH, constants.BUTTON_HEIGHT)
+        end_turn_rect = game.layout.end_turn_rect
         draw_custom_button(game, end_turn_rect, "End Turn", is_hover=end_turn_rect.collidepoint(mouse_pos))
 
     return reroll_rect, discard_rect, start_roll_rect, score_rect, end_turn_rect
@@ -1534,8 +1383,6 @@ def draw_prism_pack_icon(game, pack_idx, x, y):
             pygame.draw.circle(game.screen, (0, 0, 0), (dot_x, dot_y), dot_radius)
 
 def draw_pack_select_screen(game):
-    mouse_pos = pygame.mouse.get_pos()  # Add if not already for hovers
-
     game.screen.fill(constants.THEME['background'])  # Fill background
     
     # Title or instructions
@@ -1573,7 +1420,7 @@ def draw_pack_select_screen(game):
 
         # Tooltip on hover
         tooltip_text = f"{hand_type}: {desc}"  # Or more detailed
-        if rect.collidepoint(mouse_pos):
+        if hovering(game, rect):
             draw_tooltip(game, rect.x, rect.y + rect.height + 5, tooltip_text)
 
         choice_rects.append(rect)  # Return rects for click handling (associate with index or hand_type)
@@ -1660,11 +1507,9 @@ def draw_dice_select_screen(game):
         ]
         draw_rounded_element(game.screen, die_rect, color_rgb, border_color=(0, 0, 0), border_width=2, radius=constants.DIE_BORDER_RADIUS, inner_content=inner_content)
         choice_rects.append((choice_rect, color))
-    mouse_pos = pygame.mouse.get_pos()
     for rect, color in choice_rects:
-        if rect.collidepoint(mouse_pos):
+        if hovering(game, rect):
             tooltip_text = data.DICE_DESCRIPTIONS.get(color, f"Add 1 {color} Die")  # Fallback
             draw_tooltip(game, rect.x, rect.y + constants.CHARM_BOX_HEIGHT + 30, tooltip_text)
-            break
 
     return choice_rects
\ No newline at end of file
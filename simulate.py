@@ -0,0 +1,164 @@
+# simulate.py
+# Headless simulation: plays whole runs on ChromaRollGame(headless=True), with a pluggable bot making the choices
+import argparse
+import copy
+import time
+from collections import Counter
+from constants import NUM_DICE_IN_HAND
+from hand_table import classify_hand
+from ChromaRoll import ChromaRollGame
+
+
+class Bot:
+    """Base policy - override the choices you care about. Each method gets the live headless game.
+    The default scores all five dice straight away and never discards or shops.
+    """
+    def choose_discards(self, game):
+        """Indices of dice to discard before the first roll (empty for none)."""
+        return []
+
+    def choose_holds(self, game):
+        """Hold flags for the dice in game.rolls (held dice are kept on a reroll and scored at the end)."""
+        return [True] * len(game.rolls)
+
+    def should_reroll(self, game):
+        """True to reroll the unheld dice, False to score the held ones now."""
+        return False
+
+    def shop(self, game):
+        """Called once per shop visit after generate_shop; buy with game.buy_shop_charm(i)."""
+        pass
+
+
+class GreedyBot(Bot):
+    """Keeps every die whose face shows up more than once (or the longest run when none repeat) and rerolls
+    the rest until it has a Full House or better; buys the cheapest charms it can afford.
+    """
+    STOP_AT = ('5 of a Kind', '4 of a Kind', 'Full House', 'Large Straight')
+
+    def choose_holds(self, game):
+        values = [value for _, value in game.rolls]
+        if game.rerolls_left <= 0 or classify_hand(values).hand_type in self.STOP_AT:
+            return [True] * len(values)
+        counts = Counter(values)
+        if max(counts.values()) > 1:
+            return [counts[value] > 1 for value in values]
+        # All faces differ: keep the longest run of consecutive faces (3+), e.g. 2-3-4 of 2,3,4,6,1
+        run = best = []
+        for value in sorted(values):
+            run = run + [value] if run and value == run[-1] + 1 else [value]
+            if len(run) > len(best):
+                best = run
+        return [len(best) >= 3 and value in best for value in values]
+
+    def should_reroll(self, game):
+        return game.rerolls_left > 0 and not all(game.held)
+
+    def shop(self, game):
+        while game.shop_charms:
+            cheapest = min(range(len(game.shop_charms)), key=lambda i: game.shop_charms[i]['cost'])
+            if not game.buy_shop_charm(cheapest):
+                break
+
+
+class AdvisorBot(Bot):
+    """Plays every roll with the exact hold advisor (get_hold_advice). Strong but slow - seconds per fresh hand."""
+    def __init__(self):
+        self.action = 'score'
+
+    def choose_holds(self, game):
+        _, self.action, mask = game.get_hold_advice()[0]
+        return list(mask)
+
+    def should_reroll(self, game):
+        return self.action == 'reroll'
+
+    def shop(self, game):
+        GreedyBot.shop(self, game)
+
+
+BOTS = {'basic': Bot, 'greedy': GreedyBot, 'advisor': AdvisorBot}
+
+
+def play_hand(game, bot):
+    """Plays the hand in game.rolls to the end (discard, roll, rerolls, score). Returns (hand_type, score)."""
+    discards = bot.choose_discards(game)
+    if discards and game.discards_left > 0:
+        game.discard_selected = [i in discards for i in range(NUM_DICE_IN_HAND)]
+        game.discard()
+    game.start_roll_phase()
+    while True:
+        game.held = list(bot.choose_holds(game))
+        if game.rerolls_left <= 0 or not bot.should_reroll(game):
+            break
+        rerolls_before = game.rerolls_left
+        game.reroll()
+        if game.rerolls_left == rerolls_before:
+            break  # Refused (Hold Ban / Hold Limit, or still in the discard phase) - score what's held
+    hand_type = game.get_hand_type_and_score().hand_type
+    score_before = game.round_score
+    game.score_and_new_turn()
+    return hand_type, game.round_score - score_before
+
+
+def play_run(bot, seed=None, pouch=None, charms=(), stake=1, max_stake=8):
+    """Plays one run headlessly, the way the states drive the game: blinds -> hands -> popup -> shop -> blinds.
+    pouch is a data.POUCHES entry and charms are data.CHARMS_POOL entries equipped from the start.
+    Returns a dict: won (cleared the Boss of max_stake), stake, blind, blinds_cleared, and hands as
+    (hand_type, score) for every scored hand.
+    """
+    game = ChromaRollGame(headless=True, seed=seed)
+    game.current_stake = stake
+    if pouch is not None:
+        game.apply_pouch(pouch)
+    for charm in charms:
+        game.equipped_charms.append(copy.deepcopy(charm))
+    hands = []
+    blinds_cleared = 0
+    won = False
+    while game.game_state != 'game_over':
+        # Continue on the blinds screen: fresh bag, then GameState.enter deals the first hand
+        game.bag.refill(game.full_bag)
+        game.new_turn()
+        while not game.show_popup and game.game_state != 'game_over':
+            if not game.full_bag:
+                game.game_state = 'game_over'  # Every die shattered
+                break
+            hands.append(play_hand(game, bot))
+        if game.game_state == 'game_over':
+            break
+        blinds_cleared += 1
+        if game.current_blind == 'Boss' and game.current_stake >= max_stake:
+            won = True
+            break
+        # Popup continue: next blind, then the shop
+        game.show_popup = False
+        game.advance_blind()
+        game.generate_shop()
+        bot.shop(game)
+        game.shop_charms = []
+    return {'won': won, 'stake': game.current_stake, 'blind': game.current_blind, 'blinds_cleared': blinds_cleared,
+            'hands': hands}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play ChromaRoll runs headlessly with a bot.")
+    parser.add_argument('--runs', type=int, default=1000)
+    parser.add_argument('--bot', choices=sorted(BOTS), default='greedy')
+    parser.add_argument('--seed', type=int, default=0, help="Run i is seeded with seed + i")
+    parser.add_argument('--stake', type=int, default=1, help="Starting stake")
+    parser.add_argument('--max-stake', type=int, default=8, help="Beating this stake's Boss wins the run")
+    args = parser.parse_args()
+
+    bot = BOTS[args.bot]()
+    start = time.perf_counter()
+    results = [play_run(bot, args.seed + i, stake=args.stake, max_stake=args.max_stake) for i in range(args.runs)]
+    elapsed = time.perf_counter() - start
+    wins = sum(r['won'] for r in results)
+    print(f"{args.runs} runs in {elapsed:.2f}s ({args.runs / elapsed:.0f} runs/s)")
+    print(f"Win rate: {wins / args.runs:.1%}  Mean blinds cleared: {sum(r['blinds_cleared'] for r in results) / args.runs:.2f}")
+    print("Stake reached:", dict(sorted(Counter(r['stake'] for r in results).items())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+# sprites.py
+# Pre-rendered die sprites: each distinct look is drawn once, then a hand or bag is just blits
+import math
+import os
+import time
+import pygame
+import constants
+import data
+from dice import Die
+from utils import draw_rounded_element
+from screens import draw_enhancement_visuals, draw_bag_enhancement_visuals, render_charm_tile
+
+PAD = 3  # Room around the die for the red discard outline
+
+
+class DieSpriteCache:
+    """Surfaces keyed by (style, color rgb, face value, size, discard highlight, enhancements).
+    Rainbow dice pass the current cycle color, so they only ever add one sprite per base color.
+    Cleared on window resize (see ChromaRollGame.on_resize), since fonts and sizes may change with it.
+    """
+    def __init__(self):
+        self.sprites = {}
+
+    def clear(self):
+        self.sprites.clear()
+
+    def hand_die(self, game, color_rgb, value, size, discard, enhancements):
+        """A hand die with pips and enhancement glyphs, PAD px of margin on each side (blit at rect.x - PAD)."""
+        key = ('hand', color_rgb, value, int(size), discard, tuple(enhancements))
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self.sprites[key] = self._render_hand_die(game, color_rgb, value, int(size), discard, enhancements)
+        return sprite
+
+    def bag_die(self, game, color_rgb, enhancements):
+        """A small bag die (no pips) with its enhancement glyphs, drawn at its rect's top-left."""
+        key = ('bag', color_rgb, tuple(enhancements))
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            size = constants.SMALL_DIE_SIZE
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            draw_rounded_element(sprite, pygame.Rect(0, 0, size, size), color_rgb, border_color=(0, 0, 0), border_width=1,
+                                 radius=constants.SMALL_DIE_BORDER_RADIUS,
+                                 inner_content=lambda r: draw_bag_enhancement_visuals(game, r, {'enhancements': enhancements}, sprite))
+            self.sprites[key] = sprite
+        return sprite
+
+    def _render_hand_die(self, game, color_rgb, value, size, discard, enhancements):
+        sprite = pygame.Surface((size + 2 * PAD, size + 2 * PAD), pygame.SRCALPHA)
+        if discard:
+            pygame.draw.rect(sprite, (255, 0, 0), sprite.get_rect(), 3, border_radius=constants.DIE_BORDER_RADIUS)
+
+        def inner(r):
+            for pos in data.DOT_POSITIONS.get(value, []):
+                pygame.draw.circle(sprite, (0, 0, 0), (r.x + pos[0] * r.width, r.y + pos[1] * r.height), constants.DOT_RADIUS)
+            draw_enhancement_visuals(game, r, {'enhancements': enhancements}, sprite)
+
+        draw_rounded_element(sprite, pygame.Rect(PAD, PAD, size, size), color_rgb, border_color=(0, 0, 0), border_width=2,
+                             radius=constants.DIE_BORDER_RADIUS, inner_content=inner)
+        return sprite
+
+
+class BagLayer:
+    """The bag panel (triangle, body and every die in it) composited once into one surface.
+    Rebuilt only when the bag's contents (DiceBag.version), any die's looks (Die.revision), the pouch color or
+    the window size (game.layout) change. Rainbow dice cycle colors, so their slots are left empty and blitted on top each frame.
+    """
+    def __init__(self):
+        self.key = None
+        self.surface = None
+        self.pos = (0, 0)
+        self.rainbow = []  # (die, screen topleft) for the dice drawn over the layer
+
+    def clear(self):
+        self.key = None
+
+    def draw(self, game):
+        key = (game.bag, game.bag.version, Die.revision, game.get_bag_color(), game.layout)
+        if key != self.key:
+            self._render(game)
+            self.key = key
+        game.screen.blit(self.surface, self.pos)
+        if self.rainbow:
+            color_index = int(time.time() / constants.CYCLE_SPEED) % len(constants.BASE_COLORS)
+            color_rgb = constants.COLORS[constants.BASE_COLORS[color_index]]
+            for die, topleft in self.rainbow:
+                game.screen.blit(game.die_sprites.bag_die(game, color_rgb, die['enhancements']), topleft)
+
+    def _render(self, game):
+        grid = game.layout.bag(len(game.bag))  # Same slots GameState hover-tests
+        bag_x, bag_y, bag_width, bag_height = grid.rect
+        top = 10  # The triangle pokes 10px above the bag
+        self.pos = (bag_x, bag_y - top)
+        self.surface = pygame.Surface((bag_width, bag_height + top), pygame.SRCALPHA)
+        bag_color = game.get_bag_color()
+        triangle_points = [(bag_width // 2, 2 * top), (bag_width // 2 - 15, 0), (bag_width // 2 + 15, 0)]
+        pygame.draw.polygon(self.surface, bag_color, triangle_points)
+        pygame.draw.polygon(self.surface, (0, 0, 0), triangle_points, 2)
+        draw_rounded_element(self.surface, pygame.Rect(0, top, bag_width, bag_height), bag_color, border_color=(0, 0, 0),
+                             border_width=2, radius=constants.BAG_BORDER_RADIUS)
+        self.rainbow = []
+        for slot, die in zip(grid.slots, sorted(game.bag, key=lambda d: d.code)):  # Color codes follow constants.COLORS order
+            if die['color'] == 'Rainbow':
+                self.rainbow.append((die, slot.topleft))
+            else:
+                self.surface.blit(game.die_sprites.bag_die(game, constants.COLORS[die['color']], die['enhancements']),
+                                  (slot.x - bag_x, slot.y - bag_y + top))
+
+
+class CharmTileCache:
+    """Finished charm surfaces, built on first use: the charm die keyed by (name, size, disabled), plus the bare
+    icons the debug panel and get_charm_surface show. Charm looks never change mid-game, so nothing is evicted.
+    """
+    def __init__(self):
+        self.surfaces = {}
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def tile(self, game, charm, size, disabled=False):
+        """The charm die (background, border, icon or fallback drawing), grayed out if disabled."""
+        key = ('tile', charm['name'], tuple(size), disabled)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.surfaces[key] = render_charm_tile(game, tuple(size), charm, disabled)
+        return surface
+
+    def icon(self, game, name, size):
+        """The charm's icon image scaled to size x size, or None if it has no icon file."""
+        key = ('icon', name, size)
+        if key not in self.surfaces:
+            path = game.charm_icon_paths.get(name)
+            icon = None
+            if path and os.path.exists(path):
+                icon = pygame.transform.smoothscale(pygame.image.load(path), (size, size))
+            self.surfaces[key] = icon
+        return self.surfaces[key]
+
+    def icon_surface(self, game, charm, disabled=False):
+        """The pre-loaded inner icon (grayscaled if disabled), or a gray placeholder with the name for charms without one."""
+        key = ('icon_surface', charm['name'], disabled)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            path = game.charm_icon_paths.get(charm['name'])
+            if path and path in game.charm_icon_cache:
+                surface = game.charm_icon_cache[path]
+                if disabled:
+                    surface = pygame.transform.grayscale(surface)
+            else:
+                surface = pygame.Surface((constants.CHARM_SIZE, constants.CHARM_SIZE))
+                surface.fill((200, 200, 200))  # Gray placeholder
+                surface.blit(game.tiny_font.render(charm['name'][:5], True, (0, 0, 0)), (10, 10))
+            self.surfaces[key] = surface
+        return surface
+
+
+class ZoomPyramid:
+    """An image plus pre-shrunk copies at 1/2, 1/4... size, for the splash pan and zoom.
+    draw() lays the image out exactly like scaling the whole thing by zoom would, but only scales the part that's on
+    screen, from the smallest level that's still at least as sharp as the output. An unchanged view (hold, done)
+    reuses the last scaled frame.
+    """
+    MIN_LEVEL_SIZE = 64
+
+    def __init__(self, image):
+        self.levels = [image]
+        while min(self.levels[-1].get_size()) >= 2 * self.MIN_LEVEL_SIZE:
+            w, h = self.levels[-1].get_size()
+            self.levels.append(pygame.transform.smoothscale(self.levels[-1], (w // 2, h // 2)))
+        self.last_key = None
+        self.last_frame = None
+
+    def draw(self, surface, zoom, view_y):
+        """Blits the image scaled by zoom, centered horizontally and scrolled down by view_y image pixels."""
+        image_width, image_height = self.levels[0].get_size()
+        scaled_width, scaled_height = int(image_width * zoom), int(image_height * zoom)
+        if scaled_width <= 0 or scaled_height <= 0:
+            return
+        x_pos = (surface.get_width() - scaled_width) // 2
+        y_pos = -int(view_y * zoom)
+        visible = pygame.Rect(x_pos, y_pos, scaled_width, scaled_height).clip(surface.get_rect())
+        if not visible:
+            return
+
+        level = 0
+        while level + 1 < len(self.levels) and self.levels[level + 1].get_width() >= scaled_width:
+            level += 1
+        source = self.levels[level]
+        fx = source.get_width() / scaled_width  # Source pixels per screen pixel
+        fy = source.get_height() / scaled_height
+        x0 = int((visible.left - x_pos) * fx)
+        y0 = int((visible.top - y_pos) * fy)
+        x1 = min(source.get_width(), math.ceil((visible.right - x_pos) * fx))
+        y1 = min(source.get_height(), math.ceil((visible.bottom - y_pos) * fy))
+        size = (max(1, round((x1 - x0) / fx)), max(1, round((y1 - y0) / fy)))
+
+        key = (level, x0, y0, x1, y1, size)
+        if key != self.last_key:
+            self.last_frame = pygame.transform.smoothscale(source.subsurface((x0, y0, x1 - x0, y1 - y0)), size)
+            self.last_key = key
+        surface.blit(self.last_frame, (x_pos + round(x0 / fx), y_pos + round(y0 / fy)))
@@ -1,5 +1,11 @@
 # states/base.py
+import time
+import pygame
+
+
 class State:
+    animated = True  # False for screens that only change on invalidate() or hover (shop, blinds, pause...); their clock-driven icons invalidate from update()
+
     def __init__(self, game):
         self.game = game  # Reference to ChromaRollGame for shared state (e.g., self.game.coins)
 
@@ -18,9 +24,86 @@ class State:
     def handle_event(self, event):
         pass  # Handle inputs/events
 
+    def is_animating(self):
+        """True while the screen changes on its own and must redraw every frame (temp messages fade out)."""
+        game = self.game
+        return self.animated or bool(game.temp_message and time.time() - game.temp_message_start < game.temp_message_duration)
+
+    def invalidate(self, rect=None):
+        """Asks for part of the screen (or all of it) to be redrawn on the next frame."""
+        self.game.state_machine.invalidate(rect)
+
+class Task:
+    """One scheduled job: on_step fires steps_left more times, interval seconds apart, then on_done fires."""
+    __slots__ = ('tag', 'interval', 'wait', 'steps_left', 'on_step', 'on_done')
+
+    def __init__(self, tag, interval, wait, steps_left, on_step, on_done):
+        self.tag = tag
+        self.interval = interval
+        self.wait = wait  # Seconds until the next step (or on_done)
+        self.steps_left = steps_left
+        self.on_step = on_step
+        self.on_done = on_done
+
+
+class Scheduler:
+    """Timers and frame-stepped animations run off dt instead of sleeping in the event handler.
+    Tasks carry a tag ('roll', 'break', 'temp_message'...) so a newer one can replace it, and input can
+    fast-forward it with finish(). StateMachine.update ticks it whatever the state, so a timer started on
+    one screen (a shop temp message, a break overlay before pausing) still runs out on another.
+    """
+    def __init__(self):
+        self.tasks = []
+
+    def after(self, delay, on_done, tag=None):
+        """Calls on_done once delay seconds have passed."""
+        task = Task(tag, delay, delay, 0, None, on_done)
+        self.tasks.append(task)
+        return task
+
+    def repeat(self, interval, count, on_step, on_done=None, tag=None):
+        """Calls on_step now and then every interval seconds, count times in all, then on_done one interval later."""
+        on_step()
+        task = Task(tag, interval, interval, count - 1, on_step, on_done)
+        self.tasks.append(task)
+        return task
+
+    def update(self, dt):
+        for task in list(self.tasks):  # Callbacks may add, cancel or finish tasks
+            task.wait -= dt
+            while task.wait <= 0 and task in self.tasks:
+                if task.steps_left > 0:
+                    task.steps_left -= 1
+                    task.wait += task.interval
+                    task.on_step()
+                else:
+                    self.tasks.remove(task)
+                    if task.on_done:
+                        task.on_done()
+
+    def finish(self, tag):
+        """Jumps tasks with this tag to their end: skips the remaining steps and runs on_done now."""
+        for task in [t for t in self.tasks if t.tag == tag]:
+            if task in self.tasks:
+                self.tasks.remove(task)
+                if task.on_done:
+                    task.on_done()
+
+    def cancel(self, tag):
+        """Drops tasks with this tag without running them."""
+        self.tasks = [t for t in self.tasks if t.tag != tag]
+
+    def busy(self, tag=None):
+        return any(tag is None or t.tag == tag for t in self.tasks)
+
+
 class StateMachine:
     def __init__(self, game, initial_state):
         self.game = game
+        self.scheduler = Scheduler()  # Roll animations and effect timers (ticked by update)
+        self.full_redraw = True  # Next render pushes the whole screen (state change, resize)
+        self.dirty = []  # Rects reported through invalidate() (states, hover flips)
+        self.was_animating = False
         self.current_state = initial_state
         self.current_state.enter()
 
@@ -28,12 +111,47 @@ class StateMachine:
         self.current_state.exit()
         self.current_state = new_state
         self.current_state.enter()
+        self.invalidate()
+
+    def invalidate(self, rect=None):
+        if rect is None:
+            self.full_redraw = True
+        else:
+            self.dirty.append(pygame.Rect(rect))
 
     def update(self, dt):
+        self.scheduler.update(dt)
         self.current_state.update(dt)
 
     def draw(self):
+        self.game.hover_targets, self.game.tooltip_rects = [], []  # Refilled by this draw (screens.hovering/draw_tooltip)
         self.current_state.draw()
 
+    def render(self):
+        """Draws the current state if anything changed. Returns None when the whole display should be flipped,
+        else the screen rects to update ([] = nothing to do, the frame is skipped).
+        """
+        animating = self.current_state.is_animating()
+        if animating or self.full_redraw or self.was_animating:  # Last case: wipe the final animated frame
+            self.draw()
+            self.was_animating = animating
+            self.full_redraw, self.dirty = False, []
+            return None
+        if not self.dirty:
+            return []
+        old_tooltips = self.game.tooltip_rects
+        self.draw()
+        rects = self.dirty + old_tooltips + self.game.tooltip_rects  # Tooltips come and go with the hover
+        self.dirty = []
+        return rects
+
+    def track_hover(self, pos):
+        """Invalidates the rects whose hover differs from the last draw, so mouse moves only redraw what lights up."""
+        for rect, hovered in self.game.hover_targets:
+            if rect.collidepoint(pos) != hovered:
+                self.invalidate(rect.inflate(4, 4))  # Room for hover borders drawn on the edge
+
     def handle_event(self, event):
-        self.current_state.handle_event(event)
\ No newline at end of file
+        if event.type == pygame.MOUSEMOTION:
+            self.track_hover(event.pos)
+        self.current_state.handle_event(event)
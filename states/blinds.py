@@ -1,7 +1,5 @@
 # states/blinds.py
 import pygame
-import random
-import copy
 from constants import *  # For THEME, BUTTON_WIDTH, BASE_TARGETS, etc.
 from utils import draw_rounded_element, resource_path  # For buttons/UI elements
 from screens import draw_blinds_screen, draw_custom_button  # For main blinds drawing/buttons
@@ -14,6 +12,7 @@ from states.game import GameState
 
 
 class BlindsState(State):
+    animated = False
     def __init__(self, game):
         super().__init__(game)
         self.continue_rect = None
@@ -21,18 +20,23 @@ class BlindsState(State):
         self.up_rect = None
         self.down_rect = None
         self.debug_jump_rect = None
-        # For item rects in dropdown (since dynamic, recalculate in handle_event)
+        self.odds_pending = False  # Clear odds being worked out on the game's worker thread
+        # Dropdown item rects come from game.blinds_layout, same as the draw
 
     def enter(self):
+        self.game.update_layouts()
         # Reset any blinds-specific vars (e.g., debug states)
         self.game.debug_boss_dropdown_open = False  # If not already reset
         self.game.debug_boss_scroll_offset = 0
         # Conditional: Generate upcoming boss only if None (fix randomize every entry)
         if self.game.upcoming_boss_effect is None:
-            self.game.upcoming_boss_effect = random.choice(BOSS_EFFECTS)
+            self.game.upcoming_boss_effect = self.game.rng.boss.choice(BOSS_EFFECTS)
 
     def update(self, dt):
-        pass  # No ongoing updates? Leave empty
+        busy = self.game.clear_odds_busy()
+        if self.odds_pending and not busy:
+            self.invalidate()  # The odds landed; show them in the blind's box
+        self.odds_pending = busy
 
     def draw(self):
         self.game.screen.fill(THEME['background'])  # Clear relics
@@ -41,6 +45,11 @@ class BlindsState(State):
     def handle_event(self, event):
         from states.shop import ShopState  # Lazy import
         from states.init import InitState
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_o:
+            self.game.get_clear_odds()  # Starts working out the clear odds shown in the current blind's box
+            self.odds_pending = self.game.clear_odds_busy()
+            self.invalidate()  # "computing..." until they land
+            return
         if event.type == pygame.MOUSEBUTTONDOWN:
             mouse_pos = pygame.mouse.get_pos()
             if self.continue_rect and self.continue_rect.collidepoint(mouse_pos):
@@ -51,33 +60,35 @@ class BlindsState(State):
                 self.game.discard_selected = [False] * NUM_DICE_IN_HAND
                 self.game.is_discard_phase = True  # Start with discard
                 self.game.has_rolled = False
-                self.game.bag[:] = [copy.deepcopy(d) for d in self.game.full_bag]  # Refill bag
+                self.game.bag.refill(self.game.full_bag)  # Refill bag
                 self.game.state_machine.change_state(GameState(self.game))
                 return
 
             if DEBUG:
                 if self.debug_button_rect and self.debug_button_rect.collidepoint(mouse_pos):
                     self.game.debug_boss_dropdown_open = not self.game.debug_boss_dropdown_open  # Toggle panel
+                    self.invalidate(self.game.blinds_layout.panel_rect)
 
                 if self.game.debug_boss_dropdown_open:
+                    layout = self.game.blinds_layout
                     if self.up_rect and self.up_rect.collidepoint(mouse_pos):
                         self.game.debug_boss_scroll_offset = max(0, self.game.debug_boss_scroll_offset - 1)
+                        self.invalidate(layout.panel_rect)
                     if self.down_rect and self.down_rect.collidepoint(mouse_pos):
-                        self.game.debug_boss_scroll_offset = min(len(BOSS_EFFECTS) - (300 // 25), self.game.debug_boss_scroll_offset + 1)  # Hardcode as in old code
+                        self.game.debug_boss_scroll_offset = min(len(BOSS_EFFECTS) - layout.visible_items, self.game.debug_boss_scroll_offset + 1)
+                        self.invalidate(layout.panel_rect)
 
-                    # Click on item: Recalculate item rects (since dynamic)
-                    panel_x, panel_y = self.debug_button_rect.x - 300, self.debug_button_rect.y - 300  # Match draw position
-                    item_height = 25
-                    for i in range(self.game.debug_boss_scroll_offset, min(self.game.debug_boss_scroll_offset + (300 // item_height), len(BOSS_EFFECTS))):
-                        item_rect = pygame.Rect(panel_x, panel_y + (i - self.game.debug_boss_scroll_offset) * item_height, 370, item_height)  # Full row clickable
-                        if item_rect.collidepoint(mouse_pos):
+                    # Click on item (rows laid out like the draw)
+                    for i in range(self.game.debug_boss_scroll_offset, min(self.game.debug_boss_scroll_offset + layout.visible_items, len(BOSS_EFFECTS))):
+                        if layout.item_rect(i - self.game.debug_boss_scroll_offset).collidepoint(mouse_pos):
                             self.game.upcoming_boss_effect = BOSS_EFFECTS[i]
                             self.game.debug_boss_dropdown_open = False  # Close on select
+                            self.invalidate()  # Boss preview text changes too
                             break
 
                 if self.debug_jump_rect and self.debug_jump_rect.collidepoint(mouse_pos):
                     self.game.current_blind = 'Boss'
-                    self.game.current_boss_effect = self.game.upcoming_boss_effect or random.choice(BOSS_EFFECTS)  # Activate preview or random
+                    self.game.current_boss_effect = self.game.upcoming_boss_effect or self.game.rng.boss.choice(BOSS_EFFECTS)  # Activate preview or random
                     # Quick reset states (mimic advance_blind)
                     self.game.disabled_charms = []
                     self.game.boss_reroll_count = 0
@@ -86,16 +97,16 @@ class BlindsState(State):
                     # Apply effect setups (copy from advance_blind 'Boss' block)
                     effect_name = self.game.current_boss_effect['name']
                     if effect_name == 'Charm Glitch' and self.game.equipped_charms:
-                        self.game.disabled_charms = [random.randint(0, len(self.game.equipped_charms) - 1)]
+                        self.game.disabled_charms = [self.game.rng.boss.randint(0, len(self.game.equipped_charms) - 1)]
                     elif effect_name == 'Charm Eclipse':
                         self.game.disabled_charms = list(range(len(self.game.equipped_charms)))
                     elif effect_name == 'Rainbow Restriction':
-                        self.game.boss_rainbow_color = random.choice(BASE_COLORS)
+                        self.game.boss_rainbow_color = self.game.rng.boss.choice(BASE_COLORS)
                     elif effect_name == 'Face Shuffle':
                         for die in self.game.full_bag:
                             faces = DICE_FACES[:]
-                            random.shuffle(faces)
-                            self.game.boss_shuffled_faces[die['id']] = faces
+                            self.game.rng.boss.shuffle(faces)
+                            self.game.boss_shuffled_faces[die['id']] = tuple(faces)
                     elif effect_name == 'Charm Tax':
                         tax = len(self.game.equipped_charms) // 2
                         self.game.hands_left = max(0, self.game.hands_left - tax)
@@ -109,6 +120,6 @@ class BlindsState(State):
                         self.game.discards_left += 1
                     # Reset round elements
                     self.game.round_score = 0
-                    self.game.bag[:] = [copy.deepcopy(d) for d in self.game.full_bag]  # Refill
+                    self.game.bag.refill(self.game.full_bag)  # Refill
                     self.game.state_machine.change_state(GameState(self.game))  # Jump to 'game'
                     self.game.new_turn()  # Start Boss turn
\ No newline at end of file
@@ -6,6 +6,7 @@ from screens import draw_shop_screen, draw_confirm_sell_popup
 from constants import THEME
 
 class ConfirmSellState(State):
+    animated = False
     def __init__(self, game):
         super().__init__(game)
         self.yes_rect = None
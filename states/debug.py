@@ -56,6 +56,9 @@ class DebugMenuState(State):
         self.game.screen.fill(THEME['background'])
         title_text = self.game.font.render("Debug Menu", True, THEME['text'])
         self.game.screen.blit(title_text, (self.game.width // 2 - title_text.get_width() // 2, 50))
+        cache = self.game.text_cache
+        stats_text = self.game.tiny_font.render(f"Text cache: {len(cache.surfaces)} surfaces, {cache.hit_rate:.1%} hits", True, THEME['text'])
+        self.game.screen.blit(stats_text, (self.game.width // 2 - stats_text.get_width() // 2, 110))
 
         mouse_pos = pygame.mouse.get_pos()
         # No need to re-set rects; just draw buttons
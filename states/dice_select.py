@@ -1,20 +1,28 @@
 # states/dice_select.py
+import time
 import pygame
-import copy
 from states.base import State
 from screens import draw_dice_select_screen
-from constants import THEME, DICE_FACES
+from constants import THEME, CYCLE_SPEED
+from dice import Die
 
 class DiceSelectState(State):
+    animated = False
     def __init__(self, game):
         super().__init__(game)
         self.choice_rects = None  # List of (rect, color) tuples
+        self.cycle_tick = None  # CYCLE_SPEED tick the Rainbow choice was last drawn on
 
     def enter(self):
         pass  # Pack choices already set
 
     def update(self, dt):
-        pass
+        tick = int(time.time() / CYCLE_SPEED)  # Rainbow choice changes color every CYCLE_SPEED
+        if tick != self.cycle_tick:
+            self.cycle_tick = tick
+            for choice_rect, color in self.choice_rects or []:
+                if color == 'Rainbow':
+                    self.invalidate(choice_rect)
 
     def draw(self):
         self.game.screen.fill(THEME['background'])  # Clear relics
@@ -27,10 +35,9 @@ class DiceSelectState(State):
             for choice_rect, color in self.choice_rects or []:
                 if choice_rect.collidepoint(mouse_pos):
                     # Add new die
-                    new_id = f"{color}{len([d for d in self.game.bag if d['color'] == color]) + 1}"
-                    new_die = {'id': new_id, 'color': color, 'faces': DICE_FACES[:]}
+                    new_die = Die(self.game.new_die_id(color), color)
                     self.game.bag.append(new_die)
-                    self.game.full_bag.append(copy.deepcopy(new_die))
+                    self.game.full_bag.append(new_die)
                     self.game.pack_choices = []
                     self.game.state_machine.change_state(ShopState(self.game))  # Back to shop
                     break
\ No newline at end of file
@@ -1,10 +1,9 @@
 # states/game.py
 import pygame
 import time
-import math
 from states.base import State  # Import from base
 from screens import draw_game_screen, draw_popup, draw_buttons, draw_tooltip, draw_enhancement_visuals
-from constants import DEBUG, NUM_DICE_IN_HAND, THEME, DIE_SIZE, HELD_DIE_SCALE, CHARM_SIZE, SMALL_DIE_SIZE, SMALL_DIE_SPACING, BAG_PADDING
+from constants import DEBUG, NUM_DICE_IN_HAND, THEME
 from data import ENH_DESC
 import savegame
 
@@ -21,10 +20,9 @@ class GameState(State):
         self.hovered_bag_die = None   # Index for bag dice, or None
         self.hand_die_rects = []  # For 5 in-play dice
         self.bag_die_rects = []   # For bag visuals (upper right)
-        self.tray_rects = []  # Store for click
-        game.apply_boss_face_shuffle()  # Apply on resume/load into game state
 
     def enter(self):
+        self.game.update_layouts()  # Die slots, buttons, charm and tray rects (layout.GameLayout)
         if self.game.is_resuming:
             print("Resuming GameState - Skipping init pull")  # Debug
             self.game.is_resuming = False
@@ -39,19 +37,6 @@ class GameState(State):
         else:
             self.game.new_turn()  # If has hand but not rolled? Rare, but handle
 
-    def update(self, dt):
-        # Handle animations/timers (e.g., break effects, temp messages)
-        if self.game.break_effect_start:
-            elapsed = time.time() - self.game.break_effect_start
-            if elapsed > self.game.break_effect_duration:
-                self.game.break_effect_start = 0  # Reset
-                # Clear broken dice or other logic
-        if self.game.temp_message_start:
-            elapsed = time.time() - self.game.temp_message_start
-            if elapsed > self.game.temp_message_duration:
-                self.game.temp_message = None  # Fade out complete
-        # Add more updates as needed (e.g., color cycling for rainbow)
-
     def draw(self):
         self.game.screen.fill(THEME['background'])  # Clear relics and prevent stacking
         from screens import draw_game_screen
@@ -105,6 +90,8 @@ class GameState(State):
                     draw_tooltip(self.game, small_rect.x, small_rect.y + small_rect.height + 10, enh_desc or "No enhancements")
 
     def handle_event(self, event):
+        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN):
+            self.game.state_machine.scheduler.finish('roll')  # Any click or key skips the roll animation to its result
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 from states.pause import PauseMenuState  # Lazy import
@@ -112,6 +99,8 @@ class GameState(State):
                 savegame.save_game(self.game)  # Save
                 self.game.previous_state = self  # Instance
                 self.game.state_machine.change_state(PauseMenuState(self.game))
+            elif event.key == pygame.K_h:
+                self.game.apply_best_hold()  # Hold advisor hint
 
         if event.type == pygame.MOUSEBUTTONDOWN:
             mouse_pos = pygame.mouse.get_pos()
@@ -124,15 +113,10 @@ class GameState(State):
                     self.game.state_machine.change_state(ShopState(self.game))
                     return
 
+            layout = self.game.layout
             # Dice clicks
             for i in range(NUM_DICE_IN_HAND):
-                total_dice_width = NUM_DICE_IN_HAND * (DIE_SIZE + 20) - 20
-                start_x = (self.game.width - total_dice_width) // 2
-                x = start_x + i * (DIE_SIZE + 20)
-                size = DIE_SIZE * HELD_DIE_SCALE if self.game.held[i] else DIE_SIZE
-                offset = (DIE_SIZE - DIE_SIZE * HELD_DIE_SCALE) / 2 if self.game.held[i] else 0
-                die_rect = pygame.Rect(x + offset, self.game.height - DIE_SIZE - 100 + offset, size, size)
-                if die_rect.collidepoint(mouse_pos):
+                if layout.hand_die_rect(i, self.game.held[i]).collidepoint(mouse_pos):
                     if self.game.is_discard_phase:
                         self.game.toggle_discard(i)
                     else:
@@ -152,22 +136,22 @@ class GameState(State):
 
             # Charm drag start
             for i in range(len(self.game.equipped_charms)):
-                x = 50 + i * (CHARM_SIZE + 10)
-                y = 10
-                rect = pygame.Rect(x, y, CHARM_SIZE, CHARM_SIZE)
+                rect = layout.charm_rect(i)
                 if rect.collidepoint(mouse_pos):
                     self.game.dragging_charm_index = i
                     self.game.dragging_shop = False
-                    self.game.drag_offset_x = mouse_pos[0] - x
-                    self.game.drag_offset_y = mouse_pos[1] - y
+                    self.game.drag_offset_x = mouse_pos[0] - rect.x
+                    self.game.drag_offset_y = mouse_pos[1] - rect.y
                     break
 
-            for i, tray_rect in enumerate(self.tray_rects):
+            for i, tray_rect in enumerate(layout.tray_slots):
                 if tray_rect.collidepoint(mouse_pos) and self.game.rune_tray[i]:
                     from states.rune import RuneUseState  # Lazy import
                     rune = self.game.rune_tray[i]
                     # Prompt for die if max_dice > 0 (change to RuneUseState similar to Select)
-                    self.game.state_machine.change_state(RuneUseState(self.game, rune))  # New state stub
+                    self.game.previous_state = self  # Rune screen comes back here (like the shop tray)
+                    self.game.is_resuming = True  # Keep the current hand on return
+                    self.game.state_machine.change_state(RuneUseState(self.game, rune))
                     self.game.rune_tray[i] = None  # Remove after use
 
         if event.type == pygame.MOUSEMOTION:
@@ -199,10 +183,7 @@ class GameState(State):
                 mouse_pos = pygame.mouse.get_pos()
                 target_index = -1
                 for i in range(len(self.game.equipped_charms)):
-                    x = 50 + i * (CHARM_SIZE + 10)
-                    y = 10
-                    rect = pygame.Rect(x, y, CHARM_SIZE, CHARM_SIZE)
-                    if rect.collidepoint(mouse_pos):
+                    if self.game.layout.charm_rect(i).collidepoint(mouse_pos):
                         target_index = i
                         break
                 if target_index != -1 and target_index != self.game.dragging_charm_index:
@@ -219,29 +200,13 @@ class GameState(State):
 
     # In class GameState
     def update_die_rects(self):
-        # Hand dice rects (from your draw_dice logic)
-        #  print("Updating die rects")  # Temp debug—remove later
-        self.game.hand_die_rects = []
-        for i in range(NUM_DICE_IN_HAND):
-            total_dice_width = NUM_DICE_IN_HAND * (DIE_SIZE + 20) - 20
-            start_x = (self.game.width - total_dice_width) // 2
-            x = start_x + i * (DIE_SIZE + 20)
-            size = DIE_SIZE * HELD_DIE_SCALE if self.game.held[i] else DIE_SIZE
-            offset = (DIE_SIZE - size) / 2 if self.game.held[i] else 0
-            rect = pygame.Rect(x + offset, self.game.height - DIE_SIZE - 100 + offset, size, size)
-            self.game.hand_die_rects.append(rect)
-
-        # Bag dice rects (from your draw_game_screen bag loop)
-        self.game.bag_die_rects = []
-        columns = 5
-        rows = math.ceil(len(self.game.bag) / columns) if self.game.bag else 1
-        bag_width = columns * (SMALL_DIE_SIZE + SMALL_DIE_SPACING) - SMALL_DIE_SPACING + BAG_PADDING * 2
-        bag_x = self.game.width - bag_width - 20
-        bag_y = 50
-        for j in range(len(self.game.bag)):
-            col = j % columns
-            row = j // columns
-            small_x = bag_x + BAG_PADDING + col * (SMALL_DIE_SIZE + SMALL_DIE_SPACING)
-            small_y = bag_y + BAG_PADDING + row * (SMALL_DIE_SIZE + SMALL_DIE_SPACING)
-            rect = pygame.Rect(small_x, small_y, SMALL_DIE_SIZE, SMALL_DIE_SIZE)
-            self.game.bag_die_rects.append(rect)
\ No newline at end of file
+        """Hover rects for the hand and bag dice, straight from the layout the screen is drawn with."""
+        layout = self.game.layout
+        self.game.hand_die_rects = [layout.hand_die_rect(i, self.game.held[i]) for i in range(NUM_DICE_IN_HAND)]
+
+        # Bag dice are drawn sorted by color (sprites.BagLayer); bag_die_rects[j] is where self.game.bag[j] landed
+        bag = self.game.bag
+        slots = layout.bag(len(bag)).slots
+        self.game.bag_die_rects = [None] * len(bag)
+        for slot, j in zip(slots, sorted(range(len(bag)), key=lambda j: bag[j].code)):
+            self.game.bag_die_rects[j] = slot
@@ -7,6 +7,7 @@ from screens import draw_game_over_screen
 from constants import THEME
 
 class GameOverState(State):
+    animated = False
     def __init__(self, game):
         super().__init__(game)
         self.restart_rect = None
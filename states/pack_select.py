@@ -6,6 +6,7 @@ from screens import draw_pack_select_screen
 from constants import THEME, PACK_BOOST
 
 class PackSelectState(State):
+    animated = False
     def __init__(self, game):
         super().__init__(game)
         self.choice_rects = None  # List of rects for choices
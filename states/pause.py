@@ -8,6 +8,7 @@ from constants import THEME
 import savegame
 
 class PauseMenuState(State):
+    animated = False
     def __init__(self, game):
         super().__init__(game)
         self.button_rects = None  # List of (rect, option) tuples
@@ -35,6 +36,7 @@ class PauseMenuState(State):
             mouse_pos = pygame.mouse.get_pos()
             if self.mute_button_rect and self.mute_button_rect.collidepoint(mouse_pos):
                 self.game.toggle_mute()
+                self.invalidate(self.mute_button_rect)  # Speaker icon flips
             for rect, opt in self.button_rects or []:
                 if rect.collidepoint(mouse_pos):
                     if opt == "Return to Game" or event.key == pygame.K_ESCAPE:
@@ -58,8 +58,7 @@ class PromptState(State):
                         self.game.state_machine.change_state(InitState(self.game))  # Fallback
                 else:
                     # New: Handle corrupt/missing save
-                    self.game.temp_message = "Save file corrupted or missing—starting new game."
-                    self.game.temp_message_start = time.time()
+                    self.game.show_temp_message("Save file corrupted or missing—starting new game.")
                     savegame.delete_save()  # Optional: Clean up corrupt file
                     self.game.reset_game()
                     self.game.state_machine.change_state(InitState(self.game))  # Start fresh
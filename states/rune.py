@@ -2,7 +2,6 @@
 import pygame
 import time
 import math
-import random
 from states.base import State
 from screens import draw_custom_button, draw_tooltip, draw_rounded_element
 from utils import wrap_text
@@ -13,7 +12,7 @@ class RuneSelectState(State):
         super().__init__(game)
         self.selected_rune_index = -1
         self.selected_die_indices = []  # List for multi-select
-        self.random_dice = random.sample(self.game.bag, min(8, len(self.game.bag)))  # 8 random for mod
+        self.random_dice = self.game.rng.enhancements.sample(self.game.bag, min(8, len(self.game.bag)))  # 8 random for mod
         self.rune_rects = []  # To store for handle_event
         self.die_rects = []   # To store for handle_event
         self.confirm_rect = None
@@ -152,7 +151,7 @@ class RuneSelectState(State):
                     self.preview_mode = False
                     self.preview_message = ""
                     self.preview_dies = []
-                    self.random_dice = random.sample(self.game.bag, min(8, len(self.game.bag)))  # Refresh after preview
+                    self.random_dice = self.game.rng.enhancements.sample(self.game.bag, min(8, len(self.game.bag)))  # Refresh after preview
                     if self.applied_count >= self.game.pack_select_count:
                         self.game.state_machine.change_state(ShopState(self.game))
             return  # Skip other events in preview
@@ -202,7 +201,7 @@ class RuneSelectState(State):
                     self.selected_rune_index = -1  # Reset after pop
                     self.applied_count += 1  # Count hold as select
                     self.selected_die_indices = []
-                    self.random_dice = random.sample(self.game.bag, min(8, len(self.game.bag)))  # Refresh after hold
+                    self.random_dice = self.game.rng.enhancements.sample(self.game.bag, min(8, len(self.game.bag)))  # Refresh after hold
                     if self.applied_count >= self.game.pack_select_count:
                         self.game.state_machine.change_state(ShopState(self.game))
 
@@ -222,7 +221,7 @@ class RuneUseState(State):
         super().__init__(game)
         self.rune = rune  # Single rune to apply
         self.selected_die_indices = []  # For multi if max_dice > 0
-        self.random_dice = random.sample(self.game.bag, min(8, len(self.game.bag)))  # 8 random for mod
+        self.random_dice = self.game.rng.enhancements.sample(self.game.bag, min(8, len(self.game.bag)))  # 8 random for mod
         self.die_rects = []   # To store for handle_event
         self.confirm_rect = None
         self.cancel_rect = None  # To cancel back
@@ -1,16 +1,15 @@
 # states/shop.py
 import pygame
-import random  # If used for shop generation
 import time
 import copy
-import os
 from constants import *  # For THEME, BUTTON_WIDTH, SHOP_REROLL_COST, etc.
 from utils import draw_rounded_element, resource_path, wrap_text  # For UI/buttons
-from screens import draw_shop_screen, draw_custom_button, draw_tooltip  # For main shop drawing/buttons
+from screens import draw_shop_screen, draw_custom_button, draw_tooltip, hovering  # For main shop drawing/buttons
 from data import CHARMS_POOL  # For charm generation/packs
 from states.base import State
 
 class ShopState(State):
+    animated = False
     def __init__(self, game):
         super().__init__(game)
         self.continue_rect = None
@@ -24,10 +23,11 @@ class ShopState(State):
         self.debug_panel_open = False  # Flag for debug panel
         self.scroll_y = 0  # For debug panel scrolling
         self.charm_rects = []  # Store debug panel rects
-        self.tray_rects = []  # For tray clicks
         self.debug_button_rect = None  # New for debug menu button
+        self.pack_tick = None  # Clock tick the dice-pack icons were last drawn on
 
     def enter(self):
+        self.game.update_layouts()
         # Generate shop if empty
         if not self.game.shop_charms:
             self.game.generate_shop()
@@ -35,7 +35,13 @@ class ShopState(State):
         self.scroll_y = 0  # Reset scroll
 
     def update(self, dt):
-        pass  # Expand for animations if needed
+        # Dice-pack icons cycle colors off the clock (screens.draw_pack_icon: die i shifted 0.2 s), so repaint them per tick
+        tick = int(time.time() * 5)
+        if tick != self.pack_tick:
+            self.pack_tick = tick
+            for pack_rect, pack_idx in self.pack_rects or []:
+                if pack_idx in (3, 4, 5):
+                    self.invalidate(pack_rect)
 
     def draw(self):
         self.game.screen.fill(THEME['background'])  # Clear relics
@@ -44,11 +50,9 @@ class ShopState(State):
         
         # Debug button (bottom-right to avoid prism packs)
         if DEBUG:
-            button_x = self.game.width - DEBUG_BUTTON_SIZE[0] - 50  # Bottom-right
-            button_y = self.game.height - DEBUG_BUTTON_SIZE[1] - 50
-            self.debug_rect = pygame.Rect(button_x, button_y, *DEBUG_BUTTON_SIZE)
+            self.debug_rect = self.game.shop_layout.debug_rect  # Bottom-right
             draw_custom_button(self.game, self.debug_rect, DEBUG_BUTTON_TEXT, 
-                              is_hover=self.debug_rect.collidepoint(pygame.mouse.get_pos()))
+                              is_hover=hovering(self.game, self.debug_rect))
             
             # Draw debug panel if open
             if self.debug_panel_open:
@@ -59,8 +63,8 @@ class ShopState(State):
             # Add this: New debug menu button (e.g., next to existing debug button)
             if DEBUG and DEBUG_MENU_IN_SHOP:
                 # Position: Below or beside existing debug button (adjust coords as needed)
-                self.debug_button_rect = pygame.Rect(button_x, button_y - 60, 150, 50)  # Above existing, example
-                draw_custom_button(self.game, self.debug_button_rect, "Debug Menu", is_hover=self.debug_button_rect.collidepoint(pygame.mouse.get_pos()))
+                self.debug_button_rect = self.game.shop_layout.debug_menu_rect  # Above existing
+                draw_custom_button(self.game, self.debug_button_rect, "Debug Menu", is_hover=hovering(self.game, self.debug_button_rect))
 
     def handle_event(self, event):
         from states.blinds import BlindsState  # Lazy import here - loads only when method runs
@@ -78,8 +82,10 @@ class ShopState(State):
                 max_scroll = max(0, total_content_height - DEBUG_PANEL_HEIGHT)
                 if event.key == pygame.K_UP:
                     self.scroll_y = max(0, self.scroll_y - 50)
+                    self.invalidate(self.debug_panel_rect)
                 elif event.key == pygame.K_DOWN:
                     self.scroll_y = min(self.scroll_y + 50, max_scroll)
+                    self.invalidate(self.debug_panel_rect)
 
         if event.type == pygame.MOUSEBUTTONDOWN:
             mouse_pos = pygame.mouse.get_pos()
@@ -88,6 +94,7 @@ class ShopState(State):
             if DEBUG and self.debug_rect and self.debug_rect.collidepoint(mouse_pos):
                 self.debug_panel_open = not self.debug_panel_open
                 print(f"DEBUG: Panel {'opened' if self.debug_panel_open else 'closed'}")
+                self.invalidate()  # Panel covers the shop; tooltips come back when it closes
                 return
             
             # Handle debug panel interactions
@@ -96,15 +103,13 @@ class ShopState(State):
                     if rect.collidepoint(mouse_pos):
                         if action == 'close':
                             self.debug_panel_open = False
-                            self.game.temp_message = "Debug panel closed"
-                            self.game.temp_message_start = time.time()
+                            self.game.show_temp_message("Debug panel closed")
                         elif action == 'equip_all':
                             for charm in CHARMS_POOL:
                                 if charm['name'] not in [c['name'] for c in self.game.equipped_charms] and len(self.game.equipped_charms) < self.game.max_charms * 2:
                                     self.game.equipped_charms.append(copy.deepcopy(charm))
                             print("DEBUG: Equipped all available charms!")
-                            self.game.temp_message = "Equipped all possible charms!"
-                            self.game.temp_message_start = time.time()
+                            self.game.show_temp_message("Equipped all possible charms!")
                         elif action and len(self.game.equipped_charms) < self.game.max_charms * 2:
                             if any(c['name'] == action['name'] for c in self.game.equipped_charms):
                                 print(f"DEBUG: {action['name']} already owned")
@@ -113,11 +118,11 @@ class ShopState(State):
                                 self.game.equipped_charms.append(copy.deepcopy(action))
                                 print(f"DEBUG: Added {action['name']} (free)")
                                 self.game.temp_message = f"Added {action['name']}!"
-                            self.game.temp_message_start = time.time()
+                            self.game.show_temp_message(self.game.temp_message)
                         else:
                             print("DEBUG: Max charms reached")
-                            self.game.temp_message = "No charm slots left!"
-                            self.game.temp_message_start = time.time()
+                            self.game.show_temp_message("No charm slots left!")
+                        self.invalidate()  # Equipped charms / OWNED marks changed
                         return
             
             # Add this: Handle new debug menu button click
@@ -143,17 +148,8 @@ class ShopState(State):
             # Handle buy charms
             for i, buy_rect in enumerate(self.buy_rects or []):
                 if buy_rect.collidepoint(mouse_pos):
-                    charm = self.game.shop_charms.pop(i)
-                    cost = charm['cost']
-                    has_debt = any(c['type'] == 'negative_coins' for c in self.game.equipped_charms)
-                    min_coins = -5 if has_debt else 0
-                    if len(self.game.equipped_charms) < self.game.max_charms and self.game.coins - cost >= min_coins:
-                        self.game.equipped_charms.append(charm)
-                        self.game.coins -= cost
-                        if self.game.current_boss_effect and self.game.current_boss_effect['name'] == 'Charm Eclipse':
-                            self.game.disabled_charms = list(range(len(self.game.equipped_charms)))
-                    else:
-                        self.game.shop_charms.insert(i, charm)
+                    self.game.buy_shop_charm(i)
+                    self.invalidate()  # Coins, shop row and equipped row
                     return
 
              # Pack buys
@@ -169,21 +165,21 @@ class ShopState(State):
                         self.game.coins -= cost
                         if pack_idx in [0, 1, 2]:
                             from states.pack_select import PackSelectState  # Lazy import
-                            self.game.pack_choices = random.sample(data.HAND_TYPES, pack_choices_num[pack_idx])
+                            self.game.pack_choices = self.game.rng.shop.sample(data.HAND_TYPES, pack_choices_num[pack_idx])
                             self.game.state_machine.change_state(PackSelectState(self.game))
                             self.game.available_packs.remove(pack_idx)
                         elif pack_idx in [3, 4, 5]:
                             from states.dice_select import DiceSelectState  # Lazy import
                             if pack_idx == 5:
-                                self.game.pack_choices = random.sample(SPECIAL_COLORS, pack_choices_num[pack_idx])
+                                self.game.pack_choices = self.game.rng.shop.sample(SPECIAL_COLORS, pack_choices_num[pack_idx])
                             else:
-                                self.game.pack_choices = random.sample(BASE_COLORS, pack_choices_num[pack_idx])
+                                self.game.pack_choices = self.game.rng.shop.sample(BASE_COLORS, pack_choices_num[pack_idx])
                             self.game.state_machine.change_state(DiceSelectState(self.game))
                             self.game.available_packs.remove(pack_idx)
                         elif pack_idx in [6, 7, 8]:  # New: Rune packs
                             from states.rune import RuneSelectState  # Lazy import
                             rune_pack = data.RUNE_PACKS[pack_idx - 6]  # Map to 0-2 index
-                            self.game.pack_choices = random.sample(data.MYSTIC_RUNES, pack_choices_num[pack_idx])
+                            self.game.pack_choices = self.game.rng.shop.sample(data.MYSTIC_RUNES, pack_choices_num[pack_idx])
                             self.game.pack_select_count = pack_select_num[pack_idx]  # Track how many to select
                             self.game.selected_runes = []  # For multi-select/holding
                             self.game.state_machine.change_state(RuneSelectState(self.game))
@@ -193,22 +189,22 @@ class ShopState(State):
             # Reroll
             if self.reroll_rect and self.reroll_rect.collidepoint(mouse_pos):
                 self.game.reroll_shop()
+                self.invalidate()  # Coins and shop row
                 return
 
             # Charm drag start
             for i in range(len(self.game.equipped_charms)):
-                x = 50 + i * (CHARM_BOX_WIDTH + CHARM_SPACING)
-                y = 150
-                rect = pygame.Rect(x, y, CHARM_BOX_WIDTH, CHARM_BOX_HEIGHT)
+                rect = self.game.shop_layout.equipped_charm_rect(i)
                 if rect.collidepoint(mouse_pos):
                     self.game.dragging_charm_index = i
                     self.game.dragging_shop = True
-                    self.game.drag_offset_x = mouse_pos[0] - x
-                    self.game.drag_offset_y = mouse_pos[1] - y
+                    self.game.drag_offset_x = mouse_pos[0] - rect.x
+                    self.game.drag_offset_y = mouse_pos[1] - rect.y
+                    self.invalidate(rect)  # Charm lifts out of its slot
                     break
 
             # New: Tray click to use rune
-            for i, tray_rect in enumerate(self.tray_rects):
+            for i, tray_rect in enumerate(self.game.shop_layout.tray_slots):
                 if tray_rect.collidepoint(mouse_pos) and self.game.rune_tray[i]:
                     from states.rune import RuneUseState  # Lazy import
                     rune = self.game.rune_tray[i]
@@ -222,15 +218,15 @@ class ShopState(State):
                 mouse_pos = pygame.mouse.get_pos()
                 target_index = -1
                 for i in range(len(self.game.equipped_charms)):
-                    x = 50 + i * (CHARM_BOX_WIDTH + CHARM_SPACING)
-                    y = 150
-                    rect = pygame.Rect(x, y, CHARM_BOX_WIDTH, CHARM_BOX_HEIGHT)
-                    if rect.collidepoint(mouse_pos):
+                    if self.game.shop_layout.equipped_charm_rect(i).collidepoint(mouse_pos):
                         target_index = i
                         break
+                self.invalidate(self.dragged_charm_rect(mouse_pos))
+                self.invalidate(self.game.shop_layout.equipped_charm_rect(self.game.dragging_charm_index))
                 if target_index != -1 and target_index != self.game.dragging_charm_index:
                     self.game.equipped_charms[self.game.dragging_charm_index], self.game.equipped_charms[target_index] = \
                         self.game.equipped_charms[target_index], self.game.equipped_charms[self.game.dragging_charm_index]
+                    self.invalidate(self.game.shop_layout.equipped_charm_rect(target_index))
                 self.game.dragging_charm_index = -1
                 self.game.dragging_shop = False
 
@@ -243,20 +239,19 @@ class ShopState(State):
             self.scroll_y -= event.y * scroll_speed
             max_scroll = max(0, total_content_height - DEBUG_PANEL_HEIGHT)
             self.scroll_y = max(0, min(self.scroll_y, max_scroll))
+            self.invalidate(self.debug_panel_rect)
 
         if event.type == pygame.MOUSEMOTION:
-            if self.game.dragging_charm_index != -1:
-                pass  # Dragging handled in draw_shop_screen
+            if self.game.dragging_charm_index != -1:  # Drawn in draw_shop_screen; repaint where it was and is
+                self.invalidate(self.dragged_charm_rect((event.pos[0] - event.rel[0], event.pos[1] - event.rel[1])))
+                self.invalidate(self.dragged_charm_rect(event.pos))
 
         if event.type == pygame.MOUSEBUTTONUP:
             if self.game.dragging_charm_index != -1:
                 mouse_pos = pygame.mouse.get_pos()
                 target_index = -1
                 for i in range(len(self.game.equipped_charms)):
-                    x = 50 + i * (CHARM_BOX_WIDTH + CHARM_SPACING)
-                    y = 150
-                    rect = pygame.Rect(x, y, CHARM_BOX_WIDTH, CHARM_BOX_HEIGHT)
-                    if rect.collidepoint(mouse_pos):
+                    if self.game.shop_layout.equipped_charm_rect(i).collidepoint(mouse_pos):
                         target_index = i
                         break
                 if target_index != -1 and target_index != self.game.dragging_charm_index:
@@ -265,6 +260,15 @@ class ShopState(State):
                 self.game.dragging_charm_index = -1
                 self.game.dragging_shop = False
 
+    @property
+    def debug_panel_rect(self):
+        return pygame.Rect(DEBUG_PANEL_X, DEBUG_PANEL_Y, DEBUG_PANEL_WIDTH, DEBUG_PANEL_HEIGHT)
+
+    def dragged_charm_rect(self, mouse_pos):
+        """Where draw_shop_screen puts the charm being dragged when the mouse is at mouse_pos."""
+        return pygame.Rect(mouse_pos[0] - self.game.drag_offset_x, mouse_pos[1] - self.game.drag_offset_y,
+                           CHARM_BOX_WIDTH, CHARM_BOX_HEIGHT)
+
     def draw_debug_panel(self):
         """Draws the debug panel with improved spacing and text readability."""
         panel_rect = pygame.Rect(DEBUG_PANEL_X, DEBUG_PANEL_Y, 
@@ -287,7 +291,6 @@ class ShopState(State):
         
         start_x = DEBUG_PANEL_X + 20
         start_y = DEBUG_PANEL_Y + 70 - self.scroll_y
-        mouse_pos = pygame.mouse.get_pos()
         visible_start_row = max(0, int(self.scroll_y / row_height))
         visible_rows_to_draw = (DEBUG_PANEL_HEIGHT - 70) // row_height + 2
         visible_end_row = min(num_rows, visible_start_row + visible_rows_to_draw)
@@ -313,10 +316,8 @@ class ShopState(State):
                 draw_rounded_element(self.game.screen, icon_rect, bg_color, radius=10, 
                                    border_color=THEME['border'], border_width=1)
                 
-                icon_path = self.game.charm_icon_paths.get(charm['name'])
-                if icon_path and os.path.exists(icon_path):
-                    icon = pygame.image.load(icon_path)
-                    icon = pygame.transform.smoothscale(icon, (icon_size, icon_size))
+                icon = self.game.charm_tiles.icon(self.game, charm['name'], icon_size)  # Loaded and scaled once
+                if icon:
                     self.game.screen.blit(icon, (x, y))
                 else:
                     pygame.draw.circle(self.game.screen, (0, 0, 0), (x + icon_size//2, y + icon_size//2), 10)
@@ -346,7 +347,7 @@ class ShopState(State):
                 pygame.draw.rect(self.game.screen, (0, 0, 0), badge_rect)
                 self.game.screen.blit(cost_text, (badge_rect.x + 2, badge_rect.y + 1))
                 
-                if icon_rect.collidepoint(mouse_pos):
+                if hovering(self.game, icon_rect):
                     tooltip_text = f"{charm['desc']}\nCost: {charm['cost']} | Type: {charm.get('type', 'Unknown')}"
                     space_above = y - DEBUG_PANEL_Y
                     assumed_tooltip_height = 100
@@ -358,9 +359,9 @@ class ShopState(State):
                 charm_rects.append((icon_rect, charm))
         
         equip_all_rect = pygame.Rect(DEBUG_PANEL_X + 20, DEBUG_PANEL_Y + DEBUG_PANEL_HEIGHT - 50, 150, 30)
-        draw_custom_button(self.game, equip_all_rect, "Equip All", is_hover=equip_all_rect.collidepoint(mouse_pos))
+        draw_custom_button(self.game, equip_all_rect, "Equip All", is_hover=hovering(self.game, equip_all_rect))
         close_rect = pygame.Rect(DEBUG_PANEL_X + DEBUG_PANEL_WIDTH - 100, DEBUG_PANEL_Y + 10, 80, 30)
-        draw_custom_button(self.game, close_rect, "Close", is_hover=close_rect.collidepoint(mouse_pos))
+        draw_custom_button(self.game, close_rect, "Close", is_hover=hovering(self.game, close_rect))
         
         # Draw scrollbar
         if total_content_height > DEBUG_PANEL_HEIGHT:
@@ -22,7 +22,9 @@ class SplashState(State):
         if not hasattr(self.game, 'splash_total_start') or self.game.splash_total_start == 0:
             self.game.splash_total_start = 0
         self.game.splash_phase = 'pan'
+        self.game.splash_view = None  # Worked out by update(); enter() runs before load_media has the splash image
     def update(self, dt):
+        """Advances the splash phases and works out the view (zoom, view_y) for draw_splash_screen."""
         current_time = time.time()
         if self.game.splash_start_time == 0:
             self.game.splash_start_time = current_time
@@ -34,6 +36,10 @@ class SplashState(State):
         current_zoom = SPLASH_INITIAL_ZOOM
         visible_height = self.game.height / current_zoom
         focus_y = 0
+        # Safeguard with total_elapsed
+        total_duration = SPLASH_DURATION_PAN + SPLASH_DURATION_HOLD + SPLASH_DURATION_ZOOM_OUT
+        if total_elapsed >= total_duration:
+            self.game.splash_phase = 'done'  # Ensure 'done'
         if self.game.splash_phase == 'pan':
             progress = min(time_elapsed / SPLASH_DURATION_PAN, 1.0)
             easing_progress = get_easing(progress, SPLASH_EASING)
@@ -65,13 +71,13 @@ class SplashState(State):
             current_zoom = fit_zoom
             visible_height = self.game.height / current_zoom
             focus_y = image_height / 2
-        # Add view_y calculation, etc. (your full block)
-        # ...
-        # Auto-transition if total time up (or button logic in handle_event)
-        total_duration = SPLASH_DURATION_PAN + SPLASH_DURATION_HOLD + SPLASH_DURATION_ZOOM_OUT
-        if total_elapsed >= total_duration:
-            self.game.splash_phase = 'done'  # Ensure 'done'
+        # Derive view_y and clamp
+        view_y = max(0, focus_y - visible_height / 2)
+        view_y = min(view_y, image_height - visible_height)
+        self.game.splash_view = (current_zoom, view_y)
     def draw(self):
+        if self.game.splash_view is None:
+            self.update(0)  # Drawn before the first update (state just entered)
         self.game.screen.fill(THEME['background']) # Clear relics
         rects = draw_splash_screen(self.game)
         if rects is not None:
@@ -0,0 +1,144 @@
+# sweep.py
+# Balance sweep: seeded headless runs over pouches x charm loadouts x starting stakes, spread over processes
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # Else every worker prints the pygame banner
+import numpy as np
+import data
+from hand_eval import HAND_TYPE_NAMES, HAND_TYPE_CODES
+from simulate import BOTS, play_run
+
+SCORE_BINS = np.array([0, 10, 25, 50, 100, 200, 400, 800, 1600, 3200, 6400, 12800, np.inf])  # Hand score histogram edges
+RUNS_PER_TASK = 50  # Runs per worker task: big enough to amortize the hop, small enough to balance the pool
+SEED_STRIDE = 1_000_000  # Config i seeds its runs from seed + i * SEED_STRIDE
+
+
+def empty_aggregate(max_stake):
+    """Zeroed counters for one config; worker batches and the final table share this layout."""
+    return {
+        'runs': 0,
+        'wins': 0,
+        'blinds_cleared': 0,
+        'stake_hist': np.zeros(max_stake + 1, dtype=np.int64),  # Index = stake the run ended on
+        'hand_counts': np.zeros(len(HAND_TYPE_NAMES), dtype=np.int64),
+        'score_sum': np.zeros(len(HAND_TYPE_NAMES), dtype=np.float64),
+        'score_hist': np.zeros((len(HAND_TYPE_NAMES), len(SCORE_BINS) - 1), dtype=np.int64),
+    }
+
+
+def merge_aggregate(total, part):
+    for key, value in part.items():
+        total[key] += value
+
+
+def run_batch(task):
+    """Worker: plays one batch of seeded runs for a config and returns only its aggregate counters."""
+    config_index, pouch_name, charm_names, stake, first_run, num_runs, bot_name, seed, max_stake = task
+    pouch = next((p for p in data.POUCHES if p['name'] == pouch_name), None)
+    pool = {c['name']: c for c in data.CHARMS_POOL}
+    charms = [pool[name] for name in charm_names]
+    bot = BOTS[bot_name]()
+    agg = empty_aggregate(max_stake)
+    types, scores = [], []
+    for run in range(first_run, first_run + num_runs):
+        result = play_run(bot, seed + config_index * SEED_STRIDE + run, pouch, charms, stake, max_stake)
+        agg['runs'] += 1
+        agg['wins'] += result['won']
+        agg['blinds_cleared'] += result['blinds_cleared']
+        agg['stake_hist'][min(result['stake'], max_stake)] += 1
+        for hand_type, score in result['hands']:
+            types.append(HAND_TYPE_CODES[hand_type])
+            scores.append(score)
+    if types:
+        types = np.array(types)
+        scores = np.array(scores, dtype=np.float64)
+        agg['hand_counts'] += np.bincount(types, minlength=len(HAND_TYPE_NAMES))
+        agg['score_sum'] += np.bincount(types, weights=scores, minlength=len(HAND_TYPE_NAMES))
+        bins = np.clip(np.searchsorted(SCORE_BINS, scores, side='right') - 1, 0, len(SCORE_BINS) - 2)
+        np.add.at(agg['score_hist'], (types, bins), 1)
+    return config_index, agg
+
+
+def sweep(configs, runs, bot='greedy', seed=0, max_stake=8, workers=None):
+    """Plays `runs` runs of every (pouch name or None, charm names, stake) config on a process pool.
+    Returns one aggregate per config, in order.
+    """
+    tasks = []
+    for i, (pouch_name, charm_names, stake) in enumerate(configs):
+        for first in range(0, runs, RUNS_PER_TASK):
+            tasks.append((i, pouch_name, tuple(charm_names), stake, first, min(RUNS_PER_TASK, runs - first), bot, seed,
+                          max_stake))
+    totals = [empty_aggregate(max_stake) for _ in configs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for config_index, agg in pool.map(run_batch, tasks):
+            merge_aggregate(totals[config_index], agg)
+    return totals
+
+
+def save_sweep(path, configs, totals, max_stake):
+    """Writes one row per config as NumPy columns (.npz): config columns, then the stacked aggregates."""
+    runs = np.array([t['runs'] for t in totals])
+    wins = np.array([t['wins'] for t in totals])
+    np.savez_compressed(
+        path,
+        pouch=np.array([pouch or '' for pouch, _, _ in configs]),
+        charms=np.array(['+'.join(charms) for _, charms, _ in configs]),
+        stake=np.array([stake for _, _, stake in configs]),
+        runs=runs,
+        wins=wins,
+        win_rate=wins / np.maximum(runs, 1),
+        mean_blinds_cleared=np.array([t['blinds_cleared'] for t in totals]) / np.maximum(runs, 1),
+        stake_hist=np.stack([t['stake_hist'] for t in totals]),
+        hand_types=np.array(HAND_TYPE_NAMES),
+        hand_counts=np.stack([t['hand_counts'] for t in totals]),
+        score_sum=np.stack([t['score_sum'] for t in totals]),
+        score_bins=SCORE_BINS,
+        score_hist=np.stack([t['score_hist'] for t in totals]),
+        max_stake=np.array(max_stake),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Balance sweep over pouches, charm loadouts and stakes.")
+    parser.add_argument('--pouches', nargs='*', default=['none'],
+                        help="Pouch names from data.POUCHES, 'none' for no pouch or 'all' (default: none)")
+    parser.add_argument('--charms', nargs='*', default=[''],
+                        help="Loadouts of charm names joined with '+', e.g. 'Zany Charm+Mad Charm' ('' = no charms)")
+    parser.add_argument('--stakes', nargs='*', type=int, default=[1])
+    parser.add_argument('--runs', type=int, default=200, help="Runs per config")
+    parser.add_argument('--bot', choices=sorted(BOTS), default='greedy')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-stake', type=int, default=8)
+    parser.add_argument('--workers', type=int, default=None, help="Processes (default: one per core)")
+    parser.add_argument('--out', default='sweep.npz')
+    args = parser.parse_args()
+
+    pouch_names = [p['name'] for p in data.POUCHES] if args.pouches == ['all'] else args.pouches
+    pouch_names = [None if name == 'none' else name for name in pouch_names]
+    known_pouches = {p['name'] for p in data.POUCHES}
+    for name in pouch_names:
+        if name is not None and name not in known_pouches:
+            parser.error(f"Unknown pouch: {name}")
+    known_charms = {c['name'] for c in data.CHARMS_POOL}
+    loadouts = [tuple(name for name in loadout.split('+') if name) for loadout in args.charms]
+    for loadout in loadouts:
+        for name in loadout:
+            if name not in known_charms:
+                parser.error(f"Unknown charm: {name}")
+    configs = [(pouch, loadout, stake) for pouch in pouch_names for loadout in loadouts for stake in args.stakes]
+
+    start = time.perf_counter()
+    totals = sweep(configs, args.runs, args.bot, args.seed, args.max_stake, args.workers)
+    elapsed = time.perf_counter() - start
+    save_sweep(args.out, configs, totals, args.max_stake)
+    total_runs = len(configs) * args.runs
+    print(f"{total_runs} runs over {len(configs)} configs in {elapsed:.1f}s ({total_runs / elapsed:.0f} runs/s) -> {args.out}")
+    for (pouch, loadout, stake), agg in zip(configs, totals):
+        print(f"  {pouch or 'No pouch'} | {'+'.join(loadout) or 'no charms'} | stake {stake}: "
+              f"win {agg['wins'] / max(agg['runs'], 1):.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# text_cache.py
+# Rendered text surfaces, kept so steady-state frames ("Hands: 4", button labels, charm names) do no glyph work
+from collections import OrderedDict
+
+MAX_SURFACES = 1024  # Plenty for every label on screen; changing text (scores, timers) ages out of the LRU
+
+
+class TextCache:
+    """LRU of font.render results keyed by (font, text, antialias, color, background).
+    Surfaces are shared: callers that change one (set_alpha, fill...) must copy it first.
+    """
+    def __init__(self, max_surfaces=MAX_SURFACES):
+        self.max_surfaces = max_surfaces
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        key = (font, text, bool(antialias), tuple(color), None if background is None else tuple(background))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)  # Least recently drawn
+        return surface
+
+    def font(self, font):
+        """Wraps a pygame Font so its render() goes through this cache (size, get_height... pass straight through)."""
+        return CachedFont(font, self)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        self.surfaces.clear()
+        self.hits = self.misses = 0
+
+
+class CachedFont:
+    """Drop-in for pygame.font.Font (game.font, small_font, tiny_font) whose render() is cached."""
+    __slots__ = ('font', 'cache')
+
+    def __init__(self, font, cache):
+        self.font = font
+        self.cache = cache
+
+    def render(self, text, antialias, color, background=None):
+        return self.cache.render(self.font, text, antialias, color, background)
+
+    def __getattr__(self, name):
+        return getattr(self.font, name)
@@ -1,7 +1,9 @@
+import functools
 import os
 import sys
 import pygame
 import constants
+from dice import Die
 
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and PyInstaller."""
@@ -29,20 +31,14 @@ def draw_rounded_element(surface, rect, fill_color, border_color=(0, 0, 0), bord
 
 # Other helpers: grayscale_surface, get_bag_color, etc.
 
-# Represent each die as a dictionary
+# Each die is a dice.Die (reads like the old per-die dict)
 def create_dice_bag():
     """Creates the bag of 25 dice, 5 per color, each with standard faces."""
     bag = []
     color_names = ['Red', 'Blue', 'Green', 'Purple', 'Yellow'] # Base colors only
     for color in color_names:
         for i in range(1, constants.DICE_PER_COLOR + 1):
-            die = {
-                'id': f"{color}{i}",
-                'color': color,
-                'faces': constants.DICE_FACES[:],  # Copy list for future modifications
-                'enhancements': []  # New: Empty list for each die
-            }
-            bag.append(die)
+            bag.append(Die(f"{color}{i}", color))  # Standard faces, no enhancements
     return bag
 
 def grayscale_surface(surface):
@@ -56,6 +52,12 @@ def grayscale_surface(surface):
     return surface
 
 def wrap_text(font, text, max_width):  # Or keep as word_wrap if preferred
+    """Splits text into lines that fit max_width. Memoized on (font, text, max_width): tooltips and
+    boxes re-wrap the same strings every frame, and each candidate line costs a font.size call."""
+    return list(_wrap_lines(font, text, max_width))
+
+@functools.lru_cache(maxsize=512)
+def _wrap_lines(font, text, max_width):
     paragraphs = text.split('\n')
     lines = []
     for para in paragraphs:
@@ -70,7 +72,7 @@ def wrap_text(font, text, max_width):  # Or keep as word_wrap if preferred
                 current_line = [word]
         if current_line:
             lines.append(' '.join(current_line))
-    return lines
+    return tuple(lines)
 
 def get_easing(t, mode='out_cubic'):
     """Easing function for animations (t: 0-1)."""